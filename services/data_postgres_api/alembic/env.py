@@ -13,6 +13,7 @@ from src.domain.models.base import Base
 from src.domain.models.user import User  # noqa
 from src.domain.models.category import Category  # noqa
 from src.domain.models.activity import Activity  # noqa
+from src.domain.models.activity_daily_rollup import ActivityDailyRollup  # noqa
 from src.domain.models.user_settings import UserSettings  # noqa
 from src.core.config import settings
 
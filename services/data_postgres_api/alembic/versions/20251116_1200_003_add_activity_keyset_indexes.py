@@ -0,0 +1,45 @@
+"""Add composite indexes for keyset pagination of activities
+
+Revision ID: 003
+Revises: 002
+Create Date: 2025-11-16 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add (user_id, start_time DESC, id DESC) style composite indexes.
+
+    Both "recent activities" queries filter by user (and optionally category)
+    and order by start_time, id descending. With these indexes every page,
+    including deep keyset pages, is a single index range scan of page size.
+    """
+    op.create_index(
+        'ix_activities_user_start_id',
+        'activities',
+        ['user_id', sa.text('start_time DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_activities_user_category_start',
+        'activities',
+        ['user_id', 'category_id', sa.text('start_time DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop composite keyset pagination indexes."""
+    op.drop_index('ix_activities_user_category_start', table_name='activities')
+    op.drop_index('ix_activities_user_start_id', table_name='activities')
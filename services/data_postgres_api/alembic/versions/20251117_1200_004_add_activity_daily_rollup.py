@@ -0,0 +1,86 @@
+"""Add activity_daily_rollup table
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-11-17 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copy of the rollup query at the time of this migration (see
+# ActivityDailyRollupRepository); later rebuilds use src.cli.rebuild_daily_rollup.
+BACKFILL_SQL = """
+    INSERT INTO activity_daily_rollup
+        (user_id, local_date, category_id, total_minutes, activity_count)
+    SELECT user_id, local_date, category_id, sum(minutes), sum(started)
+    FROM (
+        SELECT a.user_id,
+               seg.local_date,
+               a.category_id,
+               CASE WHEN seg.seg_end = a.end_time THEN a.duration_minutes
+                    ELSE round(extract(epoch FROM seg.seg_end - a.start_time) / 60)::int
+               END
+               - round(extract(epoch FROM seg.seg_start - a.start_time) / 60)::int AS minutes,
+               (seg.seg_start = a.start_time)::int AS started
+        FROM activities a
+        JOIN users u ON u.id = a.user_id
+        CROSS JOIN LATERAL (
+            SELECT d::date AS local_date,
+                   greatest(a.start_time, d AT TIME ZONE u.timezone) AS seg_start,
+                   least(a.end_time, (d + interval '1 day') AT TIME ZONE u.timezone) AS seg_end
+            FROM generate_series(
+                date_trunc('day', a.start_time AT TIME ZONE u.timezone),
+                (a.end_time AT TIME ZONE u.timezone) - interval '1 microsecond',
+                interval '1 day'
+            ) AS d
+        ) AS seg
+    ) AS s
+    GROUP BY user_id, local_date, category_id
+"""
+
+
+def upgrade() -> None:
+    """Create activity_daily_rollup and fill it from existing activities.
+
+    NULLS NOT DISTINCT (PostgreSQL 15+) makes uncategorized activities a
+    regular key value, so incremental upserts can use ON CONFLICT.
+    """
+    op.create_table(
+        'activity_daily_rollup',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('local_date', sa.Date(), nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=True),
+        sa.Column('total_minutes', sa.Integer(), nullable=False),
+        sa.Column('activity_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'uix_activity_daily_rollup_user_date_category',
+        'activity_daily_rollup',
+        ['user_id', 'local_date', 'category_id'],
+        unique=True,
+        postgresql_nulls_not_distinct=True,
+    )
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    """Drop activity_daily_rollup table."""
+    op.drop_index(
+        'uix_activity_daily_rollup_user_date_category',
+        table_name='activity_daily_rollup'
+    )
+    op.drop_table('activity_daily_rollup')
@@ -0,0 +1,41 @@
+"""Add GiST index on (user_id, tstzrange(start_time, end_time))
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-11-18 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index activity periods for "activities intersecting [from, to)" queries.
+
+    tstzrange(start_time, end_time) uses the default '[)' bounds, so an
+    activity ending exactly when the next one starts does not overlap it.
+    btree_gist lets user_id (a plain integer) share the GiST index with the
+    range, so both the user filter and && are index conditions.
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    op.create_index(
+        'ix_activities_user_period',
+        'activities',
+        ['user_id', sa.text('tstzrange(start_time, end_time)')],
+        unique=False,
+        postgresql_using='gist',
+    )
+
+
+def downgrade() -> None:
+    """Drop activity period index (the extension is left installed)."""
+    op.drop_index('ix_activities_user_period', table_name='activities')
@@ -0,0 +1,43 @@
+"""Add denormalized last_activity_end_time column to users table
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-11-19 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add users.last_activity_end_time and backfill it from activities."""
+    op.add_column(
+        'users',
+        sa.Column('last_activity_end_time', sa.TIMESTAMP(timezone=True), nullable=True)
+    )
+    op.execute(
+        """
+        UPDATE users
+        SET last_activity_end_time = latest.end_time
+        FROM (
+            SELECT user_id, max(end_time) AS end_time
+            FROM activities
+            GROUP BY user_id
+        ) AS latest
+        WHERE users.id = latest.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Remove last_activity_end_time column from users table."""
+    op.drop_column('users', 'last_activity_end_time')
@@ -0,0 +1,56 @@
+"""Add full-text search vector and GIN index to activities
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-11-20 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add activities.search_vector (stored generated column) and its index.
+
+    The vector combines Russian stems (weight A) with unstemmed 'simple'
+    tokens (weight B). Adding a stored generated column rewrites the table
+    once. btree_gin lets user_id share the GIN index with the vector, so
+    the user filter and @@ are both index conditions.
+    """
+    op.add_column(
+        'activities',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('russian', description), 'A') || "
+                "setweight(to_tsvector('simple', description), 'B')",
+                persisted=True,
+            ),
+            nullable=False,
+        )
+    )
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gin')
+    op.create_index(
+        'ix_activities_user_search',
+        'activities',
+        ['user_id', 'search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Drop search index and column (the extension is left installed)."""
+    op.drop_index('ix_activities_user_search', table_name='activities')
+    op.drop_column('activities', 'search_vector')
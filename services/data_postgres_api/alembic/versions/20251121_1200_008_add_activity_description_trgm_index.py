@@ -0,0 +1,40 @@
+"""Add trigram GIN index on (user_id, description) to activities
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-11-21 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index descriptions for case-insensitive prefix (autocomplete) lookups.
+
+    gin_trgm_ops serves description ILIKE 'prefix%' once the prefix has at
+    least 3 characters; user_id shares the index through btree_gin
+    (installed by migration 007).
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_activities_user_description_trgm',
+        'activities',
+        ['user_id', 'description'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'description': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Drop description trigram index (the extension is left installed)."""
+    op.drop_index('ix_activities_user_description_trgm', table_name='activities')
@@ -0,0 +1,57 @@
+"""Convert activities.tags to text[] and add GIN index on (user_id, tags)
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-11-22 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Split comma-separated tag strings into arrays in place.
+
+    Whitespace around tags and empty items are dropped; rows without tags
+    become NULL. Rewrites the table once (ALTER COLUMN ... TYPE).
+    """
+    op.execute(
+        r"""
+        ALTER TABLE activities
+        ALTER COLUMN tags TYPE text[]
+        USING NULLIF(
+            array_remove(
+                string_to_array(regexp_replace(btrim(tags), '\s*,\s*', ',', 'g'), ','),
+                ''
+            ),
+            '{}'
+        )
+        """
+    )
+    op.create_index(
+        'ix_activities_user_tags',
+        'activities',
+        ['user_id', 'tags'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Join tag arrays back into comma-separated strings."""
+    op.drop_index('ix_activities_user_tags', table_name='activities')
+    op.execute(
+        """
+        ALTER TABLE activities
+        ALTER COLUMN tags TYPE text
+        USING array_to_string(tags, ',')
+        """
+    )
@@ -0,0 +1 @@
+"""Micro-benchmarks for data_postgres_api (run against a live database)."""
@@ -0,0 +1,155 @@
+"""
+Benchmark: activity list serialization under concurrent load.
+
+Serves the same 100 ORM activities (with category loaded) from two routes
+of an in-process app and drives both with concurrent requests:
+
+- legacy: per-row model_validate() with the old dict-copying validator,
+  then FastAPI response_model re-validation, jsonable_encoder, json.dumps
+- fast: ModelListResponse (one validation pass + pydantic-core JSON)
+  under ORJSONResponse as default response class
+
+No database or network is involved, so the numbers isolate the
+serialization cost per request. Reports throughput and latency percentiles.
+
+Usage (inside the API container):
+    python -m benchmarks.bench_list_serialization [requests] [concurrency]
+"""
+import asyncio
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from pydantic import model_validator
+
+from src.api.responses import ModelListResponse, ORJSONResponse
+from src.domain.models.activity import Activity
+from src.domain.models.category import Category
+from src.schemas.activity import ActivityResponse
+
+DEFAULT_REQUESTS = 2000
+DEFAULT_CONCURRENCY = 50
+PAGE_SIZE = 100
+
+
+class LegacyActivityResponse(ActivityResponse):
+    """ActivityResponse as it was: copies every ORM attribute into a dict."""
+
+    @model_validator(mode="before")
+    @classmethod
+    def extract_category_data(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            return data
+        if hasattr(data, "__dict__") and "category" in data.__dict__:
+            category = data.__dict__["category"]
+            if category is not None:
+                return {
+                    "id": data.id,
+                    "user_id": data.user_id,
+                    "category_id": data.category_id,
+                    "description": data.description,
+                    "tags": data.tags,
+                    "start_time": data.start_time,
+                    "end_time": data.end_time,
+                    "duration_minutes": data.duration_minutes,
+                    "created_at": data.created_at,
+                    "category_name": category.name,
+                    "category_emoji": category.emoji,
+                }
+        return data
+
+
+def _build_rows() -> list[Activity]:
+    category = Category(id=1, user_id=1, name="Работа", emoji="💼")
+    start = datetime(2025, 11, 7, 9, 0, tzinfo=timezone.utc)
+    rows = []
+    for i in range(PAGE_SIZE):
+        activity = Activity(
+            id=i + 1,
+            user_id=1,
+            category_id=1,
+            description=f"Activity number {i} with a realistic description",
+            tags="work,focus",
+            start_time=start - timedelta(hours=i),
+            end_time=start - timedelta(hours=i) + timedelta(minutes=45),
+            duration_minutes=45,
+            created_at=start,
+        )
+        activity.category = category
+        rows.append(activity)
+    return rows
+
+
+def _build_app(rows: list[Activity]) -> FastAPI:
+    legacy = FastAPI(default_response_class=JSONResponse)
+    fast = FastAPI(default_response_class=ORJSONResponse)
+
+    @legacy.get("/activities", response_model=list[ActivityResponse])
+    async def legacy_list() -> list[ActivityResponse]:
+        return [LegacyActivityResponse.model_validate(act) for act in rows]
+
+    @fast.get("/activities", response_model=list[ActivityResponse])
+    async def fast_list() -> ModelListResponse:
+        return ModelListResponse(ActivityResponse, rows)
+
+    app = FastAPI()
+    app.mount("/legacy", legacy)
+    app.mount("/fast", fast)
+    return app
+
+
+async def _drive(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> dict:
+    latencies: list[float] = []
+    queue = iter(range(total))
+
+    async def worker() -> None:
+        for _ in queue:
+            started = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+async def main(total: int, concurrency: int) -> None:
+    app = _build_app(_build_rows())
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        legacy_body = (await client.get("/legacy/activities")).json()
+        fast_body = (await client.get("/fast/activities")).json()
+        assert legacy_body == fast_body, "Both paths must produce the same payload"
+
+        # Warm up both paths before measuring
+        await _drive(client, "/legacy/activities", concurrency, concurrency)
+        await _drive(client, "/fast/activities", concurrency, concurrency)
+
+        print(f"{PAGE_SIZE}-item activity list, {total} requests, concurrency {concurrency}")
+        print(f"{'path':<8} {'req/s':>10} {'p50 ms':>10} {'p95 ms':>10}")
+        results = {}
+        for name in ("legacy", "fast"):
+            results[name] = await _drive(client, f"/{name}/activities", total, concurrency)
+            r = results[name]
+            print(f"{name:<8} {r['rps']:>10.0f} {r['p50_ms']:>10.2f} {r['p95_ms']:>10.2f}")
+
+        print(f"speedup: {results['fast']['rps'] / results['legacy']['rps']:.2f}x throughput")
+
+
+if __name__ == "__main__":
+    requests_total = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REQUESTS
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_CONCURRENCY
+    asyncio.run(main(requests_total, concurrency))
@@ -0,0 +1,148 @@
+"""
+Benchmark: middleware stack overhead per request.
+
+Drives a trivial endpoint through three middleware stacks with concurrent
+requests and reports requests/sec and p99 latency:
+
+- legacy: CorrelationID + RequestLogging as BaseHTTPMiddleware (as before)
+- asgi: pure ASGI middlewares, mode "all" (same records as legacy)
+- asgi-slow: pure ASGI middlewares, mode "slow_or_failed"
+
+Log records are formatted with the service's JSON formatter and written to
+os.devnull, so formatting cost is included but terminal I/O is not.
+
+Usage (inside the API container):
+    python -m benchmarks.bench_middleware [requests] [concurrency]
+"""
+import asyncio
+import logging
+import os
+import sys
+import time
+import uuid
+from typing import Callable
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.api.middleware.correlation import CORRELATION_ID_HEADER, CorrelationIDMiddleware
+from src.api.middleware.logging import RequestLoggingMiddleware
+from src.core.logging import UnicodeJsonFormatter
+
+DEFAULT_REQUESTS = 5000
+DEFAULT_CONCURRENCY = 50
+
+legacy_logger = logging.getLogger("benchmarks.legacy_request_logging")
+
+
+class LegacyCorrelationIDMiddleware(BaseHTTPMiddleware):
+    """CorrelationIDMiddleware as it was (BaseHTTPMiddleware)."""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        correlation_id = request.headers.get(CORRELATION_ID_HEADER) or str(uuid.uuid4())
+        request.state.correlation_id = correlation_id
+        response = await call_next(request)
+        response.headers[CORRELATION_ID_HEADER] = correlation_id
+        return response
+
+
+class LegacyRequestLoggingMiddleware(BaseHTTPMiddleware):
+    """RequestLoggingMiddleware as it was (BaseHTTPMiddleware, two INFO records)."""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        start_time = time.time()
+        correlation_id = getattr(request.state, "correlation_id", "unknown")
+        legacy_logger.info(
+            "HTTP request started",
+            extra={
+                "method": request.method,
+                "path": request.url.path,
+                "correlation_id": correlation_id,
+                "client_host": request.client.host if request.client else "unknown",
+                "query_params": str(request.query_params) if request.query_params else None
+            }
+        )
+        response = await call_next(request)
+        legacy_logger.info(
+            "HTTP request completed",
+            extra={
+                "method": request.method,
+                "path": request.url.path,
+                "status_code": response.status_code,
+                "duration_ms": round((time.time() - start_time) * 1000, 2),
+                "correlation_id": correlation_id
+            }
+        )
+        return response
+
+
+def _build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict:
+        return {"status": "ok"}
+
+    if stack == "legacy":
+        app.add_middleware(LegacyRequestLoggingMiddleware)
+        app.add_middleware(LegacyCorrelationIDMiddleware)
+    else:
+        mode = "slow_or_failed" if stack == "asgi-slow" else "all"
+        app.add_middleware(RequestLoggingMiddleware, mode=mode)
+        app.add_middleware(CorrelationIDMiddleware)
+    return app
+
+
+def _configure_logging() -> None:
+    handler = logging.StreamHandler(open(os.devnull, "w"))
+    handler.setFormatter(UnicodeJsonFormatter("%(asctime)s %(name)s %(levelname)s %(message)s"))
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(logging.INFO)
+
+
+async def _drive(app: FastAPI, total: int, concurrency: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        latencies: list[float] = []
+        queue = iter(range(total))
+
+        async def worker() -> None:
+            for _ in queue:
+                started = time.perf_counter()
+                response = await client.get("/ping")
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+async def main(total: int, concurrency: int) -> None:
+    _configure_logging()
+    print(f"GET /ping, {total} requests, concurrency {concurrency}")
+    print(f"{'stack':<10} {'req/s':>10} {'p99 ms':>10}")
+
+    results = {}
+    for stack in ("legacy", "asgi", "asgi-slow"):
+        app = _build_app(stack)
+        await _drive(app, concurrency, concurrency)  # warm-up
+        results[stack] = r = await _drive(app, total, concurrency)
+        print(f"{stack:<10} {r['rps']:>10.0f} {r['p99_ms']:>10.2f}")
+
+    for stack in ("asgi", "asgi-slow"):
+        print(f"{stack} vs legacy: {results[stack]['rps'] / results['legacy']['rps']:.2f}x throughput")
+
+
+if __name__ == "__main__":
+    requests_total = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REQUESTS
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_CONCURRENCY
+    asyncio.run(main(requests_total, concurrency))
@@ -0,0 +1,114 @@
+"""
+Benchmark: write round trips per repository call.
+
+Compares the previous write path (INSERT + refresh SELECT, and
+SELECT + UPDATE + refresh SELECT) with the RETURNING-based path used by
+BaseRepository.create()/update(). Reports SQL statements per call and
+mean latency. Everything runs in one transaction that is rolled back.
+
+Usage (inside the API container, DATABASE_URL must point to PostgreSQL):
+    python -m benchmarks.bench_write_round_trips [iterations]
+"""
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import event, select
+
+from src.domain.models.user import User
+from src.infrastructure.database.connection import async_session, engine
+from src.infrastructure.repositories.user_repository import UserRepository
+from src.schemas.user import UserCreate, UserUpdate
+
+DEFAULT_ITERATIONS = 200
+# Far outside real Telegram ID range to avoid collisions with real data
+TELEGRAM_ID_BASE = 9_000_000_000_000
+
+
+class StatementCounter:
+    """Count statements sent to the database via cursor events."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+async def _legacy_create(session, telegram_id: int) -> User:
+    user = User(telegram_id=telegram_id, username="bench")
+    session.add(user)
+    await session.flush()
+    await session.refresh(user)
+    return user
+
+
+async def _legacy_update(session, user_id: int, poll_time: datetime) -> User:
+    user = (
+        await session.execute(select(User).where(User.id == user_id))
+    ).scalar_one_or_none()
+    user.last_poll_time = poll_time
+    await session.flush()
+    await session.refresh(user)
+    return user
+
+
+async def _measure(label: str, iterations: int, counter: StatementCounter, call):
+    counter.count = 0
+    started = time.perf_counter()
+    for i in range(iterations):
+        await call(i)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:<28} {counter.count / iterations:>6.2f} stmt/call"
+        f"  {elapsed / iterations * 1000:>8.3f} ms/call"
+    )
+
+
+async def run(iterations: int) -> None:
+    """Run all scenarios and print a summary table."""
+    counter = StatementCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+
+    try:
+        async with async_session() as session:
+            repository = UserRepository(session)
+            base_id = TELEGRAM_ID_BASE
+
+            legacy_users = []
+            returning_users = []
+
+            async def legacy_create(i):
+                legacy_users.append(await _legacy_create(session, base_id + i))
+
+            async def returning_create(i):
+                returning_users.append(
+                    await repository.create(UserCreate(telegram_id=base_id + iterations + i))
+                )
+
+            async def legacy_update(i):
+                await _legacy_update(
+                    session, legacy_users[i].id, datetime.now(timezone.utc)
+                )
+
+            async def returning_update(i):
+                await repository.update(
+                    returning_users[i].id,
+                    UserUpdate(last_poll_time=datetime.now(timezone.utc)),
+                )
+
+            print(f"iterations: {iterations}")
+            await _measure("create (add/flush/refresh)", iterations, counter, legacy_create)
+            await _measure("create (INSERT RETURNING)", iterations, counter, returning_create)
+            await _measure("update (select/flush/refresh)", iterations, counter, legacy_update)
+            await _measure("update (UPDATE RETURNING)", iterations, counter, returning_update)
+
+            await session.rollback()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", counter)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITERATIONS))
@@ -5,12 +5,13 @@ This module provides dependency injection for services and repositories,
 implementing the Dependency Inversion Principle for clean architecture.
 """
 
-from typing import Annotated
+from typing import Annotated, Awaitable, Callable
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.database.connection import get_db
+from src.infrastructure.database.admission import set_statement_timeout
+from src.infrastructure.database.connection import get_db, get_read_db
 from src.infrastructure.repositories.activity_repository import ActivityRepository
 from src.infrastructure.repositories.category_repository import CategoryRepository
 from src.infrastructure.repositories.user_repository import UserRepository
@@ -21,6 +22,31 @@ from src.application.services.user_service import UserService
 from src.application.services.user_settings_service import UserSettingsService
 
 
+# Statement Budget Dependencies
+
+
+def statement_timeout(milliseconds: int) -> Callable[..., Awaitable[None]]:
+    """
+    Build a route dependency that sets statement_timeout for the request.
+
+    Applies to the request's read-write session (FastAPI caches get_db per
+    request, so services get the same session) until it commits.
+
+    Usage:
+        @router.post("/bulk", dependencies=[Depends(statement_timeout(60000))])
+
+    Args:
+        milliseconds: Budget per statement; 0 disables the timeout
+
+    Returns:
+        Dependency callable
+    """
+    async def apply_statement_timeout(db: Annotated[AsyncSession, Depends(get_db)]) -> None:
+        await set_statement_timeout(db, milliseconds)
+
+    return apply_statement_timeout
+
+
 # Repository Dependencies
 
 
@@ -118,18 +144,22 @@ def get_category_service(
 
 
 def get_user_service(
-    repository: Annotated[UserRepository, Depends(get_user_repository)]
+    repository: Annotated[UserRepository, Depends(get_user_repository)],
+    settings_repository: Annotated[UserSettingsRepository, Depends(get_user_settings_repository)],
+    category_repository: Annotated[CategoryRepository, Depends(get_category_repository)]
 ) -> UserService:
     """
     Provide user service instance.
 
     Args:
         repository: User repository (injected by FastAPI)
+        settings_repository: User settings repository (injected by FastAPI)
+        category_repository: Category repository (injected by FastAPI)
 
     Returns:
-        UserService instance with repository dependency
+        UserService instance with repository dependencies
     """
-    return UserService(repository)
+    return UserService(repository, settings_repository, category_repository)
 
 
 def get_user_settings_service(
@@ -145,3 +175,70 @@ def get_user_settings_service(
         UserSettingsService instance with repository dependency
     """
     return UserSettingsService(repository)
+
+
+# Read-only Service Dependencies (GET routes)
+#
+# Bound to a read-only session: autocommit (no BEGIN/COMMIT round trips) and
+# the read replica when DATABASE_READ_URL is set. Use only for handlers that
+# do not write.
+
+
+def get_read_activity_service(
+    db: Annotated[AsyncSession, Depends(get_read_db)]
+) -> ActivityService:
+    """
+    Provide activity service for read-only requests.
+
+    Args:
+        db: Read-only database session (injected by FastAPI)
+
+    Returns:
+        ActivityService instance bound to read-only session
+    """
+    return ActivityService(ActivityRepository(db))
+
+
+def get_read_category_service(
+    db: Annotated[AsyncSession, Depends(get_read_db)]
+) -> CategoryService:
+    """
+    Provide category service for read-only requests.
+
+    Args:
+        db: Read-only database session (injected by FastAPI)
+
+    Returns:
+        CategoryService instance bound to read-only session
+    """
+    return CategoryService(CategoryRepository(db))
+
+
+def get_read_user_service(
+    db: Annotated[AsyncSession, Depends(get_read_db)]
+) -> UserService:
+    """
+    Provide user service for read-only requests.
+
+    Args:
+        db: Read-only database session (injected by FastAPI)
+
+    Returns:
+        UserService instance bound to read-only session
+    """
+    return UserService(UserRepository(db))
+
+
+def get_read_user_settings_service(
+    db: Annotated[AsyncSession, Depends(get_read_db)]
+) -> UserSettingsService:
+    """
+    Provide user settings service for read-only requests.
+
+    Args:
+        db: Read-only database session (injected by FastAPI)
+
+    Returns:
+        UserSettingsService instance bound to read-only session
+    """
+    return UserSettingsService(UserSettingsRepository(db))
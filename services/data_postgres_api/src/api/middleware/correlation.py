@@ -3,18 +3,24 @@ Correlation ID middleware for request tracing.
 
 This middleware adds correlation IDs to all requests for distributed tracing.
 Complies with .ai-framework/ standard using X-Request-ID header.
+
+Implemented as plain ASGI middleware (no BaseHTTPMiddleware): the response
+is not wrapped in an extra task and stream, only the response start message
+gets the header added.
 """
 
 import uuid
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 CORRELATION_ID_HEADER = "X-Request-ID"
 
+# ASGI servers lower-case header names
+_CORRELATION_ID_HEADER_KEY = CORRELATION_ID_HEADER.lower().encode("latin-1")
+
 
-class CorrelationIDMiddleware(BaseHTTPMiddleware):
+class CorrelationIDMiddleware:
     """
     Middleware to add correlation ID to all requests.
 
@@ -22,34 +28,45 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
     adds it to response headers for request tracing across services.
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable
-    ) -> Response:
+    def __init__(self, app: ASGIApp):
         """
-        Process request with correlation ID.
+        Initialize middleware.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
+            app: Next ASGI application in chain
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process request with correlation ID.
 
-        Returns:
-            HTTP response with correlation ID header
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Extract correlation ID from request or generate new one
         # Generate UUID if header is missing OR empty string
-        correlation_id = request.headers.get(CORRELATION_ID_HEADER)
+        correlation_id = None
+        for key, value in scope["headers"]:
+            if key == _CORRELATION_ID_HEADER_KEY:
+                correlation_id = value.decode("latin-1")
+                break
         if not correlation_id:
             correlation_id = str(uuid.uuid4())
 
-        # Add to request state for access in handlers
-        request.state.correlation_id = correlation_id
-
-        # Process request
-        response = await call_next(request)
+        # Add to request state for access in handlers (request.state.correlation_id)
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
 
-        # Add correlation ID to response headers
-        response.headers[CORRELATION_ID_HEADER] = correlation_id
+        async def send_with_correlation_id(message: Message) -> None:
+            # Add correlation ID to response headers
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[CORRELATION_ID_HEADER] = correlation_id
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_correlation_id)
@@ -10,6 +10,8 @@ from typing import Callable, Any
 
 from fastapi import HTTPException, status
 
+from src.infrastructure.database.admission import is_statement_timeout
+
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +54,9 @@ def handle_service_errors(func: Callable) -> Callable:
             # Re-raise HTTP exceptions (404, 409, etc.) without modification
             raise
         except Exception as e:
+            if is_statement_timeout(e):
+                # Answered with 503 + Retry-After by the application handler
+                raise
             # Unexpected errors - log for debugging
             logger.error(
                 f"Unexpected error in {func.__name__}: {str(e)}",
@@ -103,6 +108,9 @@ def handle_service_errors_with_conflict(func: Callable) -> Callable:
             # Re-raise HTTP exceptions without modification
             raise
         except Exception as e:
+            if is_statement_timeout(e):
+                # Answered with 503 + Retry-After by the application handler
+                raise
             # Unexpected errors - log for debugging
             logger.error(
                 f"Unexpected error in {func.__name__}: {str(e)}",
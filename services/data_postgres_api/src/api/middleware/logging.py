@@ -1,69 +1,114 @@
 """
 Request/response logging middleware.
 
-This middleware logs all HTTP requests and responses with timing information.
+This middleware logs HTTP requests and responses with timing information.
+
+Implemented as plain ASGI middleware (no BaseHTTPMiddleware). Volume is
+controlled by two knobs:
+
+- mode "all": start and completion records for sampled requests
+- mode "slow_or_failed": no start record; completion is logged only for
+  requests slower than the threshold or answered with a 5xx status
+
+Slow and failed requests are logged in both modes regardless of sampling.
 """
 
 import logging
+import random
 import time
-from typing import Callable
+from typing import Literal
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
+RequestLogMode = Literal["all", "slow_or_failed"]
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+
+class RequestLoggingMiddleware:
     """
-    Middleware to log all HTTP requests and responses.
+    Middleware to log HTTP requests and responses.
 
     Logs request method, path, status code, duration, and correlation ID.
     """
 
-    async def dispatch(
+    def __init__(
         self,
-        request: Request,
-        call_next: Callable
-    ) -> Response:
+        app: ASGIApp,
+        mode: RequestLogMode = "all",
+        sample_rate: float = 1.0,
+        slow_threshold_ms: float = 500.0
+    ):
         """
-        Process request with logging.
+        Initialize middleware.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
+            app: Next ASGI application in chain
+            mode: "all" or "slow_or_failed" (see module docstring)
+            sample_rate: Share of regular requests logged in "all" mode (0..1)
+            slow_threshold_ms: Duration from which a request counts as slow
+        """
+        self.app = app
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.slow_threshold_ms = slow_threshold_ms
 
-        Returns:
-            HTTP response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        start_time = time.time()
+        Process request with logging.
 
-        # Get correlation ID from request state (set by CorrelationIDMiddleware)
-        correlation_id = getattr(request.state, "correlation_id", "unknown")
-
-        # Log incoming request
-        logger.info(
-            "HTTP request started",
-            extra={
-                "method": request.method,
-                "path": request.url.path,
-                "correlation_id": correlation_id,
-                "client_host": request.client.host if request.client else "unknown",
-                "query_params": str(request.query_params) if request.query_params else None
-            }
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        sampled = self.mode == "all" and (
+            self.sample_rate >= 1.0 or random.random() < self.sample_rate
         )
 
+        # Get correlation ID from request state (set by CorrelationIDMiddleware)
+        correlation_id = scope.get("state", {}).get("correlation_id", "unknown")
+        method = scope["method"]
+        path = scope["path"]
+
+        if sampled:
+            client = scope.get("client")
+            query_string = scope.get("query_string", b"")
+            logger.info(
+                "HTTP request started",
+                extra={
+                    "method": method,
+                    "path": path,
+                    "correlation_id": correlation_id,
+                    "client_host": client[0] if client else "unknown",
+                    "query_params": query_string.decode("latin-1") if query_string else None
+                }
+            )
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         # Process request
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_status)
         except Exception as e:
-            # Log exceptions
-            duration_ms = (time.time() - start_time) * 1000
+            # Log exceptions (always, regardless of mode and sampling)
+            duration_ms = (time.perf_counter() - start_time) * 1000
             logger.error(
                 "HTTP request failed with exception",
                 extra={
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": method,
+                    "path": path,
                     "correlation_id": correlation_id,
                     "duration_ms": round(duration_ms, 2),
                     "error": str(e),
@@ -72,19 +117,20 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             )
             raise
 
-        # Calculate request duration
-        duration_ms = (time.time() - start_time) * 1000
-
-        # Log response
-        logger.info(
-            "HTTP request completed",
-            extra={
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "duration_ms": round(duration_ms, 2),
-                "correlation_id": correlation_id
-            }
-        )
+        # Duration covers the whole response, including streamed bodies
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        slow = duration_ms >= self.slow_threshold_ms
+        failed = status_code >= 500
 
-        return response
+        if sampled or slow or failed:
+            logger.log(
+                logging.WARNING if slow or failed else logging.INFO,
+                "HTTP request completed",
+                extra={
+                    "method": method,
+                    "path": path,
+                    "status_code": status_code,
+                    "duration_ms": round(duration_ms, 2),
+                    "correlation_id": correlation_id
+                }
+            )
@@ -0,0 +1,99 @@
+"""
+HTTP metrics middleware.
+
+Records per-route latency histograms, status-code counters and the number
+of in-flight requests in the default prometheus_client registry.
+Routes are labelled by their path template (``/api/v1/activities/{id}``),
+not the raw path, to keep label cardinality bounded.
+"""
+
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Route label for requests that matched no route (404s, scanners)
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being processed"
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route",
+    ["method", "route"]
+)
+HTTP_RESPONSES = Counter(
+    "http_responses_total",
+    "HTTP responses by route and status code",
+    ["method", "route", "status"]
+)
+
+
+class MetricsMiddleware:
+    """
+    Middleware to record HTTP request metrics.
+
+    Label children are bound once per (method, route, status) and cached,
+    so recording a request is a dict lookup plus two additions.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Next ASGI application in chain
+        """
+        self.app = app
+        self._in_flight = HTTP_REQUESTS_IN_FLIGHT
+        self._bound: dict[tuple[str, str, int], tuple] = {}
+
+    def _children(self, method: str, route: str, status: int) -> tuple:
+        key = (method, route, status)
+        children = self._bound.get(key)
+        if children is None:
+            children = self._bound[key] = (
+                HTTP_REQUEST_DURATION.labels(method, route),
+                HTTP_RESPONSES.labels(method, route, str(status)),
+            )
+        return children
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process request and record its metrics.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        self._in_flight.inc()
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - start_time
+            self._in_flight.dec()
+            # The router stores the matched APIRoute in the (shared) scope
+            route = scope.get("route")
+            duration_child, responses_child = self._children(
+                scope["method"],
+                route.path if route is not None else UNMATCHED_ROUTE,
+                status_code
+            )
+            duration_child.observe(duration)
+            responses_child.inc()
@@ -0,0 +1,58 @@
+"""
+Per-request SQL debug headers middleware.
+
+Adds the number of statements executed and the time spent in the database
+while handling the request to the response headers, so N+1 patterns are
+visible on every response during load tests:
+
+    X-Query-Count: 3
+    X-DB-Time: 4.12          (milliseconds)
+
+Statements run after the response has started (streamed bodies) are not
+included.
+"""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.database.query_stats import track_request_queries
+
+QUERY_COUNT_HEADER = "X-Query-Count"
+DB_TIME_HEADER = "X-DB-Time"
+
+
+class QueryStatsHeadersMiddleware:
+    """Middleware to expose per-request statement count and DB time."""
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Next ASGI application in chain
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process request and add query headers to the response.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = track_request_queries()
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(QUERY_COUNT_HEADER, str(queries.count))
+                headers.append(DB_TIME_HEADER, f"{queries.total_time * 1000:.2f}")
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
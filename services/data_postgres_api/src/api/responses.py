@@ -0,0 +1,47 @@
+"""
+Fast JSON response classes.
+
+FastAPI post-processes whatever an endpoint returns: models are dumped to
+dicts, validated again against ``response_model``, converted with
+``jsonable_encoder`` and finally rendered with ``json.dumps``. For list
+endpoints that is several passes per row.
+
+- ORJSONResponse renders with orjson (app-wide default response class).
+- ModelListResponse validates ORM objects or row mappings exactly once and
+  serializes them in the same pass with pydantic-core. FastAPI skips its
+  own response_model processing for returned Response instances, so
+  ``response_model`` on the route only documents the schema.
+"""
+from functools import lru_cache
+from typing import Any, Iterable, Mapping
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+__all__ = ["ModelListResponse", "ORJSONResponse"]
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """Build (once per schema) the validator/serializer for list[model]."""
+    return TypeAdapter(list[model])
+
+
+class ModelListResponse(Response):
+    """JSON array of ``model`` built from ORM objects or row mappings."""
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        model: type[BaseModel],
+        rows: Iterable[Any],
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        adapter = _list_adapter(model)
+        content = adapter.dump_json(adapter.validate_python(list(rows), from_attributes=True))
+        super().__init__(content, status_code, headers, background=background)
@@ -4,20 +4,44 @@ Activities API router.
 Handles HTTP requests for activity operations using application service layer.
 """
 
+from datetime import date, datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 
-from src.api.dependencies import get_activity_service
+from src.api.dependencies import (
+    get_activity_service,
+    get_read_activity_service,
+    statement_timeout,
+)
 from src.api.middleware import handle_service_errors
-from src.application.services.activity_service import ActivityService
+from src.api.responses import ModelListResponse
+from src.application.services.activity_service import ActivityOverlapError, ActivityService
+from src.application.utils.cursor import (
+    decode_activity_cursor,
+    decode_search_cursor,
+    encode_activity_cursor,
+    encode_search_cursor,
+)
+from src.core.config import settings
 from src.schemas.activity import (
+    ActivityBulkCreate,
+    ActivityBulkCreateResponse,
     ActivityCreate,
+    ActivityDescriptionSuggestion,
+    ActivityGapsResponse,
     ActivityResponse,
+    ActivitySearchResult,
+    ActivityStatsResponse,
+    ActivityTagStats,
+    StatsPeriod,
 )
 
 router = APIRouter(prefix="/activities", tags=["activities"])
 
+# Response header carrying the cursor for the next (older) page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 @router.post(
     "/",
@@ -29,7 +53,10 @@ router = APIRouter(prefix="/activities", tags=["activities"])
 @handle_service_errors
 async def create_activity(
     activity_data: ActivityCreate,
-    service: Annotated[ActivityService, Depends(get_activity_service)]
+    service: Annotated[ActivityService, Depends(get_activity_service)],
+    strict: Annotated[
+        bool, Query(description="Reject with 409 if the activity overlaps an existing one")
+    ] = False
 ) -> ActivityResponse:
     """
     Create new activity.
@@ -37,47 +64,423 @@ async def create_activity(
     Args:
         activity_data: Activity creation data from request body
         service: Activity service instance (injected)
+        strict: Reject overlapping activities instead of creating them
 
     Returns:
         Created activity with generated ID
 
     Raises:
-        HTTPException: 400 if business validation fails
+        HTTPException: 400 if business validation fails, 409 if strict and
+            the activity overlaps existing ones
     """
-    activity = await service.create_activity(activity_data)
+    try:
+        activity = await service.create_activity(activity_data, strict=strict)
+    except ActivityOverlapError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"message": str(e), "overlapping_ids": e.activity_ids}
+        )
     return ActivityResponse.model_validate(activity)
 
 
+@router.post(
+    "/bulk",
+    response_model=ActivityBulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Bulk create activities",
+    description=(
+        "Create many activities in one multi-row INSERT. Invalid items are "
+        "reported in `errors` by position and do not abort the batch."
+    ),
+    dependencies=[Depends(statement_timeout(settings.db_bulk_statement_timeout_ms))]
+)
+@handle_service_errors
+async def bulk_create_activities(
+    bulk_data: ActivityBulkCreate,
+    service: Annotated[ActivityService, Depends(get_activity_service)]
+) -> ActivityBulkCreateResponse:
+    """
+    Create multiple activities at once.
+
+    Args:
+        bulk_data: List of activity payloads from request body
+        service: Activity service instance (injected)
+
+    Returns:
+        Created activities (in request order) and per-item errors
+    """
+    created, errors = await service.bulk_create_activities(bulk_data.items)
+    return ActivityBulkCreateResponse(
+        created=[ActivityResponse.model_validate(act) for act in created],
+        errors=errors
+    )
+
+
 @router.get(
     "/",
     response_model=list[ActivityResponse],
     summary="List activities",
-    description="Get recent activities for user, optionally filtered by category"
+    description=(
+        "Get recent activities for user, optionally filtered by category. "
+        "With `from` and/or `to`, only activities intersecting that window "
+        "(served by a GiST range index). "
+        f"Full pages carry an opaque `{NEXT_CURSOR_HEADER}` header; pass it back "
+        "as `before` to fetch the next (older) page."
+    )
 )
 @handle_service_errors
 async def get_activities(
     user_id: Annotated[int, Query(description="User ID")],
     category_id: Annotated[int | None, Query(description="Category ID to filter by")] = None,
     limit: Annotated[int, Query(ge=1, le=100, description="Maximum items to return")] = 10,
-    service: Annotated[ActivityService, Depends(get_activity_service)] = None
-) -> list[ActivityResponse]:
+    before: Annotated[str | None, Query(description="Cursor of the previous page")] = None,
+    date_from: Annotated[
+        datetime | None, Query(alias="from", description="Only activities ending after")
+    ] = None,
+    date_to: Annotated[
+        datetime | None, Query(alias="to", description="Only activities starting before")
+    ] = None,
+    service: Annotated[ActivityService, Depends(get_read_activity_service)] = None
+) -> ModelListResponse:
     """
-    Get recent activities for user, optionally filtered by category.
+    Get recent activities for user, optionally filtered by category and time window.
 
     Args:
         user_id: User identifier from query string
         category_id: Optional category ID to filter activities by
         limit: Maximum activities to return (default: 10)
+        before: Opaque cursor from a previous page's X-Next-Cursor header
+        date_from: Optional inclusive window start
+        date_to: Optional exclusive window end
         service: Activity service instance (injected)
 
     Returns:
-        List of recent activities
+        List of recent activities (validated and serialized in one pass)
 
     Raises:
-        HTTPException: 400 if limit is invalid
+        HTTPException: 400 if limit, cursor or time window is invalid
     """
-    if category_id is not None:
-        activities = await service.get_user_activities_by_category(user_id, category_id, limit)
+    position = decode_activity_cursor(before) if before else None
+
+    if date_from is not None or date_to is not None:
+        activities = await service.get_user_activities_in_range(
+            user_id, date_from, date_to, category_id=category_id, limit=limit, before=position
+        )
+    elif category_id is not None:
+        activities = await service.get_user_activities_by_category(
+            user_id, category_id, limit, before=position
+        )
     else:
-        activities = await service.get_user_activities(user_id, limit)
-    return [ActivityResponse.model_validate(act) for act in activities]
+        activities = await service.get_user_activities(user_id, limit, before=position)
+
+    # A full page means there may be older rows - hand out the keyset position
+    headers = {}
+    if len(activities) == limit:
+        last = activities[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_activity_cursor(last.start_time, last.id)
+
+    return ModelListResponse(ActivityResponse, activities, headers=headers)
+
+
+@router.get(
+    "/search",
+    response_model=list[ActivitySearchResult],
+    summary="Search activities",
+    description=(
+        "Full-text search over the user's activity descriptions (Russian "
+        "stemming plus exact words), most relevant first, newest first on "
+        "equal relevance. Supports web-search syntax: \"quoted phrase\", "
+        f"`or`, `-excluded`. Full pages carry `{NEXT_CURSOR_HEADER}`; pass it "
+        "back as `before` for the next page."
+    )
+)
+@handle_service_errors
+async def search_activities(
+    user_id: Annotated[int, Query(description="User ID")],
+    q: Annotated[str, Query(min_length=1, max_length=200, description="Search text")],
+    limit: Annotated[int, Query(ge=1, le=100, description="Maximum items to return")] = 10,
+    before: Annotated[str | None, Query(description="Cursor of the previous page")] = None,
+    service: Annotated[ActivityService, Depends(get_read_activity_service)] = None
+) -> ModelListResponse:
+    """
+    Search activities of user by description.
+
+    Args:
+        user_id: User identifier from query string
+        q: Search text
+        limit: Maximum activities to return (default: 10)
+        before: Opaque cursor from a previous page's X-Next-Cursor header
+        service: Activity service instance (injected)
+
+    Returns:
+        Matching activities with their relevance
+
+    Raises:
+        HTTPException: 400 if query, limit or cursor is invalid
+    """
+    position = decode_search_cursor(before) if before else None
+    activities = await service.search_activities(user_id, q, limit, before=position)
+
+    headers = {}
+    if len(activities) == limit:
+        last = activities[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_search_cursor(
+            last.search_rank, last.start_time, last.id
+        )
+
+    return ModelListResponse(ActivitySearchResult, activities, headers=headers)
+
+
+@router.get(
+    "/recent-descriptions",
+    response_model=list[ActivityDescriptionSuggestion],
+    summary="Recent distinct descriptions",
+    description=(
+        "Distinct activity descriptions of the user, most recently used first, "
+        "with use counts - for suggestion keyboards and prompts. Optionally "
+        "restricted to a category and to a case-insensitive prefix."
+    )
+)
+@handle_service_errors
+async def get_recent_descriptions(
+    user_id: Annotated[int, Query(description="User ID")],
+    category_id: Annotated[int | None, Query(description="Category ID to filter by")] = None,
+    prefix: Annotated[
+        str | None, Query(max_length=100, description="Description prefix (case-insensitive)")
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=50, description="Maximum items to return")] = 10,
+    service: Annotated[ActivityService, Depends(get_read_activity_service)] = None
+) -> ModelListResponse:
+    """
+    Get distinct recently used descriptions for user.
+
+    Args:
+        user_id: User identifier from query string
+        category_id: Optional category ID to filter by
+        prefix: Optional description prefix
+        limit: Maximum descriptions to return (default: 10)
+        service: Activity service instance (injected)
+
+    Returns:
+        Descriptions with use counts, most recently used first
+
+    Raises:
+        HTTPException: 400 if limit is invalid
+    """
+    rows = await service.get_recent_descriptions(
+        user_id, category_id=category_id, prefix=prefix, limit=limit
+    )
+    return ModelListResponse(ActivityDescriptionSuggestion, rows)
+
+
+@router.get(
+    "/tags",
+    response_model=list[ActivityTagStats],
+    summary="Top tags",
+    description=(
+        "The user's tags ranked by total tracked minutes, with activity "
+        "counts. An activity with several tags counts towards each of them."
+    )
+)
+@handle_service_errors
+async def get_top_tags(
+    user_id: Annotated[int, Query(description="User ID")],
+    date_from: Annotated[
+        datetime | None, Query(alias="from", description="Only activities starting at or after")
+    ] = None,
+    date_to: Annotated[
+        datetime | None, Query(alias="to", description="Only activities starting before")
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=100, description="Maximum items to return")] = 20,
+    service: Annotated[ActivityService, Depends(get_read_activity_service)] = None
+) -> ModelListResponse:
+    """
+    Get user's tags ranked by total minutes.
+
+    Args:
+        user_id: User identifier from query string
+        date_from: Optional inclusive lower bound on start_time
+        date_to: Optional exclusive upper bound on start_time
+        limit: Maximum tags to return (default: 20)
+        service: Activity service instance (injected)
+
+    Returns:
+        Tags with total minutes and activity counts
+
+    Raises:
+        HTTPException: 400 if limit or time range is invalid
+    """
+    items = await service.get_top_tags(user_id, start=date_from, end=date_to, limit=limit)
+    return ModelListResponse(ActivityTagStats, items)
+
+
+@router.get(
+    "/tags/{tag}",
+    response_model=list[ActivityResponse],
+    summary="Activities with tag",
+    description=(
+        "Activities of the user carrying the given tag, most recent first. "
+        f"Full pages carry `{NEXT_CURSOR_HEADER}`; pass it back as `before` "
+        "for the next page."
+    )
+)
+@handle_service_errors
+async def get_activities_by_tag(
+    tag: str,
+    user_id: Annotated[int, Query(description="User ID")],
+    limit: Annotated[int, Query(ge=1, le=100, description="Maximum items to return")] = 10,
+    before: Annotated[str | None, Query(description="Cursor of the previous page")] = None,
+    service: Annotated[ActivityService, Depends(get_read_activity_service)] = None
+) -> ModelListResponse:
+    """
+    Get recent activities of user with a tag.
+
+    Args:
+        tag: Tag from URL path
+        user_id: User identifier from query string
+        limit: Maximum activities to return (default: 10)
+        before: Opaque cursor from a previous page's X-Next-Cursor header
+        service: Activity service instance (injected)
+
+    Returns:
+        Activities with the tag, most recent first
+
+    Raises:
+        HTTPException: 400 if tag, limit or cursor is invalid
+    """
+    position = decode_activity_cursor(before) if before else None
+    activities = await service.get_activities_by_tag(user_id, tag, limit, before=position)
+
+    headers = {}
+    if len(activities) == limit:
+        last = activities[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_activity_cursor(last.start_time, last.id)
+
+    return ModelListResponse(ActivityResponse, activities, headers=headers)
+
+
+@router.get(
+    "/stats",
+    response_model=ActivityStatsResponse,
+    summary="Activity statistics",
+    description=(
+        "Duration totals and counts grouped by category and by day, week or "
+        "month in the user's timezone. Aggregated in a single SQL query."
+    )
+)
+@handle_service_errors
+async def get_activity_stats(
+    user_id: Annotated[int, Query(description="User ID")],
+    period: Annotated[StatsPeriod, Query(description="Bucket size")] = "day",
+    date_from: Annotated[
+        datetime | None, Query(alias="from", description="Only activities starting at or after")
+    ] = None,
+    date_to: Annotated[
+        datetime | None, Query(alias="to", description="Only activities starting before")
+    ] = None,
+    service: Annotated[ActivityService, Depends(get_read_activity_service)] = None
+) -> ActivityStatsResponse:
+    """
+    Get aggregated activity statistics for user.
+
+    Args:
+        user_id: User identifier from query string
+        period: Bucket size - day, week or month (default: day)
+        date_from: Optional inclusive lower bound on start_time
+        date_to: Optional exclusive upper bound on start_time
+        service: Activity service instance (injected)
+
+    Returns:
+        Per-bucket, per-category duration totals and counts
+
+    Raises:
+        HTTPException: 400 if time range is invalid
+    """
+    items = await service.get_activity_stats(user_id, period, start=date_from, end=date_to)
+    return ActivityStatsResponse(user_id=user_id, period=period, items=items)
+
+
+@router.get(
+    "/stats/daily",
+    response_model=ActivityStatsResponse,
+    summary="Daily activity totals",
+    description=(
+        "Per-day, per-category totals in the user's timezone read from the "
+        "daily rollup table. Activities crossing midnight are split by day."
+    )
+)
+@handle_service_errors
+async def get_daily_activity_stats(
+    user_id: Annotated[int, Query(description="User ID")],
+    date_from: Annotated[
+        date | None, Query(alias="from", description="First local date (inclusive)")
+    ] = None,
+    date_to: Annotated[
+        date | None, Query(alias="to", description="Last local date (exclusive)")
+    ] = None,
+    service: Annotated[ActivityService, Depends(get_read_activity_service)] = None
+) -> ActivityStatsResponse:
+    """
+    Get daily activity totals for user from the rollup table.
+
+    Args:
+        user_id: User identifier from query string
+        date_from: Optional inclusive first local date
+        date_to: Optional exclusive last local date
+        service: Activity service instance (injected)
+
+    Returns:
+        Per-day, per-category duration totals and counts
+
+    Raises:
+        HTTPException: 400 if date range is invalid
+    """
+    items = await service.get_daily_rollup_stats(user_id, start_date=date_from, end_date=date_to)
+    return ActivityStatsResponse(user_id=user_id, period="day", items=items)
+
+
+@router.get(
+    "/gaps",
+    response_model=ActivityGapsResponse,
+    summary="Untracked gaps",
+    description=(
+        "Intervals of the [from, to) window not covered by any activity, "
+        "computed in one SQL query with window functions. Overlapping "
+        "activities are merged; window edges count as gap boundaries."
+    )
+)
+@handle_service_errors
+async def get_activity_gaps(
+    user_id: Annotated[int, Query(description="User ID")],
+    date_from: Annotated[datetime, Query(alias="from", description="Window start (inclusive)")],
+    date_to: Annotated[datetime, Query(alias="to", description="Window end (exclusive)")],
+    min_minutes: Annotated[
+        int, Query(ge=0, le=1440, description="Only gaps at least this long")
+    ] = 0,
+    service: Annotated[ActivityService, Depends(get_read_activity_service)] = None
+) -> ActivityGapsResponse:
+    """
+    Get untracked intervals for user within a time window.
+
+    Args:
+        user_id: User identifier from query string
+        date_from: Inclusive window start
+        date_to: Exclusive window end
+        min_minutes: Minimum gap length in minutes (default: 0)
+        service: Activity service instance (injected)
+
+    Returns:
+        Gaps in chronological order and their total length
+
+    Raises:
+        HTTPException: 400 if time window is invalid
+    """
+    items = await service.get_activity_gaps(
+        user_id, date_from, date_to, min_minutes=min_minutes
+    )
+    return ActivityGapsResponse(
+        user_id=user_id,
+        min_minutes=min_minutes,
+        total_minutes=sum(gap.duration_minutes for gap in items),
+        items=items
+    )
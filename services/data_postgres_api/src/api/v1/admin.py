@@ -0,0 +1,44 @@
+"""
+Admin API router.
+
+Exposes in-process diagnostics of the service.
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Query, status
+
+from src.infrastructure.database.query_stats import QUERY_STATS, QueryStatsOrder
+from src.schemas.admin import QueryStatsEntry, QueryStatsResponse
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/query-stats", response_model=QueryStatsResponse)
+async def get_query_stats(
+    order_by: Annotated[QueryStatsOrder, Query(description="Sort key (descending)")] = "total_time",
+    limit: Annotated[int, Query(ge=1, le=500, description="Maximum statements to return")] = 50
+) -> QueryStatsResponse:
+    """Get per-statement SQL statistics since start or last reset."""
+    return QueryStatsResponse(
+        tracked=len(QUERY_STATS),
+        max_entries=QUERY_STATS.max_entries,
+        evicted=QUERY_STATS.evicted,
+        statements=[
+            QueryStatsEntry(
+                query=entry.query,
+                calls=entry.calls,
+                total_time_ms=round(entry.total_time * 1000, 3),
+                mean_time_ms=round(entry.mean_time * 1000, 3),
+                max_time_ms=round(entry.max_time * 1000, 3),
+                rows=entry.rows,
+            )
+            for entry in QUERY_STATS.snapshot(order_by, limit)
+        ],
+    )
+
+
+@router.delete("/query-stats", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_query_stats() -> None:
+    """Reset SQL statistics (e.g. before a load test)."""
+    QUERY_STATS.reset()
@@ -8,9 +8,15 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 
-from src.api.dependencies import get_category_service
+from src.api.dependencies import (
+    get_category_service,
+    get_read_category_service,
+    statement_timeout,
+)
 from src.api.middleware import handle_service_errors_with_conflict
+from src.api.responses import ModelListResponse
 from src.application.services.category_service import CategoryService
+from src.core.config import settings
 from src.schemas.category import (
     CategoryCreate,
     CategoryResponse,
@@ -32,7 +38,12 @@ async def create_category(
     return CategoryResponse.model_validate(category)
 
 
-@router.post("/bulk-create", response_model=list[CategoryResponse], status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/bulk-create",
+    response_model=list[CategoryResponse],
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(statement_timeout(settings.db_bulk_statement_timeout_ms))]
+)
 async def bulk_create_categories(
     bulk_data: CategoryBulkCreate,
     service: Annotated[CategoryService, Depends(get_category_service)]
@@ -58,11 +69,11 @@ async def bulk_create_categories(
 @router.get("/", response_model=list[CategoryResponse])
 async def get_categories(
     user_id: Annotated[int, Query(description="User ID")],
-    service: Annotated[CategoryService, Depends(get_category_service)]
-) -> list[CategoryResponse]:
+    service: Annotated[CategoryService, Depends(get_read_category_service)]
+) -> ModelListResponse:
     """Get all categories for user."""
     categories = await service.get_user_categories(user_id)
-    return [CategoryResponse.model_validate(cat) for cat in categories]
+    return ModelListResponse(CategoryResponse, categories)
 
 
 @router.patch("/{category_id}", response_model=CategoryResponse)
@@ -6,7 +6,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 
-from src.api.dependencies import get_user_settings_service
+from src.api.dependencies import get_user_settings_service, get_read_user_settings_service
 from src.api.middleware import handle_service_errors
 from src.application.services.user_settings_service import UserSettingsService
 from src.schemas.user_settings import (
@@ -32,7 +32,7 @@ async def create_settings(
 @router.get("/", response_model=UserSettingsResponse)
 async def get_settings(
     user_id: Annotated[int, Query(description="User ID")],
-    service: Annotated[UserSettingsService, Depends(get_user_settings_service)]
+    service: Annotated[UserSettingsService, Depends(get_read_user_settings_service)]
 ) -> UserSettingsResponse:
     """Get settings for user."""
     settings = await service.get_by_user_id(user_id)
@@ -2,15 +2,43 @@
 Users API router with service layer.
 """
 
-from typing import Annotated, List
+from typing import Annotated, AsyncIterator, List
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query, Body
+from fastapi.responses import StreamingResponse
 
-from src.api.dependencies import get_user_service
-from src.api.middleware import handle_service_errors_with_conflict
+from src.api.dependencies import get_user_service, get_read_user_service
+from src.api.middleware import handle_service_errors, handle_service_errors_with_conflict
+from src.api.responses import ModelListResponse
+from src.application.services.activity_service import ActivityService
 from src.application.services.user_service import UserService
-from src.schemas.user import UserCreate, UserResponse
+from src.application.utils.activity_export import (
+    EXPORT_ENCODERS,
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+)
+from src.application.utils.activity_import import (
+    IMPORT_PARSERS,
+    ImportFormat,
+    import_activities,
+)
+from src.core.config import settings
+from src.infrastructure.database.admission import set_statement_timeout
+from src.infrastructure.database.connection import read_admission, read_stream_session
+from src.infrastructure.repositories.activity_repository import ActivityRepository
+from src.infrastructure.repositories.user_repository import UserRepository
+from src.schemas.activity import ActivityImportResponse
+from src.schemas.category import CategoryResponse
+from src.schemas.user import (
+    ActiveUserResponse,
+    UserContextResponse,
+    UserCreate,
+    UserLastActivityResponse,
+    UserOnboardResponse,
+    UserResponse,
+)
+from src.schemas.user_settings import UserSettingsResponse
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -30,10 +58,26 @@ async def create_user(
     return UserResponse.model_validate(user)
 
 
+@router.post("/onboard", response_model=UserOnboardResponse)
+async def onboard_user(
+    user_data: UserCreate,
+    service: Annotated[UserService, Depends(get_user_service)]
+) -> UserOnboardResponse:
+    """Get or create user with default settings and categories, return context."""
+    user, last_activity_end_time, created = await service.onboard_user(user_data)
+    return UserOnboardResponse(
+        user=UserResponse.model_validate(user),
+        settings=UserSettingsResponse.model_validate(user.settings) if user.settings else None,
+        categories=[CategoryResponse.model_validate(cat) for cat in user.categories],
+        last_activity_end_time=last_activity_end_time,
+        created=created
+    )
+
+
 @router.get("/by-telegram/{telegram_id}", response_model=UserResponse)
 async def get_user_by_telegram_id(
     telegram_id: int,
-    service: Annotated[UserService, Depends(get_user_service)]
+    service: Annotated[UserService, Depends(get_read_user_service)]
 ) -> UserResponse:
     """Get user by Telegram ID."""
     user = await service.get_by_telegram_id(telegram_id)
@@ -42,6 +86,136 @@ async def get_user_by_telegram_id(
     return UserResponse.model_validate(user)
 
 
+@router.get("/by-telegram/{telegram_id}/context", response_model=UserContextResponse)
+async def get_user_context_by_telegram_id(
+    telegram_id: int,
+    service: Annotated[UserService, Depends(get_read_user_service)]
+) -> UserContextResponse:
+    """Get user, settings, categories and last activity end time in one call."""
+    context = await service.get_context_by_telegram_id(telegram_id)
+    if not context:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+    user, last_activity_end_time = context
+    return UserContextResponse(
+        user=UserResponse.model_validate(user),
+        settings=UserSettingsResponse.model_validate(user.settings) if user.settings else None,
+        categories=[CategoryResponse.model_validate(cat) for cat in user.categories],
+        last_activity_end_time=last_activity_end_time
+    )
+
+
+@router.get("/{user_id}/last-activity", response_model=UserLastActivityResponse)
+async def get_last_activity(
+    user_id: int,
+    service: Annotated[UserService, Depends(get_read_user_service)]
+) -> UserLastActivityResponse:
+    """Get end time of the user's latest activity (primary key lookup on users)."""
+    user = await service.get_by_id(user_id)
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return UserLastActivityResponse(
+        user_id=user.id,
+        last_activity_end_time=user.last_activity_end_time
+    )
+
+
+async def _started(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Run a stream body up to its first chunk before the response starts.
+
+    Admission and the first statements then happen in the route handler, so
+    DatabaseOverloadedError and statement timeouts are answered by the
+    application's 503 handlers instead of cutting off a 200 body. The slot
+    taken by the body is released when the body finishes or is closed.
+
+    Args:
+        chunks: Stream body (not yet started)
+
+    Returns:
+        The same chunks, first one included
+    """
+    try:
+        first = await anext(chunks)
+    except StopAsyncIteration:
+        first = None
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            if first is not None:
+                yield first
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    return body()
+
+
+async def _activities_export(user_id: int, export_format: ExportFormat) -> AsyncIterator[bytes]:
+    """Yield all activities of a user encoded as ``export_format``."""
+    # Own session (see _active_users_ndjson), admitted for the whole stream;
+    # it is a transaction, so the bulk statement budget applies to the
+    # cursor until the export ends. Started by the route (see _started)
+    async with read_admission.admit():
+        async with read_stream_session() as session:
+            await set_statement_timeout(session, settings.db_bulk_statement_timeout_ms)
+            service = ActivityService(ActivityRepository(session))
+            batches = service.stream_activities_for_export(user_id)
+            async for chunk in EXPORT_ENCODERS[export_format](batches):
+                yield chunk
+
+
+@router.get(
+    "/{user_id}/activities/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}}
+)
+async def export_activities(
+    user_id: int,
+    service: Annotated[UserService, Depends(get_read_user_service)],
+    export_format: Annotated[
+        ExportFormat, Query(alias="format", description="csv, ndjson or parquet")
+    ] = "csv"
+) -> StreamingResponse:
+    """Stream all activities of user, oldest first, as a CSV, NDJSON or Parquet file."""
+    user = await service.get_by_id(user_id)
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return StreamingResponse(
+        await _started(_activities_export(user_id, export_format)),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="activities-{user_id}.{export_format}"'
+        }
+    )
+
+
+@router.post(
+    "/{user_id}/activities/import",
+    response_model=ActivityImportResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        "requestBody": {"content": {"text/csv": {}, "application/x-ndjson": {}}, "required": True}
+    }
+)
+@handle_service_errors
+async def import_user_activities(
+    user_id: int,
+    request: Request,
+    import_format: Annotated[
+        ImportFormat, Query(alias="format", description="csv or ndjson")
+    ] = "csv"
+) -> ActivityImportResponse:
+    """Import activities from a CSV/NDJSON body, streamed and committed in batches."""
+    # No request-scoped session: every batch takes its own (see import_activities)
+    records = IMPORT_PARSERS[import_format](request.stream())
+    try:
+        return await import_activities(user_id, records)
+    except LookupError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+
 @router.patch("/{user_id}/last-poll-time", response_model=UserResponse)
 async def update_last_poll_time(
     user_id: int,
@@ -61,8 +235,31 @@ async def update_last_poll_time(
 
 @router.get("/active", response_model=List[UserResponse])
 async def get_active_users(
-    service: Annotated[UserService, Depends(get_user_service)]
-) -> List[UserResponse]:
+    service: Annotated[UserService, Depends(get_read_user_service)]
+) -> ModelListResponse:
     """Get all active users for poll restoration."""
     users = await service.get_all_active_users()
-    return [UserResponse.model_validate(user) for user in users]
+    return ModelListResponse(UserResponse, users)
+
+
+async def _active_users_ndjson() -> AsyncIterator[bytes]:
+    """Yield active users with settings as NDJSON lines."""
+    # Own session: request-scoped dependencies are closed before the body streams.
+    # Admitted for the whole stream, with the bulk statement budget for the
+    # cursor. Started by the route (see _started)
+    async with read_admission.admit():
+        async with read_stream_session() as session:
+            await set_statement_timeout(session, settings.db_bulk_statement_timeout_ms)
+            service = UserService(UserRepository(session))
+            async for user in service.stream_active_users_with_settings():
+                yield ActiveUserResponse.model_validate(user).model_dump_json().encode() + b"\n"
+
+
+@router.get(
+    "/active/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}}
+)
+async def stream_active_users() -> StreamingResponse:
+    """Stream all active users with their settings as NDJSON (one user per line)."""
+    return StreamingResponse(await _started(_active_users_ndjson()), media_type="application/x-ndjson")
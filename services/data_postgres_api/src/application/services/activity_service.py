@@ -5,18 +5,44 @@ This module contains business logic for activity operations,
 orchestrating between API layer and data layer.
 """
 
-from datetime import timedelta
-from typing import Optional
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Optional
 import logging
 
-from src.application.validators.time_validators import validate_end_time
+from pydantic import ValidationError
+
+from src.application.validators.time_validators import validate_end_time, validate_time_window
 from src.domain.models.activity import Activity
 from src.infrastructure.repositories.activity_repository import ActivityRepository
-from src.schemas.activity import ActivityCreate
+from src.infrastructure.repositories.category_repository import CategoryRepository
+from src.schemas.activity import (
+    ActivityBulkItemError,
+    ActivityCreate,
+    ActivityGap,
+    ActivityStatsItem,
+    ActivityTagStats,
+    StatsPeriod,
+    normalize_tag,
+)
+from src.schemas.category import CategoryCreate
 
 logger = logging.getLogger(__name__)
 
 
+class ActivityOverlapError(ValueError):
+    """Raised by strict creates when the new activity overlaps existing ones."""
+
+    def __init__(self, activity_ids: list[int]):
+        """
+        Initialize error.
+
+        Args:
+            activity_ids: IDs of the overlapping activities
+        """
+        super().__init__(f"Activity overlaps existing activities: {activity_ids}")
+        self.activity_ids = activity_ids
+
+
 class ActivityService:
     """
     Application service for activity business logic.
@@ -25,16 +51,27 @@ class ActivityService:
     Does NOT contain infrastructure concerns (HTTP, DB).
     """
 
-    def __init__(self, repository: ActivityRepository):
+    def __init__(
+        self,
+        repository: ActivityRepository,
+        category_repository: CategoryRepository | None = None
+    ):
         """
         Initialize service with repository.
 
         Args:
             repository: Activity repository instance for data access
+            category_repository: Category repository, needed by import_batch()
+                to resolve category names
         """
         self.repository = repository
+        self.category_repository = category_repository
 
-    async def create_activity(self, activity_data: ActivityCreate) -> Activity:
+    async def create_activity(
+        self,
+        activity_data: ActivityCreate,
+        strict: bool = False
+    ) -> Activity:
         """
         Create new activity with business validation.
 
@@ -42,17 +79,193 @@ class ActivityService:
 
         Args:
             activity_data: Activity creation data from API request
+            strict: Reject the activity if it overlaps an existing one
 
         Returns:
             Created activity with generated ID and calculated duration
 
         Raises:
+            ActivityOverlapError: If strict and the activity overlaps others
             ValueError: If business rules violated (e.g., invalid time range)
         """
         # Business validation
         validate_end_time(activity_data.end_time, activity_data.start_time)
+        self._cap_duration(activity_data)
+
+        if strict:
+            overlapping = await self.repository.find_overlapping_ids(
+                activity_data.user_id, activity_data.start_time, activity_data.end_time
+            )
+            if overlapping:
+                logger.info(
+                    "Strict activity create rejected: overlap",
+                    extra={
+                        "user_id": activity_data.user_id,
+                        "overlapping_ids": overlapping
+                    }
+                )
+                raise ActivityOverlapError(overlapping)
+
+        # Delegate to repository for persistence
+        activity = await self.repository.create(activity_data)
+        return activity
+
+    async def bulk_create_activities(
+        self,
+        items: list[dict[str, Any]]
+    ) -> tuple[list[Activity], list[ActivityBulkItemError]]:
+        """
+        Create many activities at once, reporting per-item errors.
+
+        Every item goes through the same validation and 24 hour cap as
+        create_activity(). Valid items are written in one multi-row INSERT;
+        invalid items are reported by position and do not abort the batch.
+
+        Args:
+            items: Raw activity payloads from API request
+
+        Returns:
+            Tuple of (created activities in request order, per-item errors)
+        """
+        valid: list[ActivityCreate] = []
+        positions: list[int] = []
+        errors: list[ActivityBulkItemError] = []
+
+        for index, item in enumerate(items):
+            try:
+                activity_data = ActivityCreate.model_validate(item)
+                validate_end_time(activity_data.end_time, activity_data.start_time)
+            except ValidationError as e:
+                errors.append(ActivityBulkItemError(index=index, error=self._format_validation_error(e)))
+                continue
+            except ValueError as e:
+                errors.append(ActivityBulkItemError(index=index, error=str(e)))
+                continue
+
+            self._cap_duration(activity_data)
+            valid.append(activity_data)
+            positions.append(index)
+
+        created_by_pos, db_errors = await self.repository.bulk_create(valid)
+
+        errors.extend(
+            ActivityBulkItemError(index=positions[pos], error=message)
+            for pos, message in db_errors.items()
+        )
+        errors.sort(key=lambda err: err.index)
+
+        logger.info(
+            "Bulk activity creation completed",
+            extra={
+                "requested_count": len(items),
+                "created_count": len(created_by_pos),
+                "failed_count": len(errors)
+            }
+        )
+
+        return [created_by_pos[pos] for pos in sorted(created_by_pos)], errors
+
+    async def import_batch(
+        self,
+        user_id: int,
+        records: list[dict[str, Any] | None],
+        first_index: int = 0,
+        category_ids: dict[str, int] | None = None
+    ) -> tuple[int, list[ActivityBulkItemError]]:
+        """
+        Validate and load one batch of imported activity records.
+
+        Records get the same validation and 24 hour cap as create_activity().
+        Category names of the valid records are resolved with one upsert
+        (missing categories are created) and the records are loaded with COPY.
+
+        Args:
+            user_id: Owner of the imported activities
+            records: Parsed records with description, start_time, end_time and
+                optional tags and category_name (None: unparseable record)
+            first_index: Position of the first record in the whole import
+            category_ids: Names resolved by earlier batches; updated in place
+
+        Returns:
+            Tuple of (number of activities created, per-record errors)
+        """
+        if category_ids is None:
+            category_ids = {}
+
+        valid: list[tuple[ActivityCreate, str | None]] = []
+        errors: list[ActivityBulkItemError] = []
+
+        for index, record in enumerate(records, start=first_index):
+            if not isinstance(record, dict):
+                errors.append(ActivityBulkItemError(index=index, error="Record is not an object"))
+                continue
+            try:
+                activity_data = ActivityCreate.model_validate(self._import_payload(user_id, record))
+                validate_end_time(activity_data.end_time, activity_data.start_time)
+                category_name = (record.get("category_name") or "").strip() or None
+                if category_name is not None and category_name not in category_ids:
+                    # Same name rules as categories created through the API
+                    CategoryCreate(user_id=user_id, name=category_name)
+            except ValidationError as e:
+                errors.append(ActivityBulkItemError(index=index, error=self._format_validation_error(e)))
+                continue
+            except ValueError as e:
+                errors.append(ActivityBulkItemError(index=index, error=str(e)))
+                continue
+
+            self._cap_duration(activity_data)
+            valid.append((activity_data, category_name))
+
+        missing = [name for _, name in valid if name is not None and name not in category_ids]
+        if missing:
+            category_ids.update(
+                await self.category_repository.upsert_names(user_id, missing)
+            )
+        for activity_data, category_name in valid:
+            if category_name is not None:
+                activity_data.category_id = category_ids[category_name]
+
+        created_ids = await self.repository.copy_create([data for data, _ in valid])
+        return len(created_ids), errors
+
+    @staticmethod
+    def _import_payload(user_id: int, record: dict[str, Any]) -> dict[str, Any]:
+        """
+        Map an import record onto ActivityCreate fields.
+
+        The user comes from the import itself and categories from
+        category_name, so IDs in the record (e.g. from an export) are ignored.
+        CSV tags arrive comma-joined and are split here.
+
+        Args:
+            user_id: Owner of the imported activities
+            record: Parsed CSV row or NDJSON object
 
-        # Cap duration at 24 hours maximum (similar to sleep handling in bot)
+        Returns:
+            ActivityCreate payload
+        """
+        tags = record.get("tags") or None
+        if isinstance(tags, str):
+            tags = tags.split(",")
+
+        return {
+            "user_id": user_id,
+            "description": record.get("description"),
+            "tags": tags,
+            "start_time": record.get("start_time"),
+            "end_time": record.get("end_time"),
+        }
+
+    def _cap_duration(self, activity_data: ActivityCreate) -> None:
+        """
+        Cap activity duration at 24 hours maximum (in place).
+
+        Similar to sleep handling in bot: overly long activities are
+        truncated instead of rejected.
+
+        Args:
+            activity_data: Activity creation data to adjust
+        """
         max_duration = timedelta(hours=24)
         duration = activity_data.end_time - activity_data.start_time
 
@@ -72,9 +285,21 @@ class ActivityService:
                 }
             )
 
-        # Delegate to repository for persistence
-        activity = await self.repository.create(activity_data)
-        return activity
+    @staticmethod
+    def _format_validation_error(error: ValidationError) -> str:
+        """
+        Format pydantic validation error as short single-line message.
+
+        Args:
+            error: Validation error raised for a bulk item
+
+        Returns:
+            Message like "description: String should have at least 3 characters"
+        """
+        return "; ".join(
+            f"{'.'.join(str(loc) for loc in err['loc']) or 'item'}: {err['msg']}"
+            for err in error.errors()
+        )
 
     async def get_activity_by_id(self, activity_id: int) -> Optional[Activity]:
         """
@@ -91,7 +316,8 @@ class ActivityService:
     async def get_user_activities(
         self,
         user_id: int,
-        limit: int = 10
+        limit: int = 10,
+        before: tuple[datetime, int] | None = None
     ) -> list[Activity]:
         """
         Get recent activities for user.
@@ -99,6 +325,7 @@ class ActivityService:
         Args:
             user_id: User identifier
             limit: Maximum activities to return (default: 10)
+            before: Optional (start_time, id) keyset position for next page
 
         Returns:
             List of recent activities
@@ -110,13 +337,14 @@ class ActivityService:
         if limit < 1 or limit > 100:
             raise ValueError(f"Limit must be between 1 and 100, got {limit}")
 
-        return await self.repository.get_recent_by_user(user_id, limit)
+        return await self.repository.get_recent_by_user(user_id, limit, before=before)
 
     async def get_user_activities_by_category(
         self,
         user_id: int,
         category_id: int,
-        limit: int = 10
+        limit: int = 10,
+        before: tuple[datetime, int] | None = None
     ) -> list[Activity]:
         """
         Get recent activities for user filtered by category.
@@ -125,6 +353,7 @@ class ActivityService:
             user_id: User identifier
             category_id: Category identifier to filter by
             limit: Maximum activities to return (default: 10)
+            before: Optional (start_time, id) keyset position for next page
 
         Returns:
             List of recent activities for the specified category
@@ -136,4 +365,285 @@ class ActivityService:
         if limit < 1 or limit > 100:
             raise ValueError(f"Limit must be between 1 and 100, got {limit}")
 
-        return await self.repository.get_recent_by_user_and_category(user_id, category_id, limit)
+        return await self.repository.get_recent_by_user_and_category(
+            user_id, category_id, limit, before=before
+        )
+
+    async def stream_activities_for_export(
+        self,
+        user_id: int,
+        batch_size: int = 1000
+    ) -> AsyncIterator[list]:
+        """
+        Stream all of user's activities for export, oldest first.
+
+        Args:
+            user_id: User identifier
+            batch_size: Rows per batch read from the server-side cursor
+
+        Yields:
+            Batches of activity rows (see ActivityRepository.stream_for_export)
+        """
+        async for rows in self.repository.stream_for_export(user_id, batch_size=batch_size):
+            yield rows
+
+    async def get_user_activities_in_range(
+        self,
+        user_id: int,
+        start: datetime | None,
+        end: datetime | None,
+        category_id: int | None = None,
+        limit: int = 10,
+        before: tuple[datetime, int] | None = None
+    ) -> list[Activity]:
+        """
+        Get activities intersecting the [start, end) window.
+
+        Activities that started before the window but end inside it (or
+        span it) are included.
+
+        Args:
+            user_id: User identifier
+            start: Inclusive window start (None: unbounded)
+            end: Exclusive window end (None: unbounded)
+            category_id: Optional category to filter by
+            limit: Maximum activities to return (default: 10)
+            before: Optional (start_time, id) keyset position for next page
+
+        Returns:
+            List of activities, most recent first
+
+        Raises:
+            ValueError: If limit or window is invalid
+        """
+        if limit < 1 or limit > 100:
+            raise ValueError(f"Limit must be between 1 and 100, got {limit}")
+        start, end = validate_time_window(start, end)
+
+        return await self.repository.get_overlapping(
+            user_id, start, end, category_id=category_id, limit=limit, before=before
+        )
+
+    async def search_activities(
+        self,
+        user_id: int,
+        query: str,
+        limit: int = 10,
+        before: tuple[float, datetime, int] | None = None
+    ) -> list[Activity]:
+        """
+        Search user's activity descriptions, most relevant first.
+
+        Args:
+            user_id: User identifier
+            query: Search text
+            limit: Maximum activities to return (default: 10)
+            before: Optional (rank, start_time, id) keyset position for next page
+
+        Returns:
+            Matching activities with search_rank set
+
+        Raises:
+            ValueError: If limit is invalid or query is blank
+        """
+        if limit < 1 or limit > 100:
+            raise ValueError(f"Limit must be between 1 and 100, got {limit}")
+        if not query.strip():
+            raise ValueError("Search query must not be blank")
+
+        return await self.repository.search(user_id, query.strip(), limit, before=before)
+
+    async def get_recent_descriptions(
+        self,
+        user_id: int,
+        category_id: int | None = None,
+        prefix: str | None = None,
+        limit: int = 10
+    ) -> list[dict]:
+        """
+        Get distinct recently used descriptions with their use counts.
+
+        Args:
+            user_id: User identifier
+            category_id: Optional category to restrict to
+            prefix: Optional case-insensitive description prefix
+            limit: Maximum descriptions to return (default: 10)
+
+        Returns:
+            Descriptions, most recently used first
+
+        Raises:
+            ValueError: If limit is invalid
+        """
+        if limit < 1 or limit > 50:
+            raise ValueError(f"Limit must be between 1 and 50, got {limit}")
+
+        prefix = prefix.strip() if prefix else None
+        return await self.repository.get_recent_descriptions(
+            user_id, category_id=category_id, prefix=prefix or None, limit=limit
+        )
+
+    async def get_activities_by_tag(
+        self,
+        user_id: int,
+        tag: str,
+        limit: int = 10,
+        before: tuple[datetime, int] | None = None
+    ) -> list[Activity]:
+        """
+        Get recent activities carrying a tag.
+
+        The tag is normalized the same way as on create, so "#Work " finds
+        activities saved with "Work".
+
+        Args:
+            user_id: User identifier
+            tag: Tag to filter by
+            limit: Maximum activities to return (default: 10)
+            before: Optional (start_time, id) keyset position for next page
+
+        Returns:
+            List of activities with the tag, most recent first
+
+        Raises:
+            ValueError: If limit is invalid or tag is blank
+        """
+        if limit < 1 or limit > 100:
+            raise ValueError(f"Limit must be between 1 and 100, got {limit}")
+        tag = normalize_tag(tag)
+        if not tag:
+            raise ValueError("Tag must not be blank")
+
+        return await self.repository.get_by_tag(user_id, tag, limit, before=before)
+
+    async def get_top_tags(
+        self,
+        user_id: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 20
+    ) -> list[ActivityTagStats]:
+        """
+        Get user's tags ranked by total tracked minutes.
+
+        Args:
+            user_id: User identifier
+            start: Optional inclusive lower bound on activity start_time
+            end: Optional exclusive upper bound on activity start_time
+            limit: Maximum tags to return (default: 20)
+
+        Returns:
+            Tag aggregates, largest total first
+
+        Raises:
+            ValueError: If limit is invalid or time range is empty
+        """
+        if limit < 1 or limit > 100:
+            raise ValueError(f"Limit must be between 1 and 100, got {limit}")
+        start, end = validate_time_window(start, end)
+
+        rows = await self.repository.get_top_tags(user_id, start=start, end=end, limit=limit)
+        return [ActivityTagStats.model_validate(row) for row in rows]
+
+    async def get_activity_gaps(
+        self,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+        min_minutes: int = 0
+    ) -> list[ActivityGap]:
+        """
+        Get intervals of [start, end) not covered by any activity.
+
+        Overlapping activities are merged, and the window edges count as
+        gap boundaries, so an empty window is one gap.
+
+        Args:
+            user_id: User identifier
+            start: Inclusive window start
+            end: Exclusive window end
+            min_minutes: Only gaps at least this long (default: 0, all gaps)
+
+        Returns:
+            Gaps in chronological order
+
+        Raises:
+            ValueError: If window is empty or min_minutes is negative
+        """
+        start, end = validate_time_window(start, end)
+        if min_minutes < 0:
+            raise ValueError(f"min_minutes must be non-negative, got {min_minutes}")
+
+        rows = await self.repository.get_gaps(user_id, start, end, min_minutes=min_minutes)
+        return [
+            ActivityGap(
+                start_time=row["gap_start"],
+                end_time=row["gap_end"],
+                duration_minutes=round((row["gap_end"] - row["gap_start"]).total_seconds() / 60)
+            )
+            for row in rows
+        ]
+
+    async def get_activity_stats(
+        self,
+        user_id: int,
+        period: StatsPeriod = "day",
+        start: datetime | None = None,
+        end: datetime | None = None
+    ) -> list[ActivityStatsItem]:
+        """
+        Get duration totals and counts per category and time bucket.
+
+        Buckets are days, weeks or months in the user's own timezone;
+        aggregation happens in the database.
+
+        Args:
+            user_id: User identifier
+            period: Bucket size ("day", "week" or "month")
+            start: Optional inclusive lower bound on activity start_time
+            end: Optional exclusive upper bound on activity start_time
+
+        Returns:
+            Aggregates ordered by bucket and category
+
+        Raises:
+            ValueError: If period is unknown or time range is empty
+        """
+        # Business validation: period is rendered into SQL, keep it closed
+        if period not in ("day", "week", "month"):
+            raise ValueError(f"Period must be one of day, week, month, got {period}")
+        start, end = validate_time_window(start, end)
+
+        rows = await self.repository.get_stats(user_id, period, start=start, end=end)
+        return [ActivityStatsItem.model_validate(row) for row in rows]
+
+    async def get_daily_rollup_stats(
+        self,
+        user_id: int,
+        start_date: date | None = None,
+        end_date: date | None = None
+    ) -> list[ActivityStatsItem]:
+        """
+        Get per-day, per-category totals from the daily rollup table.
+
+        Unlike get_activity_stats(), activities crossing local midnight are
+        split between days, and cost does not grow with history size.
+
+        Args:
+            user_id: User identifier
+            start_date: Optional inclusive first local date
+            end_date: Optional exclusive last local date
+
+        Returns:
+            Daily aggregates ordered by date and category
+
+        Raises:
+            ValueError: If date range is empty
+        """
+        if start_date is not None and end_date is not None and start_date >= end_date:
+            raise ValueError("'from' must be earlier than 'to'")
+
+        rows = await self.repository.rollup.get_daily_totals(
+            user_id, start_date=start_date, end_date=end_date
+        )
+        return [ActivityStatsItem.model_validate(row) for row in rows]
@@ -55,25 +55,21 @@ class CategoryService:
         )
 
         try:
-            # Business rule: check for duplicate category name per user
-            existing = await self.repository.get_by_user_and_name(
-                category_data.user_id,
-                category_data.name
-            )
-            if existing:
+            # Business rule: category name is unique per user (enforced by
+            # uix_user_category_name, so concurrent creates cannot race)
+            category = await self.repository.create_if_absent(category_data)
+            if category is None:
                 logger.warning(
                     "duplicate_category",
                     extra={
                         "user_id": category_data.user_id,
-                        "category_name": category_data.name,
-                        "category_id": existing.id
+                        "category_name": category_data.name
                     }
                 )
                 raise ValueError(
                     f"Category with name '{category_data.name}' already exists for user {category_data.user_id}"
                 )
 
-            category = await self.repository.create(category_data)
             logger.info(
                 "category_created",
                 extra={
@@ -114,32 +110,8 @@ class CategoryService:
             extra={"user_id": user_id, "category_count": len(categories_data)}
         )
 
-        created_categories = []
-
-        for category_data in categories_data:
-            # Check if category already exists
-            existing = await self.repository.get_by_user_and_name(
-                user_id, category_data.name
-            )
-            if existing:
-                logger.debug(
-                    "skipping duplicate category",
-                    extra={"user_id": user_id, "category_name": category_data.name}
-                )
-                # Skip duplicate
-                continue
-
-            # Create new category
-            created = await self.repository.create(category_data)
-            logger.debug(
-                "category created in bulk",
-                extra={
-                    "category_id": created.id,
-                    "user_id": user_id,
-                    "category_name": created.name
-                }
-            )
-            created_categories.append(created)
+        # One INSERT ... ON CONFLICT DO NOTHING for the whole list
+        created_categories = await self.repository.bulk_create_if_absent(categories_data)
 
         logger.info(
             "bulk_create_categories completed",
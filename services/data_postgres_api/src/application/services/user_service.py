@@ -5,15 +5,29 @@ This module contains business logic for user operations.
 """
 
 import logging
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 from datetime import datetime
 
 from src.domain.models.user import User
+from src.infrastructure.repositories.category_repository import CategoryRepository
 from src.infrastructure.repositories.user_repository import UserRepository
+from src.infrastructure.repositories.user_settings_repository import UserSettingsRepository
+from src.schemas.category import CategoryCreate
 from src.schemas.user import UserCreate
+from src.schemas.user_settings import UserSettingsCreate
 
 logger = logging.getLogger(__name__)
 
+# Categories every new user starts with
+DEFAULT_CATEGORIES = [
+    {"name": "Работа", "emoji": "💼"},
+    {"name": "Спорт", "emoji": "🏃"},
+    {"name": "Отдых", "emoji": "🎮"},
+    {"name": "Обучение", "emoji": "📚"},
+    {"name": "Сон", "emoji": "😴"},
+    {"name": "Еда", "emoji": "🍽️"},
+]
+
 
 class UserService:
     """
@@ -23,14 +37,23 @@ class UserService:
     business rule enforcement (e.g., unique Telegram ID).
     """
 
-    def __init__(self, repository: UserRepository):
+    def __init__(
+        self,
+        repository: UserRepository,
+        settings_repository: Optional[UserSettingsRepository] = None,
+        category_repository: Optional[CategoryRepository] = None
+    ):
         """
         Initialize service with repository.
 
         Args:
             repository: User repository instance for data access
+            settings_repository: User settings repository (onboarding only)
+            category_repository: Category repository (onboarding only)
         """
         self.repository = repository
+        self.settings_repository = settings_repository
+        self.category_repository = category_repository
 
     async def create_user(self, user_data: UserCreate) -> User:
         """
@@ -85,6 +108,60 @@ class UserService:
             )
             raise
 
+    async def onboard_user(
+        self,
+        user_data: UserCreate
+    ) -> tuple[User, Optional[datetime], bool]:
+        """
+        Get or create user with default settings and categories.
+
+        Idempotent: the user row is upserted on telegram_id and settings are
+        only inserted when missing, so a redelivered /start does no harm.
+        Default categories are created for new users only, so categories a
+        returning user deleted are not brought back. All statements share
+        the request transaction.
+
+        Args:
+            user_data: User creation data from the Telegram profile
+
+        Returns:
+            Tuple of (user with settings/categories loaded, last activity
+            end time, True if the user was created by this call)
+        """
+        logger.debug("onboard_user started", extra={"telegram_id": user_data.telegram_id})
+
+        try:
+            user, created = await self.repository.upsert_by_telegram_id(user_data)
+
+            await self.settings_repository.create_if_absent(
+                UserSettingsCreate(user_id=user.id)
+            )
+            if created:
+                await self.category_repository.bulk_create_if_absent([
+                    CategoryCreate(user_id=user.id, is_default=True, **category)
+                    for category in DEFAULT_CATEGORIES
+                ])
+
+            user, last_activity_end_time = await self.repository.get_context_by_telegram_id(
+                user_data.telegram_id
+            )
+            logger.info(
+                "user_onboarded",
+                extra={
+                    "user_id": user.id,
+                    "telegram_id": user.telegram_id,
+                    "user_created": created
+                }
+            )
+            return user, last_activity_end_time, created
+        except Exception as e:
+            logger.error(
+                "onboard_user failed",
+                extra={"telegram_id": user_data.telegram_id, "error": str(e)},
+                exc_info=True
+            )
+            raise
+
     async def get_by_telegram_id(self, telegram_id: int) -> Optional[User]:
         """
         Get user by Telegram ID.
@@ -103,6 +180,27 @@ class UserService:
         )
         return user
 
+    async def get_context_by_telegram_id(
+        self,
+        telegram_id: int
+    ) -> Optional[tuple[User, Optional[datetime]]]:
+        """
+        Get user with settings, categories and last activity end time.
+
+        Args:
+            telegram_id: Telegram user ID
+
+        Returns:
+            Tuple of (user, last activity end time) if found, None otherwise
+        """
+        logger.debug("get_context_by_telegram_id started", extra={"telegram_id": telegram_id})
+        context = await self.repository.get_context_by_telegram_id(telegram_id)
+        logger.debug(
+            "get_context_by_telegram_id completed",
+            extra={"telegram_id": telegram_id, "found": context is not None}
+        )
+        return context
+
     async def get_by_id(self, user_id: int) -> Optional[User]:
         """
         Get user by internal ID.
@@ -178,3 +276,14 @@ class UserService:
             extra={"user_count": len(users)}
         )
         return users
+
+    async def stream_active_users_with_settings(self) -> AsyncIterator[User]:
+        """
+        Stream active users with their settings for poll restoration.
+
+        Yields:
+            Users ordered by ID with ``settings`` loaded (None if missing)
+        """
+        logger.debug("stream_active_users_with_settings started")
+        async for user in self.repository.stream_active_users_with_settings():
+            yield user
@@ -0,0 +1 @@
+"""Application-level utility helpers."""
@@ -0,0 +1,174 @@
+"""Encoders for streaming activity exports (CSV, NDJSON, Parquet).
+
+Every encoder consumes the batches read from a server-side cursor (see
+``ActivityRepository.stream_for_export``) and yields one bytes chunk per
+batch, so a StreamingResponse sends data while it is being read and memory
+is bounded by the batch size, not by the number of activities. Parquet is
+written in row groups of ``PARQUET_ROW_GROUP_SIZE`` rows, each flushed to
+the client as soon as it is complete.
+"""
+
+import csv
+import io
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Literal, Mapping, Sequence
+
+import orjson
+
+ExportFormat = Literal["csv", "ndjson", "parquet"]
+RowBatches = AsyncIterator[Sequence[Mapping[str, Any]]]
+
+# Column order of CSV/Parquet output (NDJSON objects use the same keys)
+EXPORT_COLUMNS = (
+    "id",
+    "category_id",
+    "category_name",
+    "description",
+    "tags",
+    "start_time",
+    "end_time",
+    "duration_minutes",
+    "created_at",
+)
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+PARQUET_ROW_GROUP_SIZE = 50_000
+
+
+def _csv_value(value: Any) -> Any:
+    """Render one cell: tags comma-joined (quoted by csv), datetimes ISO 8601."""
+    if isinstance(value, list):
+        return ",".join(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+async def encode_csv(batches: RowBatches) -> AsyncIterator[bytes]:
+    """
+    Encode batches as CSV with a header row.
+
+    Args:
+        batches: Row mapping batches from the export cursor
+
+    Yields:
+        Header chunk, then one chunk of CSV lines per batch
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue().encode()
+
+    async for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_csv_value(row[name]) for name in EXPORT_COLUMNS] for row in rows)
+        yield buffer.getvalue().encode()
+
+
+async def encode_ndjson(batches: RowBatches) -> AsyncIterator[bytes]:
+    """
+    Encode batches as newline-delimited JSON, one activity object per line.
+
+    Args:
+        batches: Row mapping batches from the export cursor
+
+    Yields:
+        One chunk of NDJSON lines per batch
+    """
+    async for rows in batches:
+        yield b"".join(orjson.dumps(dict(row)) + b"\n" for row in rows)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands out what was written since the last drain.
+
+    ``tell()`` keeps counting across drains: the Parquet writer records
+    absolute column chunk offsets in the footer.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        """Return and forget everything written since the previous drain."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def encode_parquet(
+    batches: RowBatches,
+    row_group_size: int = PARQUET_ROW_GROUP_SIZE
+) -> AsyncIterator[bytes]:
+    """
+    Encode batches as a Parquet file written one row group at a time.
+
+    Args:
+        batches: Row mapping batches from the export cursor
+        row_group_size: Rows per row group (also the most rows held in memory)
+
+    Yields:
+        File bytes, one chunk per completed row group plus the footer
+    """
+    # Imported here: pyarrow is only needed by this format
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    timestamp = pa.timestamp("us", tz="UTC")
+    schema = pa.schema([
+        ("id", pa.int64()),
+        ("category_id", pa.int64()),
+        ("category_name", pa.string()),
+        ("description", pa.string()),
+        ("tags", pa.list_(pa.string())),
+        ("start_time", timestamp),
+        ("end_time", timestamp),
+        ("duration_minutes", pa.int32()),
+        ("created_at", timestamp),
+    ])
+
+    def write_row_group(rows: Sequence[Mapping[str, Any]]) -> None:
+        columns = {name: [row[name] for row in rows] for name in EXPORT_COLUMNS}
+        writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    pending: list[Mapping[str, Any]] = []
+    async for rows in batches:
+        pending.extend(rows)
+        while len(pending) >= row_group_size:
+            write_row_group(pending[:row_group_size])
+            del pending[:row_group_size]
+            yield sink.drain()
+
+    if pending:
+        write_row_group(pending)
+    writer.close()
+    yield sink.drain()
+
+
+EXPORT_ENCODERS: dict[str, Callable[[RowBatches], AsyncIterator[bytes]]] = {
+    "csv": encode_csv,
+    "ndjson": encode_ndjson,
+    "parquet": encode_parquet,
+}
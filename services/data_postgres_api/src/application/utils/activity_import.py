@@ -0,0 +1,200 @@
+"""Streaming parsers and batch driver for bulk activity imports.
+
+Uploads (CSV with a header row, or NDJSON) are parsed incrementally from a
+byte stream and loaded ``IMPORT_BATCH_SIZE`` records at a time. Every batch
+is its own short transaction (validate, upsert category names, COPY,
+commit), so a six-figure import neither holds one giant transaction nor
+keeps more than one batch in memory. Batches committed before a database
+error stay imported.
+
+Records use the export columns (see ``activity_export``): description,
+start_time, end_time, tags and category_name; other columns are ignored.
+"""
+
+import codecs
+import csv
+import logging
+from typing import Any, AsyncIterator, Callable, Literal
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.services.activity_service import ActivityService
+from src.core.config import settings
+from src.infrastructure.database.admission import set_statement_timeout
+from src.infrastructure.database.connection import admission, async_session
+from src.infrastructure.repositories.activity_repository import ActivityRepository
+from src.infrastructure.repositories.category_repository import CategoryRepository
+from src.infrastructure.repositories.user_repository import UserRepository
+from src.schemas.activity import ActivityImportResponse
+
+logger = logging.getLogger(__name__)
+
+ImportFormat = Literal["csv", "ndjson"]
+ImportRecord = dict[str, Any] | None
+
+# Records per transaction: large enough to amortize the per-batch statements
+# (nextval, COPY, rollup, users update), small enough to keep locks short
+IMPORT_BATCH_SIZE = 5000
+
+# Per-record errors returned in the response; the rest are only counted
+MAX_IMPORT_ERRORS = 100
+
+
+async def _decoded_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a UTF-8 byte stream (BOM allowed) into lines, keeping line ends."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    tail = ""
+    async for chunk in chunks:
+        lines = (tail + decoder.decode(chunk)).split("\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+async def parse_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRecord]:
+    """
+    Parse CSV with a header row into one dict per row.
+
+    Quoted fields may contain commas and line breaks. Blank lines are skipped.
+
+    Args:
+        chunks: Raw upload bytes
+
+    Yields:
+        Row dicts keyed by the header's column names
+    """
+    header: list[str] | None = None
+    record = ""
+    async for line in _decoded_lines(chunks):
+        record += line
+        if record.count('"') % 2:
+            # Inside a quoted field: the record continues on the next line
+            continue
+
+        fields = next(csv.reader([record]), [])
+        record = ""
+        if not any(fields):
+            continue
+        if header is None:
+            header = [name.strip() for name in fields]
+            continue
+        yield dict(zip(header, fields))
+
+
+async def parse_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRecord]:
+    """
+    Parse newline-delimited JSON, one activity object per line.
+
+    Args:
+        chunks: Raw upload bytes
+
+    Yields:
+        Decoded objects, or None for lines that are not valid JSON
+    """
+    async for line in _decoded_lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            yield orjson.loads(line)
+        except orjson.JSONDecodeError:
+            yield None
+
+
+IMPORT_PARSERS: dict[str, Callable[[AsyncIterator[bytes]], AsyncIterator[ImportRecord]]] = {
+    "csv": parse_csv,
+    "ndjson": parse_ndjson,
+}
+
+
+async def _batched(
+    records: AsyncIterator[ImportRecord],
+    size: int
+) -> AsyncIterator[list[ImportRecord]]:
+    """Group records into lists of at most ``size``."""
+    batch: list[ImportRecord] = []
+    async for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def import_activities(
+    user_id: int,
+    records: AsyncIterator[ImportRecord],
+    session_factory: async_sessionmaker[AsyncSession] = async_session,
+    batch_size: int = IMPORT_BATCH_SIZE
+) -> ActivityImportResponse:
+    """
+    Import parsed records for a user, committing batch by batch.
+
+    Each batch takes an admission slot and runs in its own transaction with
+    the bulk statement budget, so other requests are served between batches.
+
+    Args:
+        user_id: Owner of the imported activities
+        records: Parsed records (see IMPORT_PARSERS)
+        session_factory: Read-write session factory
+        batch_size: Records per transaction
+
+    Returns:
+        Counts of imported and rejected records, first rejections by position
+
+    Raises:
+        LookupError: If the user does not exist
+    """
+    async with session_factory() as session:
+        if await UserRepository(session).get_by_id(user_id) is None:
+            raise LookupError(f"User {user_id} not found")
+
+    category_ids: dict[str, int] = {}
+    imported = 0
+    failed = 0
+    errors = []
+    position = 0
+
+    async for batch in _batched(records, batch_size):
+        async with admission.admit():
+            async with session_factory() as session:
+                async with session.begin():
+                    await set_statement_timeout(session, settings.db_bulk_statement_timeout_ms)
+                    service = ActivityService(
+                        ActivityRepository(session), CategoryRepository(session)
+                    )
+                    created, batch_errors = await service.import_batch(
+                        user_id, batch, first_index=position, category_ids=category_ids
+                    )
+
+        imported += created
+        failed += len(batch_errors)
+        errors.extend(batch_errors[:MAX_IMPORT_ERRORS - len(errors)])
+        position += len(batch)
+
+        logger.debug(
+            "Activity import batch committed",
+            extra={
+                "user_id": user_id,
+                "batch_size": len(batch),
+                "imported_count": imported,
+                "failed_count": failed,
+                "operation": "bulk_create"
+            }
+        )
+
+    logger.info(
+        "Activity import completed",
+        extra={
+            "user_id": user_id,
+            "imported_count": imported,
+            "failed_count": failed,
+            "operation": "bulk_create"
+        }
+    )
+
+    return ActivityImportResponse(imported=imported, failed=failed, errors=errors)
@@ -0,0 +1,99 @@
+"""Opaque keyset pagination cursors for activity listings.
+
+A cursor encodes the ``(start_time, id)`` pair of the last row returned on a
+page. The next page is fetched with ``WHERE (start_time, id) < cursor``, which
+the composite ``(user_id, start_time DESC, id DESC)`` index serves directly, so
+page N costs the same as page 1 regardless of how deep the history goes.
+
+Search results are ordered by relevance first, so their cursor carries the
+``(rank, start_time, id)`` triple instead.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+
+ActivityCursor = tuple[datetime, int]
+SearchCursor = tuple[float, datetime, int]
+
+
+def encode_activity_cursor(start_time: datetime, activity_id: int) -> str:
+    """
+    Encode activity keyset position into opaque cursor string.
+
+    Args:
+        start_time: Start time of the last activity on the page
+        activity_id: ID of the last activity on the page
+
+    Returns:
+        URL-safe cursor string
+
+    Example:
+        >>> encode_activity_cursor(datetime(2025, 11, 7, 10, 0), 42)
+        'MjAyNS0xMS0wN1QxMDowMDowMCw0Mg'
+    """
+    raw = f"{start_time.isoformat()},{activity_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_activity_cursor(cursor: str) -> ActivityCursor:
+    """
+    Decode opaque cursor string into activity keyset position.
+
+    Args:
+        cursor: Cursor previously produced by encode_activity_cursor()
+
+    Returns:
+        Tuple of (start_time, activity_id)
+
+    Raises:
+        ValueError: If cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        start_str, id_str = raw.rsplit(",", 1)
+        return datetime.fromisoformat(start_str), int(id_str)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}") from e
+
+
+def encode_search_cursor(rank: float, start_time: datetime, activity_id: int) -> str:
+    """
+    Encode search result keyset position into opaque cursor string.
+
+    The rank is written with repr(), which round-trips floats exactly, so
+    the next page continues strictly after the last row.
+
+    Args:
+        rank: Relevance of the last result on the page
+        start_time: Start time of the last result on the page
+        activity_id: ID of the last result on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{rank!r},{start_time.isoformat()},{activity_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> SearchCursor:
+    """
+    Decode opaque cursor string into search result keyset position.
+
+    Args:
+        cursor: Cursor previously produced by encode_search_cursor()
+
+    Returns:
+        Tuple of (rank, start_time, activity_id)
+
+    Raises:
+        ValueError: If cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        rank_str, start_str, id_str = raw.split(",")
+        return float(rank_str), datetime.fromisoformat(start_str), int(id_str)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}") from e
@@ -103,3 +103,39 @@ def validate_activity_duration(
             f"Activity duration ({duration_hours:.1f}h) exceeds "
             f"maximum allowed duration ({max_hours}h)"
         )
+
+
+def validate_time_window(
+    start: datetime | None,
+    end: datetime | None
+) -> tuple[datetime | None, datetime | None]:
+    """
+    Validate a [start, end) query window and make its bounds timezone-aware.
+
+    Query parameters may carry an offset or not; naive bounds are treated as
+    UTC, so a naive and an aware bound compare instead of raising TypeError.
+
+    Args:
+        start: Inclusive window start (None: unbounded)
+        end: Exclusive window end (None: unbounded)
+
+    Returns:
+        Tuple of (start, end) with naive values set to UTC
+
+    Raises:
+        ValueError: If both bounds are set and start is not earlier than end
+
+    Example:
+        >>> validate_time_window(datetime(2024, 1, 1), datetime(2024, 1, 2, tzinfo=timezone.utc))
+        (datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 2, tzinfo=timezone.utc))
+        >>> validate_time_window(datetime(2024, 1, 2), datetime(2024, 1, 1))
+        ValueError: 'from' must be earlier than 'to'
+    """
+    if start is not None and not start.tzinfo:
+        start = start.replace(tzinfo=timezone.utc)
+    if end is not None and not end.tzinfo:
+        end = end.replace(tzinfo=timezone.utc)
+
+    if start is not None and end is not None and start >= end:
+        raise ValueError("'from' must be earlier than 'to'")
+    return start, end
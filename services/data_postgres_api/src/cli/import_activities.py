@@ -0,0 +1,82 @@
+"""
+Import a user's activity history from a CSV or NDJSON file.
+
+Same parsing, validation and batch-by-batch COPY as
+POST /api/v1/users/{user_id}/activities/import; for files too large to
+upload comfortably. Columns follow the activity export.
+
+Usage:
+    python -m src.cli.import_activities --user-id 42 history.csv
+    python -m src.cli.import_activities --user-id 42 --format ndjson history.ndjson
+"""
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+from typing import AsyncIterator
+
+from src.application.utils.activity_import import IMPORT_PARSERS, import_activities
+from src.core.config import settings
+from src.core.logging import setup_logging
+from src.infrastructure.database.connection import engine
+from src.schemas.activity import ActivityImportResponse
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from the file per chunk
+READ_CHUNK_SIZE = 1 << 20
+
+
+async def _read_chunks(path: Path) -> AsyncIterator[bytes]:
+    """Yield the file in chunks without loading it whole."""
+    with path.open("rb") as file:
+        while chunk := file.read(READ_CHUNK_SIZE):
+            yield chunk
+
+
+async def run_import(user_id: int, path: Path, import_format: str) -> ActivityImportResponse:
+    """
+    Import the file for a user.
+
+    Args:
+        user_id: Owner of the imported activities
+        path: CSV or NDJSON file
+        import_format: "csv" or "ndjson"
+
+    Returns:
+        Import result
+    """
+    try:
+        records = IMPORT_PARSERS[import_format](_read_chunks(path))
+        return await import_activities(user_id, records)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    """Parse arguments and run the import."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", type=Path, help="CSV or NDJSON file")
+    parser.add_argument("--user-id", type=int, required=True, help="Internal user ID")
+    parser.add_argument(
+        "--format",
+        choices=sorted(IMPORT_PARSERS),
+        default=None,
+        help="File format (default: from the file extension, csv otherwise)"
+    )
+    args = parser.parse_args()
+    import_format = args.format or ("ndjson" if args.path.suffix in (".ndjson", ".jsonl") else "csv")
+
+    setup_logging(service_name="data_postgres_api", log_level=settings.log_level)
+    try:
+        result = asyncio.run(run_import(args.user_id, args.path, import_format))
+    except LookupError as e:
+        parser.exit(1, f"{e}\n")
+
+    print(f"activities imported: {result.imported}, rejected: {result.failed}")
+    for error in result.errors:
+        print(f"  record {error.index}: {error.error}")
+
+
+if __name__ == "__main__":
+    main()
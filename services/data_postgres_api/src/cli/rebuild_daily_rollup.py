@@ -0,0 +1,58 @@
+"""
+Rebuild activity_daily_rollup from activities history.
+
+Needed after deploying the rollup table on existing data, after a user's
+timezone changes, or whenever totals are suspected to have drifted.
+
+Usage:
+    python -m src.cli.rebuild_daily_rollup            # all users
+    python -m src.cli.rebuild_daily_rollup --user-id 42
+"""
+import argparse
+import asyncio
+import logging
+
+from src.core.config import settings
+from src.core.logging import setup_logging
+from src.infrastructure.database.admission import set_statement_timeout
+from src.infrastructure.database.connection import async_session, engine
+from src.infrastructure.repositories.activity_daily_rollup_repository import (
+    ActivityDailyRollupRepository
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def rebuild(user_id: int | None) -> int:
+    """
+    Rebuild the rollup in a single transaction.
+
+    Args:
+        user_id: Only rebuild this user's rows; all users when None
+
+    Returns:
+        Number of rollup rows written
+    """
+    try:
+        async with async_session() as session:
+            async with session.begin():
+                # Maintenance job: not bound by the request statement budget
+                await set_statement_timeout(session, 0)
+                return await ActivityDailyRollupRepository(session).rebuild(user_id)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    """Parse arguments and run the rebuild."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user-id", type=int, default=None, help="Rebuild a single user")
+    args = parser.parse_args()
+
+    setup_logging(service_name="data_postgres_api", log_level=settings.log_level)
+    row_count = asyncio.run(rebuild(args.user_id))
+    print(f"activity_daily_rollup rebuilt: {row_count} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 """Configuration settings for data_postgres_api service."""
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -7,12 +9,53 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    # Optional read replica for GET routes (same credentials format as database_url)
+    database_read_url: str | None = None
     enable_db_auto_create: bool = False  # Only for dev/test, use migrations in production
 
+    # Connection pool (ignored in PgBouncer mode)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # Seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # Seconds before a connection is replaced (-1: never)
+    db_pool_pre_ping: bool = True  # Ping on every checkout (one extra round trip)
+    db_pool_warmup: bool = True  # Open db_pool_size connections at startup
+    # PgBouncer transaction pooling: NullPool, no prepared statement caching
+    db_pgbouncer: bool = False
+
+    # Statement budgets in ms (0: no limit): default for every statement,
+    # raised per transaction for bulk routes
+    db_statement_timeout_ms: int = 5000
+    db_bulk_statement_timeout_ms: int = 60000
+
+    # Admission control: concurrent DB-bound requests per pool (None: pool
+    # size + overflow, 0: unlimited), waiting requests and their max wait
+    db_admission_limit: int | None = None
+    db_admission_queue: int = 100
+    db_admission_wait_s: float = 1.0
+    db_admission_retry_after_s: int = 1
+
     # Application
     app_name: str = "data_postgres_api"
     log_level: str = "INFO"
 
+    # Request logging: "all" (start + completion, sampled) or "slow_or_failed"
+    request_log_mode: Literal["all", "slow_or_failed"] = "all"
+    request_log_sample_rate: float = 1.0
+    request_log_slow_ms: float = 500.0
+
+    # SQL cursor hooks: "off", "timing" (slow queries + statistics),
+    # "sampled" (timing + debug record for every Nth statement), "debug"
+    sql_instrumentation: Literal["off", "timing", "sampled", "debug"] = "timing"
+    sql_log_sample_every: int = 100
+
+    # SQL statement statistics (GET /admin/query-stats)
+    query_stats_max_entries: int = 500
+    # Mount the unauthenticated /admin router (diagnostics, stats reset)
+    enable_admin_api: bool = False
+    # Add X-Query-Count / X-DB-Time headers to every response
+    query_debug_headers: bool = False
+
     # API
     api_v1_prefix: str = "/api/v1"
 
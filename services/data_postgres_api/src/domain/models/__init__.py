@@ -7,6 +7,7 @@ from src.domain.models.base import Base
 from src.domain.models.user import User
 from src.domain.models.category import Category
 from src.domain.models.activity import Activity
+from src.domain.models.activity_daily_rollup import ActivityDailyRollup
 from src.domain.models.user_settings import UserSettings
 
 __all__ = [
@@ -14,5 +15,6 @@ __all__ = [
     "User",
     "Category",
     "Activity",
+    "ActivityDailyRollup",
     "UserSettings",
 ]
@@ -4,8 +4,11 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, ForeignKey, Integer, String, Text, TIMESTAMP
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    DDL, CheckConstraint, Column, Computed, ForeignKey, Index, Integer, String, Text, TIMESTAMP, event
+)
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 from sqlalchemy.sql import func
 
 from src.domain.models.base import Base
@@ -14,6 +17,15 @@ if TYPE_CHECKING:
     from src.domain.models.user import User
     from src.domain.models.category import Category
 
+# Full-text document of an activity: Russian stems (weight A) plus unstemmed
+# tokens (weight B) for names, English words and anything Russian stemming
+# would mangle. Both configurations are spelled out, so the expression is
+# immutable and can back a stored generated column (see migration 007).
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('russian', description), 'A') || "
+    "setweight(to_tsvector('simple', description), 'B')"
+)
+
 
 class Activity(Base):
     """Activity model for user activities."""
@@ -28,7 +40,7 @@ class Activity(Base):
         Integer, ForeignKey("categories.id", ondelete="SET NULL"), nullable=True
     )
     description: Mapped[str] = mapped_column(Text, nullable=False)
-    tags: Mapped[str | None] = mapped_column(Text, nullable=True)
+    tags: Mapped[list[str] | None] = mapped_column(ARRAY(Text), nullable=True)
     start_time: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), nullable=False, index=True
     )
@@ -36,23 +48,116 @@ class Activity(Base):
         TIMESTAMP(timezone=True), nullable=False, index=True
     )
     duration_minutes: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Relevance of a full-text search hit, populated with with_expression()
+    search_rank: Mapped[float | None] = query_expression()
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=func.now(),
     )
 
-    # Check constraint: end_time must be greater than start_time
     __table_args__ = (
+        # Check constraint: end_time must be greater than start_time
         CheckConstraint("end_time > start_time", name="check_end_time_after_start"),
+        # Generated by PostgreSQL and only used in WHERE/ORDER BY of searches
+        # (Activity.__table__.c.search_vector). Not mapped: a mapped column
+        # would be fetched by eager_defaults in every INSERT ... RETURNING.
+        Column(
+            "search_vector",
+            TSVECTOR,
+            Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=False,
+        ),
     )
+    __mapper_args__ = {**Base.__mapper_args__, "exclude_properties": ["search_vector"]}
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="activities")
     category: Mapped["Category | None"] = relationship("Category", back_populates="activities")
 
+    @property
+    def category_name(self) -> str | None:
+        """Category name if the category relationship is loaded, else None."""
+        # __dict__ lookup: never lazy-loads (not allowed with AsyncSession)
+        category = self.__dict__.get("category")
+        return category.name if category is not None else None
+
+    @property
+    def category_emoji(self) -> str | None:
+        """Category emoji if the category relationship is loaded, else None."""
+        category = self.__dict__.get("category")
+        return category.emoji if category is not None else None
+
     def __repr__(self) -> str:
         return (
             f"<Activity(id={self.id}, user_id={self.user_id}, "
             f"description={self.description[:30]}...)>"
         )
+
+
+# Composite indexes for keyset pagination (see migration 003)
+Index(
+    "ix_activities_user_start_id",
+    Activity.user_id,
+    Activity.start_time.desc(),
+    Activity.id.desc(),
+)
+Index(
+    "ix_activities_user_category_start",
+    Activity.user_id,
+    Activity.category_id,
+    Activity.start_time.desc(),
+    Activity.id.desc(),
+)
+
+# Time-range (overlap) queries: user_id && tstzrange(start, end), see migration 005.
+# GiST on a scalar column needs the btree_gist extension.
+Index(
+    "ix_activities_user_period",
+    Activity.user_id,
+    func.tstzrange(Activity.start_time, Activity.end_time),
+    postgresql_using="gist",
+)
+event.listen(
+    Activity.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(dialect="postgresql"),
+)
+
+# Full-text search: user_id = ? AND search_vector @@ query, see migration 007.
+# GIN on a scalar column needs the btree_gin extension.
+Index(
+    "ix_activities_user_search",
+    Activity.user_id,
+    Activity.__table__.c.search_vector,
+    postgresql_using="gin",
+)
+event.listen(
+    Activity.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gin").execute_if(dialect="postgresql"),
+)
+
+# Description prefix matching (autocomplete): user_id = ? AND description
+# ILIKE 'prefix%', see migration 008. Trigram operator class from pg_trgm.
+Index(
+    "ix_activities_user_description_trgm",
+    Activity.user_id,
+    Activity.description,
+    postgresql_using="gin",
+    postgresql_ops={"description": "gin_trgm_ops"},
+)
+event.listen(
+    Activity.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+# Tag filters: user_id = ? AND tags @> ARRAY[tag], see migration 009
+# (btree_gin, installed for ix_activities_user_search, covers user_id).
+Index(
+    "ix_activities_user_tags",
+    Activity.user_id,
+    Activity.tags,
+    postgresql_using="gin",
+)
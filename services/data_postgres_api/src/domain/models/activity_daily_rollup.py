@@ -0,0 +1,50 @@
+"""Activity daily rollup model."""
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.domain.models.base import Base
+
+
+class ActivityDailyRollup(Base):
+    """Per-user, per-local-day, per-category activity totals.
+
+    Maintained incrementally by ActivityRepository in the same transaction
+    as activity inserts; activities crossing local midnight contribute to
+    each day they touch. ``activity_count`` counts activities on the day
+    they start, so it sums to the number of activities.
+
+    ``category_id`` intentionally has no foreign key: after a category is
+    deleted its rows keep the old id and are reported as uncategorized
+    (readers LEFT JOIN categories).
+    """
+
+    __tablename__ = "activity_daily_rollup"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    local_date: Mapped[date] = mapped_column(Date, nullable=False)
+    category_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    total_minutes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    activity_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # One row per (user, day, category); NULL category is a regular key value
+    __table_args__ = (
+        Index(
+            "uix_activity_daily_rollup_user_date_category",
+            "user_id",
+            "local_date",
+            "category_id",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ActivityDailyRollup(user_id={self.user_id}, local_date={self.local_date}, "
+            f"category_id={self.category_id}, total_minutes={self.total_minutes})>"
+        )
@@ -4,4 +4,7 @@ from sqlalchemy.orm import DeclarativeBase
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
-    pass
+
+    # Fetch server-generated columns (id, created_at) with RETURNING in the
+    # same INSERT/UPDATE issued by flush(), so no follow-up SELECT is needed.
+    __mapper_args__ = {"eager_defaults": True}
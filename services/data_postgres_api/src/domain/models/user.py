@@ -32,6 +32,11 @@ class User(Base):
         TIMESTAMP(timezone=True),
         nullable=True,
     )
+    # Denormalized max(activities.end_time), maintained on activity insert
+    last_activity_end_time: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=True,
+    )
 
     # Relationships
     categories: Mapped[List["Category"]] = relationship(
@@ -0,0 +1,136 @@
+"""Admission control and statement time budgets for database work.
+
+Requests take an admission slot before they check out a session. The
+number of slots matches what the pool can serve at once, so bursts queue
+here, in a bounded queue with a short wait, instead of on pool checkout
+until the pool timeout. A request that cannot be admitted fails fast with
+``DatabaseOverloadedError`` (HTTP 503 with Retry-After).
+
+Statement budgets: every connection starts with the default
+``statement_timeout`` (see ``engine_options``), and routes that need more
+time raise it for their transaction with ``set_statement_timeout``.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from prometheus_client import Counter
+from sqlalchemy import func, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# PostgreSQL SQLSTATE query_canceled (statement_timeout, pg_cancel_backend)
+QUERY_CANCELED_SQLSTATE = "57014"
+
+DB_ADMISSION_REJECTIONS = Counter(
+    "db_admission_rejections_total",
+    "Requests rejected with 503 before checking out a connection",
+    ["reason"],
+)
+
+
+class DatabaseOverloadedError(Exception):
+    """Raised when a request is not admitted to the database."""
+
+    def __init__(self, reason: str, retry_after: int):
+        """
+        Initialize error.
+
+        Args:
+            reason: "queue_full" or "timeout"
+            retry_after: Seconds the client should wait before retrying
+        """
+        super().__init__(f"Database overloaded ({reason})")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Caps concurrent database-bound requests with a bounded wait queue."""
+
+    def __init__(
+        self,
+        limit: int,
+        max_queue: int,
+        max_wait: float,
+        retry_after: int = 1
+    ):
+        """
+        Initialize controller.
+
+        Args:
+            limit: Requests allowed to use the database at once (0: unlimited)
+            max_queue: Requests allowed to wait for a slot; more are rejected
+            max_wait: Seconds a request may wait for a slot before rejection
+            retry_after: Retry-After value for rejected requests
+        """
+        self.limit = limit
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.retry_after = retry_after
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(limit) if limit > 0 else None
+        self._rejected_queue_full = DB_ADMISSION_REJECTIONS.labels("queue_full")
+        self._rejected_timeout = DB_ADMISSION_REJECTIONS.labels("timeout")
+
+    async def acquire(self) -> None:
+        """
+        Take a slot, waiting at most ``max_wait`` seconds.
+
+        Raises:
+            DatabaseOverloadedError: If the queue is full or the wait timed out
+        """
+        if self._semaphore is None:
+            return
+        if self._semaphore.locked() and self.waiting >= self.max_queue:
+            self._rejected_queue_full.inc()
+            raise DatabaseOverloadedError("queue_full", self.retry_after)
+
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.max_wait)
+        except asyncio.TimeoutError:
+            self._rejected_timeout.inc()
+            raise DatabaseOverloadedError("timeout", self.retry_after) from None
+        finally:
+            self.waiting -= 1
+
+    def release(self) -> None:
+        """Return a slot taken by ``acquire``."""
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+
+async def set_statement_timeout(session: AsyncSession, milliseconds: int) -> None:
+    """
+    Override statement_timeout for the session's current transaction.
+
+    Equivalent to ``SET LOCAL statement_timeout``, so the budget ends with
+    the transaction and never leaks to the next user of the connection.
+    Has no effect in autocommit sessions.
+
+    Args:
+        session: Session with an open (or about to open) transaction
+        milliseconds: Budget per statement; 0 disables the timeout
+    """
+    await session.execute(
+        select(func.set_config("statement_timeout", str(milliseconds), True))
+    )
+
+
+def is_statement_timeout(error: BaseException) -> bool:
+    """Check whether a database error is a canceled statement (timeout)."""
+    if not isinstance(error, DBAPIError):
+        return False
+    orig = error.orig
+    sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    return sqlstate == QUERY_CANCELED_SQLSTATE
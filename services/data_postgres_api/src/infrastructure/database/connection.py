@@ -1,8 +1,12 @@
 """Database connection management with SQLAlchemy async."""
+import asyncio
+import itertools
 import logging
 import time
-from typing import AsyncGenerator, Any, Dict, List, Optional, Tuple, Union
+from typing import AsyncGenerator, Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+from uuid import uuid4
 
+from prometheus_client import Counter, Gauge, Histogram
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import (
@@ -11,24 +15,161 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 
-from src.core.config import settings
+from src.core.config import Settings, settings
+from src.infrastructure.database.admission import AdmissionController
+from src.infrastructure.database.query_stats import QUERY_STATS, record_query
 
 logger = logging.getLogger(__name__)
 
 # Slow query threshold in seconds
 SLOW_QUERY_THRESHOLD = 1.0
 
+SqlInstrumentationMode = Literal["off", "timing", "sampled", "debug"]
+
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent getting a connection from the pool (incl. opening new ones)",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0),
+)
+DB_SLOW_QUERIES = Counter(
+    "db_slow_queries_total",
+    f"SQL statements slower than {SLOW_QUERY_THRESHOLD}s by statement type",
+    ["operation"],
+)
+DB_ADMISSION_WAITING = Gauge(
+    "db_admission_waiting", "Requests waiting for a database admission slot"
+)
+DB_POOL_SIZE = Gauge("db_pool_size", "Configured pool size")
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Connections currently checked out"
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Connections open beyond pool_size (negative: not yet opened)",
+)
+
+
+class _TimedCheckoutMixin:
+    """Records how long each pool checkout waited (incl. opening connections)."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - started)
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited."""
+
+
+class TimedNullPool(_TimedCheckoutMixin, NullPool):
+    """Pool without pooling (PgBouncer mode) that records connection open time."""
+
+
+def _unique_prepared_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
+def engine_options(config: Settings) -> dict[str, Any]:
+    """Build create_async_engine() pool options from settings.
+
+    In PgBouncer mode (transaction pooling) PgBouncer owns the pool: every
+    checkout opens a fresh server-side session through it (NullPool), and
+    prepared statements are neither cached nor reused by name, because
+    consecutive transactions may run on different server connections.
+
+    The default statement_timeout budget is sent as a connection startup
+    parameter, so it costs no round trip. PgBouncer rejects unknown startup
+    parameters; in PgBouncer mode configure it on the database role instead
+    (ALTER ROLE ... SET statement_timeout).
+
+    Args:
+        config: Application settings
+
+    Returns:
+        Keyword arguments for create_async_engine()
+    """
+    if config.db_pgbouncer:
+        return {
+            "poolclass": TimedNullPool,
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": _unique_prepared_statement_name,
+            },
+        }
+
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool,
+        "pool_size": config.db_pool_size,
+        "max_overflow": config.db_max_overflow,
+        "pool_timeout": config.db_pool_timeout,
+        "pool_recycle": config.db_pool_recycle,
+        "pool_pre_ping": config.db_pool_pre_ping,
+        "connect_args": {
+            "server_settings": {"statement_timeout": str(config.db_statement_timeout_ms)},
+        },
+    }
+
+
+def admission_limit(config: Settings) -> int:
+    """Get concurrent database-bound requests allowed per engine (0: unlimited)."""
+    if config.db_admission_limit is not None:
+        return config.db_admission_limit
+    if config.db_pgbouncer:
+        # No local pool to protect; PgBouncer queues clients itself
+        return 0
+    return config.db_pool_size + config.db_max_overflow
+
+
+def _admission_controller(config: Settings) -> AdmissionController:
+    return AdmissionController(
+        limit=admission_limit(config),
+        max_queue=config.db_admission_queue,
+        max_wait=config.db_admission_wait_s,
+        retry_after=config.db_admission_retry_after_s,
+    )
+
+
 # Create async engine
 engine: AsyncEngine = create_async_engine(
     settings.database_url,
     echo=False,
     future=True,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    **engine_options(settings),
+)
+
+# Pool statistics are read at scrape time, nothing is recorded per request.
+# NullPool (PgBouncer mode) keeps no connections, so there is nothing to report.
+if isinstance(engine.pool, QueuePool):
+    DB_POOL_SIZE.set_function(lambda: engine.pool.size())
+    DB_POOL_CHECKED_OUT.set_function(lambda: engine.pool.checkedout())
+    DB_POOL_OVERFLOW.set_function(lambda: engine.pool.overflow())
+
+# Engine for read-only requests: the replica when configured, else the primary
+read_engine: AsyncEngine = (
+    create_async_engine(
+        settings.database_read_url,
+        echo=False,
+        future=True,
+        **engine_options(settings),
+    )
+    if settings.database_read_url
+    else engine
 )
 
+# One admission controller per pool: reads on a replica do not wait for writes
+admission = _admission_controller(settings)
+read_admission = admission if read_engine is engine else _admission_controller(settings)
+DB_ADMISSION_WAITING.set_function(
+    lambda: sum(controller.waiting for controller in {admission, read_admission})
+)
+
+QUERY_STATS.max_entries = settings.query_stats_max_entries
+
 # Create async sessionmaker
 async_session = async_sessionmaker(
     engine,
@@ -39,22 +180,90 @@ async_session = async_sessionmaker(
 )
 
 
+# Read-only request sessions run in autocommit mode: no BEGIN/COMMIT round
+# trips, every statement reads its own snapshot
+read_session = async_sessionmaker(
+    read_engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+# Read-only transactions, required by server-side cursors (streaming results)
+read_stream_session = async_sessionmaker(
+    read_engine.execution_options(postgresql_readonly=True),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting async database session.
 
+    The request is admitted first (see ``admission``), so an overloaded
+    service answers 503 instead of queueing on pool checkout.
+
     Yields:
         AsyncSession: Database session
+
+    Raises:
+        DatabaseOverloadedError: If the request is not admitted
     """
-    async with async_session() as session:
-        try:
+    async with admission.admit():
+        async with async_session() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+            finally:
+                await session.close()
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only request sessions (GET routes).
+
+    Uses the read replica when DATABASE_READ_URL is set. There is nothing
+    to commit: statements run in autocommit mode.
+
+    Yields:
+        AsyncSession: Read-only database session
+
+    Raises:
+        DatabaseOverloadedError: If the request is not admitted
+    """
+    async with read_admission.admit():
+        async with read_session() as session:
             yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+
+
+async def warm_up_pool(target: AsyncEngine, size: int) -> int:
+    """
+    Open pool connections ahead of the first requests.
+
+    Connections are opened concurrently and returned to the pool, so the
+    first burst of traffic does not pay connection setup. Does nothing with
+    NullPool (PgBouncer mode), which keeps no connections.
+
+    Args:
+        target: Engine whose pool is warmed up
+        size: Number of connections to open (capped at the pool size)
+
+    Returns:
+        Number of connections opened
+    """
+    if not isinstance(target.pool, QueuePool):
+        return 0
+
+    size = min(size, target.pool.size())
+    connections = await asyncio.gather(*(target.connect() for _ in range(size)))
+    for conn in connections:
+        await conn.close()
+    return len(connections)
 
 
 def _sanitize_parameters(
@@ -87,9 +296,63 @@ def _sanitize_parameters(
     return str(parameters)[:100]
 
 
-@event.listens_for(Engine, "before_cursor_execute")
+# Statement types used as slow query metric labels (anything else is "other")
+_KNOWN_OPERATIONS = frozenset({"select", "insert", "update", "delete", "with"})
+
+
+def _statement_operation(statement: str) -> str:
+    """Get leading SQL keyword (select, insert, ...) for metric labels."""
+    words = statement.split(None, 1)
+    keyword = words[0].lower() if words else ""
+    return keyword if keyword in _KNOWN_OPERATIONS else "other"
+
+
+def _log_slow_query(statement: str, parameters: Any, total: float) -> None:
+    """Count and log a statement slower than SLOW_QUERY_THRESHOLD."""
+    DB_SLOW_QUERIES.labels(_statement_operation(statement)).inc()
+    logger.warning(
+        "Slow SQL query detected",
+        extra={
+            "sql": statement,
+            "duration_ms": round(total * 1000, 2),
+            "params": _sanitize_parameters(parameters),
+            "threshold_ms": SLOW_QUERY_THRESHOLD * 1000
+        }
+    )
+
+
+def _finish_timing(conn, cursor, statement: str, parameters: Any) -> float:
+    """Pop start time, record statement statistics and detect slow queries.
+
+    Returns:
+        Statement duration in seconds
+    """
+    total = time.perf_counter() - conn.info["query_start_time"].pop()
+
+    # Statement statistics and per-request counters (rowcount is -1 when unknown)
+    record_query(statement, total, cursor.rowcount)
+
+    if total > SLOW_QUERY_THRESHOLD:
+        _log_slow_query(statement, parameters, total)
+    return total
+
+
 def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    """Log SQL query execution start.
+    """Remember SQL statement start time.
+
+    Args:
+        conn: Database connection
+        cursor: Database cursor
+        statement: SQL statement
+        parameters: Query parameters
+        context: Execution context
+        executemany: Whether executing multiple statements
+    """
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Record SQL statement timing and statistics, warn about slow queries.
 
     Args:
         conn: Database connection
@@ -99,23 +362,32 @@ def before_cursor_execute(conn, cursor, statement, parameters, context, executem
         context: Execution context
         executemany: Whether executing multiple statements
     """
-    conn.info.setdefault("query_start_time", []).append(time.time())
+    _finish_timing(conn, cursor, statement, parameters)
+
 
-    # Sanitize sensitive data in parameters
-    safe_params = _sanitize_parameters(parameters)
+def before_cursor_execute_debug(conn, cursor, statement, parameters, context, executemany):
+    """Log SQL query execution start and remember its start time.
 
+    Args:
+        conn: Database connection
+        cursor: Database cursor
+        statement: SQL statement
+        parameters: Query parameters
+        context: Execution context
+        executemany: Whether executing multiple statements
+    """
+    before_cursor_execute(conn, cursor, statement, parameters, context, executemany)
     logger.debug(
         "Executing SQL query",
         extra={
             "sql_preview": statement[:200],  # First 200 chars
-            "params_preview": safe_params,
+            "params_preview": _sanitize_parameters(parameters),
             "executemany": executemany
         }
     )
 
 
-@event.listens_for(Engine, "after_cursor_execute")
-def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+def after_cursor_execute_debug(conn, cursor, statement, parameters, context, executemany):
     """Log SQL query execution completion with timing.
 
     Args:
@@ -126,27 +398,80 @@ def after_cursor_execute(conn, cursor, statement, parameters, context, executema
         context: Execution context
         executemany: Whether executing multiple statements
     """
-    total = time.time() - conn.info["query_start_time"].pop(-1)
-    duration_ms = round(total * 1000, 2)
-
+    total = _finish_timing(conn, cursor, statement, parameters)
     logger.debug(
         "SQL query completed",
         extra={
             "sql_preview": statement[:200],
-            "duration_ms": duration_ms,
+            "duration_ms": round(total * 1000, 2),
             "executemany": executemany
         }
     )
 
-    # Detect slow queries
-    if total > SLOW_QUERY_THRESHOLD:
-        safe_params = _sanitize_parameters(parameters)
-        logger.warning(
-            "Slow SQL query detected",
-            extra={
-                "sql": statement,
-                "duration_ms": duration_ms,
-                "params": safe_params,
-                "threshold_ms": SLOW_QUERY_THRESHOLD * 1000
-            }
+
+def _sampled_after_cursor_execute(sample_every: int) -> Callable[..., None]:
+    """Build an after_cursor_execute hook that logs every Nth statement.
+
+    A sampled statement gets one debug record with SQL, parameters and
+    duration; the others only pay for timing.
+
+    Args:
+        sample_every: Log one statement out of this many
+    """
+    counter = itertools.count()
+
+    def after_cursor_execute_sampled(conn, cursor, statement, parameters, context, executemany):
+        total = _finish_timing(conn, cursor, statement, parameters)
+        if next(counter) % sample_every == 0:
+            logger.debug(
+                "SQL query completed (sampled)",
+                extra={
+                    "sql_preview": statement[:200],
+                    "params_preview": _sanitize_parameters(parameters),
+                    "duration_ms": round(total * 1000, 2),
+                    "executemany": executemany,
+                    "sample_every": sample_every
+                }
+            )
+
+    return after_cursor_execute_sampled
+
+
+def install_sql_instrumentation(
+    target: Engine,
+    mode: SqlInstrumentationMode,
+    sample_every: int = 100
+) -> None:
+    """Register the cursor execute hooks required by ``mode`` on ``target``.
+
+    Modes:
+        off: no hooks (no slow query detection, statistics or debug headers)
+        timing: slow query detection and statement statistics
+        sampled: timing plus a debug record for every Nth statement
+        debug: timing plus start/completion debug records for every statement
+
+    Args:
+        target: Sync engine (``AsyncEngine.sync_engine``) or Engine class
+        mode: Instrumentation mode
+        sample_every: Statement sampling interval for "sampled" mode
+    """
+    if mode == "off":
+        return
+    if mode == "debug":
+        event.listen(target, "before_cursor_execute", before_cursor_execute_debug)
+        event.listen(target, "after_cursor_execute", after_cursor_execute_debug)
+        return
+
+    event.listen(target, "before_cursor_execute", before_cursor_execute)
+    if mode == "sampled":
+        event.listen(
+            target, "after_cursor_execute", _sampled_after_cursor_execute(max(1, sample_every))
         )
+    else:
+        event.listen(target, "after_cursor_execute", after_cursor_execute)
+
+
+for _engine in {engine, read_engine}:
+    install_sql_instrumentation(
+        _engine.sync_engine, settings.sql_instrumentation, settings.sql_log_sample_every
+    )
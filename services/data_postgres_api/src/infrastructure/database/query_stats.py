@@ -0,0 +1,194 @@
+"""In-process SQL statement statistics (pg_stat_statements style).
+
+Fed by the cursor execute hooks in ``connection.py`` (every mode except
+SQL_INSTRUMENTATION=off):
+
+- ``QUERY_STATS`` aggregates calls, total/mean/max time and rows per
+  normalized statement in a bounded table, served by the admin API.
+- ``track_request_queries()`` collects statement count and DB time of the
+  current request (contextvar), used for the X-Query-Count / X-DB-Time
+  debug headers.
+
+SQLAlchemy runs the sync hooks in a greenlet that shares the calling
+task's contextvars, so per-request tracking follows the request even
+through the async engine.
+"""
+import re
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
+
+# Default size of the statistics table (distinct normalized statements)
+DEFAULT_MAX_ENTRIES = 500
+
+# Share of least-called entries dropped when the table is full
+_EVICT_FRACTION = 0.05
+
+QueryStatsOrder = Literal["total_time", "mean_time", "max_time", "calls", "rows"]
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|\?")
+_NUMBER = re.compile(r"(?<![\w$.])\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_REPEATED_GROUP = re.compile(r"(\((?:\?|\?, \.\.\.)\))(?:\s*,\s*\1)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_statement(statement: str) -> str:
+    """
+    Reduce SQL to its shape so executions with different values group together.
+
+    Literals and bind placeholders become ``?``, IN lists and multi-row
+    VALUES collapse to one element, whitespace is squeezed.
+
+    Args:
+        statement: SQL as sent to the driver
+
+    Returns:
+        Normalized statement text
+    """
+    text = _STRING_LITERAL.sub("?", statement)
+    text = _PLACEHOLDER.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _VALUE_LIST.sub("(?, ...)", text)
+    text = _REPEATED_GROUP.sub(r"\1, ...", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+@dataclass(slots=True)
+class StatementStats:
+    """Aggregated executions of one normalized statement."""
+
+    query: str
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    rows: int = 0
+
+    @property
+    def mean_time(self) -> float:
+        """Mean execution time in seconds."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+class QueryStatsAggregator:
+    """Bounded table of per-statement execution statistics."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize aggregator.
+
+        Args:
+            max_entries: Maximum number of distinct statements kept
+        """
+        self.max_entries = max_entries
+        self.evicted = 0
+        self._entries: dict[str, StatementStats] = {}
+
+    def record(self, statement: str, duration: float, rows: int) -> None:
+        """
+        Add one execution.
+
+        Args:
+            statement: SQL as sent to the driver
+            duration: Execution time in seconds
+            rows: Rows returned or affected (negative when unknown)
+        """
+        query = normalize_statement(statement)
+        entry = self._entries.get(query)
+        if entry is None:
+            if len(self._entries) >= self.max_entries:
+                self._evict()
+            entry = self._entries[query] = StatementStats(query)
+
+        entry.calls += 1
+        entry.total_time += duration
+        if duration > entry.max_time:
+            entry.max_time = duration
+        if rows > 0:
+            entry.rows += rows
+
+    def _evict(self) -> None:
+        """Drop the least-called entries to make room (like pg_stat_statements)."""
+        count = max(1, int(self.max_entries * _EVICT_FRACTION))
+        least_called = sorted(self._entries.values(), key=lambda e: (e.calls, e.total_time))
+        for entry in least_called[:count]:
+            del self._entries[entry.query]
+        self.evicted += count
+
+    def snapshot(
+        self,
+        order_by: QueryStatsOrder = "total_time",
+        limit: int | None = None
+    ) -> list[StatementStats]:
+        """
+        Get statistics sorted descending by ``order_by``.
+
+        Args:
+            order_by: Sort key
+            limit: Maximum entries to return (all when None)
+
+        Returns:
+            Copies of the statistics entries
+        """
+        entries = sorted(
+            self._entries.values(), key=lambda e: getattr(e, order_by), reverse=True
+        )
+        return [
+            StatementStats(e.query, e.calls, e.total_time, e.max_time, e.rows)
+            for e in entries[:limit]
+        ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def reset(self) -> None:
+        """Discard all statistics."""
+        self._entries.clear()
+        self.evicted = 0
+
+
+@dataclass(slots=True)
+class RequestQueries:
+    """Statements executed on behalf of one request."""
+
+    count: int = 0
+    total_time: float = 0.0
+
+
+_current_request: ContextVar[RequestQueries | None] = ContextVar(
+    "current_request_queries", default=None
+)
+
+
+def track_request_queries() -> RequestQueries:
+    """
+    Start collecting statements of the current request (task context).
+
+    Returns:
+        Accumulator updated by every statement executed in this context
+    """
+    queries = RequestQueries()
+    _current_request.set(queries)
+    return queries
+
+
+def record_query(statement: str, duration: float, rows: int) -> None:
+    """
+    Record one executed statement (called from the cursor hook).
+
+    Args:
+        statement: SQL as sent to the driver
+        duration: Execution time in seconds
+        rows: Rows returned or affected (negative when unknown)
+    """
+    QUERY_STATS.record(statement, duration, rows)
+    queries = _current_request.get()
+    if queries is not None:
+        queries.count += 1
+        queries.total_time += duration
+
+
+QUERY_STATS = QueryStatsAggregator()
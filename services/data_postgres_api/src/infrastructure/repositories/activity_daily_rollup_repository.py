@@ -0,0 +1,270 @@
+"""Activity daily rollup repository."""
+import logging
+from datetime import date
+
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models.activity_daily_rollup import ActivityDailyRollup
+from src.domain.models.category import Category
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL SQLSTATE invalid_parameter_value, raised by AT TIME ZONE for an
+# unknown zone name (users created before timezone validation)
+INVALID_PARAMETER_VALUE_SQLSTATE = "22023"
+
+
+# Splits every matching activity into per-local-day segments. Day boundaries
+# are local midnights of users.timezone converted back to timestamptz, so DST
+# days are 23/25 hours long. Minutes per segment are cumulative differences
+# anchored at activities.duration_minutes, so segments of one activity always
+# sum to its stored duration. "started" marks the segment the activity starts
+# in (activity_count counts each activity once).
+_SEGMENTS_SQL = """
+    SELECT a.user_id,
+           seg.local_date,
+           a.category_id,
+           CASE WHEN seg.seg_end = a.end_time THEN a.duration_minutes
+                ELSE round(extract(epoch FROM seg.seg_end - a.start_time) / 60)::int
+           END
+           - round(extract(epoch FROM seg.seg_start - a.start_time) / 60)::int AS minutes,
+           (seg.seg_start = a.start_time)::int AS started
+    FROM activities a
+    JOIN users u ON u.id = a.user_id
+    CROSS JOIN LATERAL (
+        SELECT d::date AS local_date,
+               greatest(a.start_time, d AT TIME ZONE u.timezone) AS seg_start,
+               least(a.end_time, (d + interval '1 day') AT TIME ZONE u.timezone) AS seg_end
+        FROM generate_series(
+            date_trunc('day', a.start_time AT TIME ZONE u.timezone),
+            (a.end_time AT TIME ZONE u.timezone) - interval '1 microsecond',
+            interval '1 day'
+        ) AS d
+    ) AS seg
+    WHERE {where}
+"""
+
+_INSERT_SQL = """
+    INSERT INTO activity_daily_rollup
+        (user_id, local_date, category_id, total_minutes, activity_count)
+    SELECT user_id, local_date, category_id, sum(minutes), sum(started)
+    FROM ({segments}) AS s
+    GROUP BY user_id, local_date, category_id
+"""
+
+# Incremental maintenance: add freshly inserted activities to existing totals
+_APPLY_ACTIVITIES = text(
+    _INSERT_SQL.format(segments=_SEGMENTS_SQL.format(where="a.id = ANY(:activity_ids)"))
+    + """
+    ON CONFLICT (user_id, local_date, category_id) DO UPDATE
+    SET total_minutes = activity_daily_rollup.total_minutes + EXCLUDED.total_minutes,
+        activity_count = activity_daily_rollup.activity_count + EXCLUDED.activity_count
+    """
+)
+
+_REBUILD_ALL = text(_INSERT_SQL.format(segments=_SEGMENTS_SQL.format(where="TRUE")))
+_REBUILD_USER = text(_INSERT_SQL.format(segments=_SEGMENTS_SQL.format(where="a.user_id = :user_id")))
+
+
+class ActivityDailyRollupRepository:
+    """Repository for the activity_daily_rollup table.
+
+    Not a BaseRepository: rows are never created from API payloads, only
+    derived from activities with set-based SQL.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize repository.
+
+        Args:
+            session: Async database session (shared with activity writes)
+        """
+        self.session = session
+
+    async def apply_activities(self, activity_ids: list[int]) -> None:
+        """
+        Add newly inserted activities to the daily totals.
+
+        Must run in the transaction that inserted the activities so the
+        rollup commits (or rolls back) together with them.
+
+        Args:
+            activity_ids: IDs of activities that are not yet rolled up
+
+        Raises:
+            ValueError: If an activity's user has a time zone PostgreSQL does
+                not recognize (the transaction must be rolled back)
+        """
+        if not activity_ids:
+            return
+
+        logger.debug(
+            "Applying activities to daily rollup",
+            extra={
+                "activity_count": len(activity_ids),
+                "operation": "update"
+            }
+        )
+
+        try:
+            await self.session.execute(_APPLY_ACTIVITIES, {"activity_ids": activity_ids})
+        except DBAPIError as e:
+            sqlstate = getattr(e.orig, "sqlstate", None) or getattr(e.orig, "pgcode", None)
+            if sqlstate != INVALID_PARAMETER_VALUE_SQLSTATE:
+                raise
+            logger.warning(
+                "Daily rollup rejected user timezone",
+                extra={
+                    "activity_count": len(activity_ids),
+                    "error": str(e.orig),
+                    "operation": "update"
+                }
+            )
+            # Reported as a client error (400) instead of a 500
+            raise ValueError(
+                "User timezone is not recognized by the database; "
+                "update it to an IANA name (e.g. 'Europe/Moscow')"
+            ) from e
+
+    async def rebuild(self, user_id: int | None = None) -> int:
+        """
+        Recompute daily totals from activities history.
+
+        The table is locked against concurrent incremental updates until
+        the surrounding transaction commits, so activities created while
+        the rebuild runs are neither lost nor counted twice.
+
+        Args:
+            user_id: Rebuild only this user (e.g. after a timezone change);
+                all users when None
+
+        Returns:
+            Number of rollup rows written
+        """
+        logger.info(
+            "Rebuilding activity daily rollup",
+            extra={
+                "user_id": user_id,
+                "operation": "update"
+            }
+        )
+
+        try:
+            await self.session.execute(
+                text("LOCK TABLE activity_daily_rollup IN SHARE ROW EXCLUSIVE MODE")
+            )
+            if user_id is None:
+                await self.session.execute(text("DELETE FROM activity_daily_rollup"))
+                result = await self.session.execute(_REBUILD_ALL)
+            else:
+                await self.session.execute(
+                    text("DELETE FROM activity_daily_rollup WHERE user_id = :user_id"),
+                    {"user_id": user_id}
+                )
+                result = await self.session.execute(_REBUILD_USER, {"user_id": user_id})
+
+            logger.info(
+                "Activity daily rollup rebuilt",
+                extra={
+                    "user_id": user_id,
+                    "row_count": result.rowcount,
+                    "operation": "update"
+                }
+            )
+
+            return result.rowcount
+
+        except Exception as e:
+            logger.error(
+                "Error rebuilding activity daily rollup",
+                extra={
+                    "user_id": user_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "update"
+                },
+                exc_info=True
+            )
+            raise
+
+    async def get_daily_totals(
+        self,
+        user_id: int,
+        start_date: date | None = None,
+        end_date: date | None = None
+    ) -> list[dict]:
+        """
+        Get per-day, per-category totals from the rollup.
+
+        Reads one row per (day, category) instead of scanning activities.
+
+        Args:
+            user_id: User identifier
+            start_date: Optional inclusive first local date
+            end_date: Optional exclusive last local date
+
+        Returns:
+            Rows with bucket (local date), category_id, category_name,
+            total_minutes and activity_count, ordered by date and category
+        """
+        logger.debug(
+            "Retrieving daily rollup totals",
+            extra={
+                "user_id": user_id,
+                "start_date": start_date.isoformat() if start_date else None,
+                "end_date": end_date.isoformat() if end_date else None,
+                "operation": "read"
+            }
+        )
+
+        try:
+            # Rows of deleted categories fall back to uncategorized via the join
+            query = (
+                select(
+                    ActivityDailyRollup.local_date.label("bucket"),
+                    Category.id.label("category_id"),
+                    Category.name.label("category_name"),
+                    func.sum(ActivityDailyRollup.total_minutes).label("total_minutes"),
+                    func.sum(ActivityDailyRollup.activity_count).label("activity_count"),
+                )
+                .outerjoin(Category, Category.id == ActivityDailyRollup.category_id)
+                .where(ActivityDailyRollup.user_id == user_id)
+            )
+            if start_date is not None:
+                query = query.where(ActivityDailyRollup.local_date >= start_date)
+            if end_date is not None:
+                query = query.where(ActivityDailyRollup.local_date < end_date)
+
+            result = await self.session.execute(
+                query
+                .group_by(ActivityDailyRollup.local_date, Category.id, Category.name)
+                .order_by(ActivityDailyRollup.local_date, Category.id)
+            )
+            rows = [dict(row) for row in result.mappings()]
+
+            logger.debug(
+                "Daily rollup totals retrieved",
+                extra={
+                    "user_id": user_id,
+                    "count": len(rows),
+                    "operation": "read"
+                }
+            )
+
+            return rows
+
+        except Exception as e:
+            logger.error(
+                "Error retrieving daily rollup totals",
+                extra={
+                    "user_id": user_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "read"
+                },
+                exc_info=True
+            )
+            raise
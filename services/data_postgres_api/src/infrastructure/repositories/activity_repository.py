@@ -1,16 +1,45 @@
 """Activity repository."""
 import logging
-from sqlalchemy import select, func
+from datetime import datetime, timedelta
+from typing import AsyncIterator
+
+from sqlalchemy import (
+    Date, DateTime, RowMapping, cast, insert, literal, select, func, tuple_, union_all, update
+)
+from sqlalchemy.dialects.postgresql import REAL, REGCONFIG, TSTZRANGE
+from sqlalchemy.exc import DataError, DBAPIError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, with_expression
 from pydantic import BaseModel
 
 from src.domain.models.activity import Activity
+from src.domain.models.category import Category
+from src.domain.models.user import User
+from src.infrastructure.database.admission import is_statement_timeout
 from src.schemas.activity import ActivityCreate
+from src.infrastructure.repositories.activity_daily_rollup_repository import (
+    ActivityDailyRollupRepository
+)
 from src.infrastructure.repositories.base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# First key of pg_advisory_xact_lock(namespace, user_id) for strict creates
+OVERLAP_LOCK_NAMESPACE = 1
+
+# SQLSTATE classes of errors caused by row values: data exception (22),
+# integrity constraint violation (23). asyncpg reports class 22 as a plain
+# DBAPIError, so the class is checked besides the exception type.
+ROW_ERROR_SQLSTATE_CLASSES = ("22", "23")
+
+
+def _is_row_error(error: DBAPIError) -> bool:
+    """Check whether the database rejected row values rather than the statement."""
+    if isinstance(error, (IntegrityError, DataError)):
+        return True
+    sqlstate = getattr(error.orig, "sqlstate", None) or getattr(error.orig, "pgcode", None)
+    return str(sqlstate)[:2] in ROW_ERROR_SQLSTATE_CLASSES
+
 
 # Placeholder update schema for BaseRepository (activities don't have updates)
 class ActivityUpdate(BaseModel):
@@ -23,14 +52,19 @@ class ActivityRepository(BaseRepository[Activity, ActivityCreate, ActivityUpdate
 
     def __init__(self, session: AsyncSession):
         super().__init__(session, Activity)
+        # Daily totals are maintained on the same session/transaction
+        self.rollup = ActivityDailyRollupRepository(session)
 
     async def create(self, data: ActivityCreate) -> Activity:
         """
-        Create a new activity with calculated duration and formatted tags.
+        Create a new activity with calculated duration.
 
         Overrides base create() to add custom logic for:
         - Duration calculation from start_time to end_time
-        - Tag list to comma-separated string conversion
+
+        Like the base create(), this is one INSERT ... RETURNING round trip,
+        followed by one upsert of the daily rollup and one update of
+        users.last_activity_end_time in the same transaction.
 
         Args:
             data: Activity creation data
@@ -38,9 +72,8 @@ class ActivityRepository(BaseRepository[Activity, ActivityCreate, ActivityUpdate
         Returns:
             Created activity with generated ID
         """
-        # Calculate duration in minutes
-        duration = (data.end_time - data.start_time).total_seconds() / 60
-        duration_minutes = round(duration)
+        values = self._build_values(data)
+        duration_minutes = values["duration_minutes"]
 
         logger.debug(
             "Creating activity",
@@ -54,23 +87,11 @@ class ActivityRepository(BaseRepository[Activity, ActivityCreate, ActivityUpdate
         )
 
         try:
-            # Convert tags list to comma-separated string
-            tags_str = None
-            if data.tags:
-                tags_str = ",".join(data.tags)
-
-            activity = Activity(
-                user_id=data.user_id,
-                category_id=data.category_id,
-                description=data.description,
-                tags=tags_str,
-                start_time=data.start_time,
-                end_time=data.end_time,
-                duration_minutes=duration_minutes,
-            )
+            activity = Activity(**values)
             self.session.add(activity)
             await self.session.flush()
-            await self.session.refresh(activity)
+            await self.rollup.apply_activities([activity.id])
+            await self.advance_last_activity_end([activity.id])
 
             logger.info(
                 "Activity created successfully",
@@ -99,17 +120,244 @@ class ActivityRepository(BaseRepository[Activity, ActivityCreate, ActivityUpdate
             )
             raise
 
+    async def bulk_create(
+        self,
+        items: list[ActivityCreate]
+    ) -> tuple[dict[int, Activity], dict[int, str]]:
+        """
+        Create many activities with one multi-row INSERT ... RETURNING.
+
+        The whole batch is first attempted as a single statement inside a
+        SAVEPOINT. If the database rejects row values (e.g. unknown
+        category_id), the batch falls back to row-by-row inserts, each in its
+        own SAVEPOINT, so valid rows are still written and failing rows are
+        reported. Other errors, statement timeouts included, are raised.
+        Created rows are added to the daily rollup and users'
+        last_activity_end_time with one extra statement each.
+
+        Args:
+            items: Validated activity creation data
+
+        Returns:
+            Tuple of (created activities, error messages), both keyed by
+            the position of the item in ``items``
+        """
+        rows = [self._build_values(item) for item in items]
+
+        logger.debug(
+            "Bulk creating activities",
+            extra={
+                "count": len(rows),
+                "operation": "bulk_create"
+            }
+        )
+
+        created: dict[int, Activity] = {}
+        errors: dict[int, str] = {}
+
+        if not rows:
+            return created, errors
+
+        try:
+            try:
+                async with self.session.begin_nested():
+                    result = await self.session.scalars(
+                        insert(Activity).returning(Activity, sort_by_parameter_order=True),
+                        rows
+                    )
+                    created = dict(enumerate(result.all()))
+
+            except DBAPIError as batch_error:
+                if is_statement_timeout(batch_error) or not _is_row_error(batch_error):
+                    # Not caused by a row: retrying row by row would only repeat
+                    # it (timeouts are answered with 503 + Retry-After)
+                    raise
+                logger.warning(
+                    "Bulk activity insert rejected, retrying row by row",
+                    extra={
+                        "count": len(rows),
+                        "error": str(batch_error.orig),
+                        "error_type": type(batch_error.orig).__name__,
+                        "operation": "bulk_create"
+                    }
+                )
+
+                for index, row in enumerate(rows):
+                    try:
+                        async with self.session.begin_nested():
+                            result = await self.session.scalars(
+                                insert(Activity).values(**row).returning(Activity)
+                            )
+                            created[index] = result.one()
+                    except DBAPIError as row_error:
+                        if not _is_row_error(row_error):
+                            raise
+                        errors[index] = str(row_error.orig)
+
+            created_ids = [act.id for act in created.values()]
+            await self.rollup.apply_activities(created_ids)
+            await self.advance_last_activity_end(created_ids)
+
+            logger.info(
+                "Activities bulk created",
+                extra={
+                    "requested_count": len(rows),
+                    "created_count": len(created),
+                    "failed_count": len(errors),
+                    "operation": "bulk_create"
+                }
+            )
+
+        except Exception as e:
+            logger.error(
+                "Error bulk creating activities",
+                extra={
+                    "count": len(rows),
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "bulk_create"
+                },
+                exc_info=True
+            )
+            raise
+
+        return created, errors
+
+    async def copy_create(self, items: list[ActivityCreate]) -> list[int]:
+        """
+        Load many activities with COPY (asyncpg copy_records_to_table).
+
+        COPY has no RETURNING, so IDs are drawn from the activities sequence
+        first (one SELECT nextval() over generate_series) and copied with the
+        rows. The daily rollup and users' last_activity_end_time are then
+        updated for those IDs in the same transaction, as in bulk_create().
+        Unlike bulk_create() there is no per-row fallback: any row the
+        database rejects fails the whole COPY, so items must be validated.
+
+        Args:
+            items: Validated activity creation data
+
+        Returns:
+            IDs of the created activities, in input order
+        """
+        if not items:
+            return []
+
+        logger.debug(
+            "Copying activities",
+            extra={
+                "count": len(items),
+                "operation": "bulk_create"
+            }
+        )
+
+        try:
+            result = await self.session.scalars(
+                select(func.nextval(func.pg_get_serial_sequence("activities", "id")))
+                .select_from(func.generate_series(1, len(items)))
+            )
+            activity_ids = list(result.all())
+
+            rows = [self._build_values(item) for item in items]
+            columns = ["id", *rows[0]]
+            connection = await self.session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                Activity.__tablename__,
+                records=[
+                    (activity_id, *row.values())
+                    for activity_id, row in zip(activity_ids, rows)
+                ],
+                columns=columns
+            )
+
+            await self.rollup.apply_activities(activity_ids)
+            await self.advance_last_activity_end(activity_ids)
+
+            logger.info(
+                "Activities copied",
+                extra={
+                    "count": len(activity_ids),
+                    "operation": "bulk_create"
+                }
+            )
+
+            return activity_ids
+
+        except Exception as e:
+            logger.error(
+                "Error copying activities",
+                extra={
+                    "count": len(items),
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "bulk_create"
+                },
+                exc_info=True
+            )
+            raise
+
+    async def advance_last_activity_end(self, activity_ids: list[int]) -> None:
+        """
+        Move users.last_activity_end_time forward to the given activities.
+
+        One UPDATE ... FROM per call: the latest end_time of the activities
+        is grouped per user and applied with GREATEST(), so the pointer never
+        goes back when an older activity is inserted later.
+
+        Args:
+            activity_ids: IDs of activities inserted in this transaction
+        """
+        if not activity_ids:
+            return
+
+        try:
+            latest = (
+                select(Activity.user_id, func.max(Activity.end_time).label("end_time"))
+                .where(Activity.id.in_(activity_ids))
+                .group_by(Activity.user_id)
+                .subquery("latest")
+            )
+            await self.session.execute(
+                update(User)
+                .where(User.id == latest.c.user_id)
+                .values(
+                    last_activity_end_time=func.greatest(
+                        User.last_activity_end_time, latest.c.end_time
+                    )
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+        except Exception as e:
+            logger.error(
+                "Error updating users last activity end time",
+                extra={
+                    "count": len(activity_ids),
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "update"
+                },
+                exc_info=True
+            )
+            raise
+
     async def get_recent_by_user(
         self,
         user_id: int,
-        limit: int = 10
+        limit: int = 10,
+        before: tuple[datetime, int] | None = None
     ) -> list[Activity]:
         """
         Get recent activities for a user with category data.
 
+        Uses keyset pagination: when ``before`` is given, only activities
+        strictly older than that (start_time, id) position are returned.
+
         Args:
             user_id: User identifier
             limit: Maximum activities to return
+            before: Optional (start_time, id) keyset position to page from
 
         Returns:
             List of activities with category relationship loaded, ordered by most recent first
@@ -119,16 +367,23 @@ class ActivityRepository(BaseRepository[Activity, ActivityCreate, ActivityUpdate
             extra={
                 "user_id": user_id,
                 "limit": limit,
+                "paginated": before is not None,
                 "operation": "read"
             }
         )
 
         try:
-            result = await self.session.execute(
+            query = (
                 select(Activity)
                 .options(joinedload(Activity.category))
                 .where(Activity.user_id == user_id)
-                .order_by(Activity.start_time.desc())
+            )
+            if before is not None:
+                query = query.where(tuple_(Activity.start_time, Activity.id) < before)
+
+            result = await self.session.execute(
+                query
+                .order_by(Activity.start_time.desc(), Activity.id.desc())
                 .limit(limit)
             )
             activities = list(result.scalars().all())
@@ -163,7 +418,8 @@ class ActivityRepository(BaseRepository[Activity, ActivityCreate, ActivityUpdate
         self,
         user_id: int,
         category_id: int,
-        limit: int = 10
+        limit: int = 10,
+        before: tuple[datetime, int] | None = None
     ) -> list[Activity]:
         """
         Get recent activities for a user filtered by category with category data.
@@ -172,6 +428,7 @@ class ActivityRepository(BaseRepository[Activity, ActivityCreate, ActivityUpdate
             user_id: User identifier
             category_id: Category identifier to filter by
             limit: Maximum activities to return
+            before: Optional (start_time, id) keyset position to page from
 
         Returns:
             List of activities with category relationship loaded for the specified category, ordered by most recent first
@@ -182,16 +439,23 @@ class ActivityRepository(BaseRepository[Activity, ActivityCreate, ActivityUpdate
                 "user_id": user_id,
                 "category_id": category_id,
                 "limit": limit,
+                "paginated": before is not None,
                 "operation": "read"
             }
         )
 
         try:
-            result = await self.session.execute(
+            query = (
                 select(Activity)
                 .options(joinedload(Activity.category))
                 .where(Activity.user_id == user_id, Activity.category_id == category_id)
-                .order_by(Activity.start_time.desc())
+            )
+            if before is not None:
+                query = query.where(tuple_(Activity.start_time, Activity.id) < before)
+
+            result = await self.session.execute(
+                query
+                .order_by(Activity.start_time.desc(), Activity.id.desc())
                 .limit(limit)
             )
             activities = list(result.scalars().all())
@@ -223,3 +487,782 @@ class ActivityRepository(BaseRepository[Activity, ActivityCreate, ActivityUpdate
                 exc_info=True
             )
             raise
+
+    async def stream_for_export(
+        self,
+        user_id: int,
+        batch_size: int = 1000
+    ) -> AsyncIterator[list[RowMapping]]:
+        """
+        Stream all of a user's activities in chronological order, in batches.
+
+        Reads plain columns (category name LEFT JOINed, no ORM objects)
+        through a server-side cursor (AsyncSession.stream) with yield_per,
+        so memory is bounded by ``batch_size`` whatever the history length.
+        Requires a session inside a transaction (see read_stream_session).
+
+        Args:
+            user_id: User identifier
+            batch_size: Rows fetched from the cursor per round trip
+
+        Yields:
+            Lists of up to ``batch_size`` row mappings with id, category_id,
+            category_name, description, tags, start_time, end_time,
+            duration_minutes and created_at
+        """
+        logger.debug(
+            "Streaming activities for export",
+            extra={
+                "user_id": user_id,
+                "batch_size": batch_size,
+                "operation": "read"
+            }
+        )
+
+        count = 0
+        try:
+            result = await self.session.stream(
+                select(
+                    Activity.id,
+                    Activity.category_id,
+                    Category.name.label("category_name"),
+                    Activity.description,
+                    Activity.tags,
+                    Activity.start_time,
+                    Activity.end_time,
+                    Activity.duration_minutes,
+                    Activity.created_at,
+                )
+                .outerjoin(Category, Activity.category_id == Category.id)
+                .where(Activity.user_id == user_id)
+                .order_by(Activity.start_time, Activity.id)
+                .execution_options(yield_per=batch_size)
+            )
+            async for rows in result.mappings().partitions():
+                count += len(rows)
+                yield rows
+
+            logger.info(
+                "Activities streamed for export",
+                extra={
+                    "user_id": user_id,
+                    "count": count,
+                    "operation": "read"
+                }
+            )
+
+        except Exception as e:
+            logger.error(
+                "Error streaming activities for export",
+                extra={
+                    "user_id": user_id,
+                    "streamed_count": count,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "read"
+                },
+                exc_info=True
+            )
+            raise
+
+    async def get_overlapping(
+        self,
+        user_id: int,
+        start: datetime | None,
+        end: datetime | None,
+        category_id: int | None = None,
+        limit: int = 10,
+        before: tuple[datetime, int] | None = None
+    ) -> list[Activity]:
+        """
+        Get activities intersecting the [start, end) window, most recent first.
+
+        The overlap test is tstzrange(start_time, end_time) && tstzrange(start,
+        end), served by the ix_activities_user_period GiST index. A missing
+        bound means unbounded on that side.
+
+        Args:
+            user_id: User identifier
+            start: Inclusive window start (None: unbounded)
+            end: Exclusive window end (None: unbounded)
+            category_id: Optional category to filter by
+            limit: Maximum activities to return
+            before: Optional (start_time, id) keyset position to page from
+
+        Returns:
+            List of activities with category relationship loaded
+        """
+        logger.debug(
+            "Retrieving activities in time window",
+            extra={
+                "user_id": user_id,
+                "start": start.isoformat() if start else None,
+                "end": end.isoformat() if end else None,
+                "category_id": category_id,
+                "limit": limit,
+                "paginated": before is not None,
+                "operation": "read"
+            }
+        )
+
+        try:
+            query = (
+                select(Activity)
+                .options(joinedload(Activity.category))
+                .where(Activity.user_id == user_id, self._overlaps(start, end))
+            )
+            if category_id is not None:
+                query = query.where(Activity.category_id == category_id)
+            if before is not None:
+                query = query.where(tuple_(Activity.start_time, Activity.id) < before)
+
+            result = await self.session.execute(
+                query
+                .order_by(Activity.start_time.desc(), Activity.id.desc())
+                .limit(limit)
+            )
+            activities = list(result.scalars().all())
+
+            logger.debug(
+                "Activities in time window retrieved",
+                extra={
+                    "user_id": user_id,
+                    "count": len(activities),
+                    "operation": "read"
+                }
+            )
+
+            return activities
+
+        except Exception as e:
+            logger.error(
+                "Error retrieving activities in time window",
+                extra={
+                    "user_id": user_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "read"
+                },
+                exc_info=True
+            )
+            raise
+
+    async def find_overlapping_ids(
+        self,
+        user_id: int,
+        start: datetime,
+        end: datetime
+    ) -> list[int]:
+        """
+        Lock the user's activity writes and find activities overlapping [start, end).
+
+        Takes a transaction-scoped advisory lock per user first, so concurrent
+        strict creates for the same user are serialized until commit and an
+        overlap check followed by an insert behaves like an exclusion
+        constraint, without requiring existing history to be overlap-free.
+
+        Args:
+            user_id: User identifier
+            start: Inclusive start of the new activity
+            end: Exclusive end of the new activity
+
+        Returns:
+            IDs of overlapping activities, oldest first
+        """
+        logger.debug(
+            "Checking activity overlaps",
+            extra={"user_id": user_id, "operation": "read"}
+        )
+
+        try:
+            await self.session.execute(
+                select(func.pg_advisory_xact_lock(OVERLAP_LOCK_NAMESPACE, user_id))
+            )
+            result = await self.session.scalars(
+                select(Activity.id)
+                .where(Activity.user_id == user_id, self._overlaps(start, end))
+                .order_by(Activity.start_time, Activity.id)
+            )
+            overlapping = list(result.all())
+
+            logger.debug(
+                "Activity overlaps checked",
+                extra={
+                    "user_id": user_id,
+                    "overlap_count": len(overlapping),
+                    "operation": "read"
+                }
+            )
+
+            return overlapping
+
+        except Exception as e:
+            logger.error(
+                "Error checking activity overlaps",
+                extra={
+                    "user_id": user_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "read"
+                },
+                exc_info=True
+            )
+            raise
+
+    @staticmethod
+    def _overlaps(start: datetime | None, end: datetime | None):
+        """Build the indexed period && tstzrange(start, end) condition."""
+        period = func.tstzrange(Activity.start_time, Activity.end_time, type_=TSTZRANGE)
+        return period.op("&&")(func.tstzrange(start, end, type_=TSTZRANGE))
+
+    async def get_gaps(
+        self,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+        min_minutes: int = 0
+    ) -> list[dict]:
+        """
+        Find intervals of [start, end) not covered by any activity.
+
+        Computed in one query: activities intersecting the window are
+        clipped to it, zero-length markers are added at both window edges,
+        and each row is compared with LAG() of the running max(end_time) of
+        the rows before it, so overlapping and nested activities do not
+        produce false gaps.
+
+        Args:
+            user_id: User identifier
+            start: Inclusive window start
+            end: Exclusive window end
+            min_minutes: Only gaps at least this long
+
+        Returns:
+            Rows with gap_start and gap_end, in chronological order
+        """
+        logger.debug(
+            "Finding activity gaps",
+            extra={
+                "user_id": user_id,
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "min_minutes": min_minutes,
+                "operation": "read"
+            }
+        )
+
+        try:
+            edge_start = literal(start, DateTime(timezone=True))
+            edge_end = literal(end, DateTime(timezone=True))
+            spans = union_all(
+                select(
+                    func.greatest(Activity.start_time, edge_start).label("span_start"),
+                    func.least(Activity.end_time, edge_end).label("span_end"),
+                ).where(Activity.user_id == user_id, self._overlaps(start, end)),
+                select(edge_start, edge_start),
+                select(edge_end, edge_end),
+            ).subquery("spans")
+
+            order = (spans.c.span_start, spans.c.span_end)
+            covered = select(
+                spans.c.span_start,
+                func.max(spans.c.span_end).over(order_by=order).label("covered_until"),
+            ).subquery("covered")
+            lagged = select(
+                covered.c.span_start,
+                func.lag(covered.c.covered_until)
+                .over(order_by=(covered.c.span_start, covered.c.covered_until))
+                .label("previous_end"),
+            ).subquery("lagged")
+
+            result = await self.session.execute(
+                select(
+                    lagged.c.previous_end.label("gap_start"),
+                    lagged.c.span_start.label("gap_end"),
+                )
+                .where(
+                    lagged.c.span_start > lagged.c.previous_end,
+                    lagged.c.span_start - lagged.c.previous_end
+                    >= timedelta(minutes=min_minutes),
+                )
+                .order_by(lagged.c.span_start)
+            )
+            gaps = [dict(row) for row in result.mappings()]
+
+            logger.debug(
+                "Activity gaps found",
+                extra={
+                    "user_id": user_id,
+                    "count": len(gaps),
+                    "operation": "read"
+                }
+            )
+
+            return gaps
+
+        except Exception as e:
+            logger.error(
+                "Error finding activity gaps",
+                extra={
+                    "user_id": user_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "read"
+                },
+                exc_info=True
+            )
+            raise
+
+    async def search(
+        self,
+        user_id: int,
+        query: str,
+        limit: int = 10,
+        before: tuple[float, datetime, int] | None = None
+    ) -> list[Activity]:
+        """
+        Full-text search over activity descriptions, most relevant first.
+
+        The query is parsed with websearch_to_tsquery() in both the 'russian'
+        and 'simple' configurations (OR-ed), matching how search_vector is
+        built, and served by the (user_id, search_vector) GIN index. Ties in
+        rank are broken by recency.
+
+        Args:
+            user_id: User identifier
+            query: Search text (quotes, OR and -word are supported)
+            limit: Maximum activities to return
+            before: Optional (rank, start_time, id) keyset position to page from
+
+        Returns:
+            Activities with category loaded and search_rank populated
+        """
+        logger.debug(
+            "Searching activities",
+            extra={
+                "user_id": user_id,
+                "query_length": len(query),
+                "limit": limit,
+                "paginated": before is not None,
+                "operation": "read"
+            }
+        )
+
+        try:
+            # Generated column, not mapped on Activity (kept out of RETURNING)
+            search_vector = Activity.__table__.c.search_vector
+            ts_query = (
+                func.websearch_to_tsquery(literal("russian", REGCONFIG), query)
+                .op("||")(func.websearch_to_tsquery(literal("simple", REGCONFIG), query))
+            )
+            rank = func.ts_rank(search_vector, ts_query, type_=REAL)
+
+            stmt = (
+                select(Activity)
+                .options(joinedload(Activity.category), with_expression(Activity.search_rank, rank))
+                .where(Activity.user_id == user_id, search_vector.op("@@")(ts_query))
+            )
+            if before is not None:
+                stmt = stmt.where(tuple_(rank, Activity.start_time, Activity.id) < before)
+
+            result = await self.session.execute(
+                stmt
+                .order_by(rank.desc(), Activity.start_time.desc(), Activity.id.desc())
+                .limit(limit)
+            )
+            activities = list(result.scalars().all())
+
+            logger.debug(
+                "Activities searched",
+                extra={
+                    "user_id": user_id,
+                    "count": len(activities),
+                    "operation": "read"
+                }
+            )
+
+            return activities
+
+        except Exception as e:
+            logger.error(
+                "Error searching activities",
+                extra={
+                    "user_id": user_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "read"
+                },
+                exc_info=True
+            )
+            raise
+
+    async def get_recent_descriptions(
+        self,
+        user_id: int,
+        category_id: int | None = None,
+        prefix: str | None = None,
+        limit: int = 10
+    ) -> list[dict]:
+        """
+        Get distinct descriptions, most recently used first, with use counts.
+
+        DISTINCT ON (description) keeps the latest activity per description;
+        count(*) OVER (PARTITION BY description) is evaluated before it, so
+        every kept row carries how often the description was used. A prefix
+        is matched case-insensitively with ILIKE, served by the trigram index.
+
+        Args:
+            user_id: User identifier
+            category_id: Optional category to restrict to
+            prefix: Optional case-insensitive description prefix
+            limit: Maximum descriptions to return
+
+        Returns:
+            Rows with description, use_count, last_used_at, last_activity_id
+            and the latest activity's category_id/category_name, most
+            recently used first
+        """
+        logger.debug(
+            "Retrieving recent descriptions",
+            extra={
+                "user_id": user_id,
+                "category_id": category_id,
+                "has_prefix": bool(prefix),
+                "limit": limit,
+                "operation": "read"
+            }
+        )
+
+        try:
+            latest = (
+                select(
+                    Activity.description,
+                    func.count().over(partition_by=Activity.description).label("use_count"),
+                    Activity.start_time.label("last_used_at"),
+                    Activity.id.label("last_activity_id"),
+                    Activity.category_id,
+                )
+                .distinct(Activity.description)
+                .where(Activity.user_id == user_id)
+                .order_by(Activity.description, Activity.start_time.desc(), Activity.id.desc())
+            )
+            if category_id is not None:
+                latest = latest.where(Activity.category_id == category_id)
+            if prefix:
+                latest = latest.where(
+                    Activity.description.ilike(self._escape_like(prefix) + "%")
+                )
+            latest = latest.subquery("latest")
+
+            result = await self.session.execute(
+                select(latest, Category.name.label("category_name"))
+                .outerjoin(Category, Category.id == latest.c.category_id)
+                .order_by(latest.c.last_used_at.desc(), latest.c.last_activity_id.desc())
+                .limit(limit)
+            )
+            rows = [dict(row) for row in result.mappings()]
+
+            logger.debug(
+                "Recent descriptions retrieved",
+                extra={
+                    "user_id": user_id,
+                    "count": len(rows),
+                    "operation": "read"
+                }
+            )
+
+            return rows
+
+        except Exception as e:
+            logger.error(
+                "Error retrieving recent descriptions",
+                extra={
+                    "user_id": user_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "read"
+                },
+                exc_info=True
+            )
+            raise
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        """Escape LIKE wildcards with backslash (PostgreSQL's default escape)."""
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    async def get_by_tag(
+        self,
+        user_id: int,
+        tag: str,
+        limit: int = 10,
+        before: tuple[datetime, int] | None = None
+    ) -> list[Activity]:
+        """
+        Get a user's activities carrying a tag, most recent first.
+
+        Filters with ``tags @> ARRAY[tag]`` so the (user_id, tags) GIN index
+        is used. Paginated by (start_time, id) keyset like get_recent_by_user().
+
+        Args:
+            user_id: User identifier
+            tag: Exact tag to match
+            limit: Maximum activities to return
+            before: Optional (start_time, id) keyset position to page from
+
+        Returns:
+            List of activities with category relationship loaded
+        """
+        logger.debug(
+            "Retrieving activities by tag",
+            extra={
+                "user_id": user_id,
+                "tag": tag,
+                "limit": limit,
+                "paginated": before is not None,
+                "operation": "read"
+            }
+        )
+
+        try:
+            query = (
+                select(Activity)
+                .options(joinedload(Activity.category))
+                .where(Activity.user_id == user_id, Activity.tags.contains([tag]))
+            )
+            if before is not None:
+                query = query.where(tuple_(Activity.start_time, Activity.id) < before)
+
+            result = await self.session.execute(
+                query
+                .order_by(Activity.start_time.desc(), Activity.id.desc())
+                .limit(limit)
+            )
+            activities = list(result.scalars().all())
+
+            logger.debug(
+                "Activities by tag retrieved",
+                extra={
+                    "user_id": user_id,
+                    "tag": tag,
+                    "count": len(activities),
+                    "operation": "read"
+                }
+            )
+
+            return activities
+
+        except Exception as e:
+            logger.error(
+                "Error retrieving activities by tag",
+                extra={
+                    "user_id": user_id,
+                    "tag": tag,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "read"
+                },
+                exc_info=True
+            )
+            raise
+
+    async def get_top_tags(
+        self,
+        user_id: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 20
+    ) -> list[dict]:
+        """
+        Get a user's tags ranked by total tracked minutes.
+
+        Each activity's tags are expanded with unnest() and grouped, so an
+        activity with several tags counts its full duration towards each.
+
+        Args:
+            user_id: User identifier
+            start: Optional inclusive start_time bound
+            end: Optional exclusive start_time bound
+            limit: Maximum tags to return
+
+        Returns:
+            Rows with tag, total_minutes and activity_count, largest total first
+        """
+        logger.debug(
+            "Retrieving top tags",
+            extra={
+                "user_id": user_id,
+                "start": start.isoformat() if start else None,
+                "end": end.isoformat() if end else None,
+                "limit": limit,
+                "operation": "read"
+            }
+        )
+
+        try:
+            tag = func.unnest(Activity.tags).column_valued("tag")
+            query = (
+                select(
+                    tag,
+                    func.sum(Activity.duration_minutes).label("total_minutes"),
+                    func.count().label("activity_count"),
+                )
+                .select_from(Activity)
+                .where(Activity.user_id == user_id)
+            )
+            if start is not None:
+                query = query.where(Activity.start_time >= start)
+            if end is not None:
+                query = query.where(Activity.start_time < end)
+
+            result = await self.session.execute(
+                query
+                .group_by(tag)
+                .order_by(func.sum(Activity.duration_minutes).desc(), tag)
+                .limit(limit)
+            )
+            rows = [dict(row) for row in result.mappings()]
+
+            logger.debug(
+                "Top tags retrieved",
+                extra={
+                    "user_id": user_id,
+                    "count": len(rows),
+                    "operation": "read"
+                }
+            )
+
+            return rows
+
+        except Exception as e:
+            logger.error(
+                "Error retrieving top tags",
+                extra={
+                    "user_id": user_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "read"
+                },
+                exc_info=True
+            )
+            raise
+
+    async def get_stats(
+        self,
+        user_id: int,
+        period: str,
+        start: datetime | None = None,
+        end: datetime | None = None
+    ) -> list[dict]:
+        """
+        Aggregate activity durations per category and local time bucket.
+
+        Everything is computed by PostgreSQL in a single GROUP BY query:
+        start_time is converted to the user's own timezone (AT TIME ZONE
+        users.timezone) and truncated to the period. An activity counts
+        towards the bucket it starts in.
+
+        Args:
+            user_id: User identifier
+            period: Bucket size - "day", "week" (ISO, starts Monday) or "month"
+            start: Optional inclusive lower bound on start_time
+            end: Optional exclusive upper bound on start_time
+
+        Returns:
+            Rows with bucket (local date), category_id, category_name,
+            total_minutes and activity_count, ordered by bucket and category
+        """
+        logger.debug(
+            "Aggregating activity stats",
+            extra={
+                "user_id": user_id,
+                "period": period,
+                "start": start.isoformat() if start else None,
+                "end": end.isoformat() if end else None,
+                "operation": "read"
+            }
+        )
+
+        try:
+            local_start = Activity.start_time.op("AT TIME ZONE")(User.timezone)
+            # Period is rendered inline so SELECT and GROUP BY expressions match
+            bucket = cast(
+                func.date_trunc(literal(period, literal_execute=True), local_start),
+                Date
+            ).label("bucket")
+
+            query = (
+                select(
+                    bucket,
+                    Activity.category_id,
+                    Category.name.label("category_name"),
+                    func.sum(Activity.duration_minutes).label("total_minutes"),
+                    func.count(Activity.id).label("activity_count"),
+                )
+                .join(User, User.id == Activity.user_id)
+                .outerjoin(Category, Category.id == Activity.category_id)
+                .where(Activity.user_id == user_id)
+            )
+            if start is not None:
+                query = query.where(Activity.start_time >= start)
+            if end is not None:
+                query = query.where(Activity.start_time < end)
+
+            result = await self.session.execute(
+                query
+                .group_by(bucket, Activity.category_id, Category.name)
+                .order_by(bucket, Activity.category_id)
+            )
+            rows = [dict(row) for row in result.mappings()]
+
+            logger.debug(
+                "Activity stats aggregated",
+                extra={
+                    "user_id": user_id,
+                    "period": period,
+                    "count": len(rows),
+                    "operation": "read"
+                }
+            )
+
+            return rows
+
+        except Exception as e:
+            logger.error(
+                "Error aggregating activity stats",
+                extra={
+                    "user_id": user_id,
+                    "period": period,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "read"
+                },
+                exc_info=True
+            )
+            raise
+
+    @staticmethod
+    def _build_values(data: ActivityCreate) -> dict:
+        """
+        Build activities row values from creation data.
+
+        Calculates duration in minutes; tags (already normalized by the
+        schema) are stored as a text[] array.
+
+        Args:
+            data: Activity creation data
+
+        Returns:
+            Column values for an activities row
+        """
+        duration = (data.end_time - data.start_time).total_seconds() / 60
+
+        return {
+            "user_id": data.user_id,
+            "category_id": data.category_id,
+            "description": data.description,
+            "tags": data.tags,
+            "start_time": data.start_time,
+            "end_time": data.end_time,
+            "duration_minutes": round(duration),
+        }
@@ -6,8 +6,8 @@ code duplication across all repository implementations.
 """
 
 import logging
-from typing import TypeVar, Generic, Type, Optional
-from sqlalchemy import select, delete
+from typing import Any, TypeVar, Generic, Type, Optional
+from sqlalchemy import select, delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
@@ -119,6 +119,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         Create new entity.
 
+        Single round trip: flush() emits INSERT ... RETURNING, which loads
+        the generated ID and server defaults (see Base eager_defaults).
+
         Args:
             data: Creation data (Pydantic schema)
 
@@ -137,7 +140,6 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             entity = self.model(**data.model_dump())
             self.session.add(entity)
             await self.session.flush()
-            await self.session.refresh(entity)
 
             entity_id = getattr(entity, "id", None)
 
@@ -168,6 +170,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         Update entity by ID.
 
+        Single round trip: issues UPDATE ... RETURNING and builds the entity
+        from the returned row instead of SELECT + UPDATE + SELECT.
+
         Args:
             id: Entity ID
             data: Update data (Pydantic schema)
@@ -188,7 +193,12 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         )
 
         try:
-            entity = await self.get_by_id(id)
+            if not update_data:
+                # Nothing to write - UPDATE with empty SET is invalid SQL
+                entity = await self.get_by_id(id)
+            else:
+                entity = await self._update_returning(self.model.id == id, update_data)
+
             if not entity:
                 logger.warning(
                     "Cannot update entity - not found",
@@ -200,22 +210,12 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 )
                 return None
 
-            # Track changed fields
-            changed_fields = []
-            for field, value in update_data.items():
-                if hasattr(entity, field) and getattr(entity, field) != value:
-                    changed_fields.append(field)
-                    setattr(entity, field, value)
-
-            await self.session.flush()
-            await self.session.refresh(entity)
-
             logger.info(
                 "Entity updated successfully",
                 extra={
                     "entity_type": self.model.__name__,
                     "entity_id": id,
-                    "changed_fields": changed_fields,
+                    "changed_fields": list(update_data.keys()),
                     "operation": "update"
                 }
             )
@@ -236,6 +236,33 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             )
             raise
 
+    async def _update_returning(
+        self,
+        where_clause: Any,
+        values: dict[str, Any]
+    ) -> Optional[ModelType]:
+        """
+        Execute UPDATE ... RETURNING for a single row.
+
+        Entities already present in the session identity map are refreshed
+        with the returned values (populate_existing).
+
+        Args:
+            where_clause: SQLAlchemy criterion selecting exactly one row
+            values: Column values to set
+
+        Returns:
+            Updated entity built from RETURNING row, None if no row matched
+        """
+        result = await self.session.execute(
+            update(self.model)
+            .where(where_clause)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
     async def delete(self, id: int) -> bool:
         """
         Delete entity by ID.
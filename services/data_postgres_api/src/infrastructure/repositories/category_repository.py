@@ -1,6 +1,7 @@
 """Category repository."""
 import logging
 from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.models.category import Category
@@ -16,6 +17,137 @@ class CategoryRepository(BaseRepository[Category, CategoryCreate, CategoryUpdate
     def __init__(self, session: AsyncSession):
         super().__init__(session, Category)
 
+    async def create_if_absent(self, obj_in: CategoryCreate) -> Category | None:
+        """Create category unless the user already has one with this name.
+
+        Args:
+            obj_in: Category creation data
+
+        Returns:
+            Created category, or None if the name is already taken
+        """
+        created = await self.bulk_create_if_absent([obj_in])
+        return created[0] if created else None
+
+    async def bulk_create_if_absent(self, items: list[CategoryCreate]) -> list[Category]:
+        """Create categories with one INSERT ... ON CONFLICT DO NOTHING RETURNING.
+
+        Duplicates are resolved by the uix_user_category_name constraint
+        instead of a SELECT per name, so concurrent requests cannot both
+        insert the same name and the whole batch is a single statement.
+
+        Args:
+            items: Category creation data
+
+        Returns:
+            Newly created categories in input order; names that already
+            existed (or repeat within ``items``) are skipped
+        """
+        logger.debug(
+            "Bulk creating categories",
+            extra={
+                "count": len(items),
+                "operation": "bulk_create"
+            }
+        )
+
+        if not items:
+            return []
+
+        try:
+            result = await self.session.scalars(
+                insert(Category)
+                .values([item.model_dump() for item in items])
+                .on_conflict_do_nothing(constraint="uix_user_category_name")
+                .returning(Category)
+            )
+            # RETURNING order is not guaranteed for multi-row VALUES
+            position = {
+                (item.user_id, item.name): index
+                for index, item in reversed(list(enumerate(items)))
+            }
+            categories = sorted(
+                result.all(),
+                key=lambda category: position[(category.user_id, category.name)]
+            )
+
+            logger.info(
+                "Categories bulk created",
+                extra={
+                    "requested_count": len(items),
+                    "created_count": len(categories),
+                    "operation": "bulk_create"
+                }
+            )
+
+            return categories
+
+        except Exception as e:
+            logger.error(
+                "Error bulk creating categories",
+                extra={
+                    "count": len(items),
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "bulk_create"
+                },
+                exc_info=True
+            )
+            raise
+
+    async def upsert_names(self, user_id: int, names: list[str]) -> dict[str, int]:
+        """Resolve category names to IDs, creating missing ones, in one statement.
+
+        INSERT ... ON CONFLICT (user_id, name) DO UPDATE with a no-op SET:
+        unlike DO NOTHING, RETURNING then also yields the rows that already
+        existed, so existing and new names are resolved in one round trip.
+
+        Args:
+            user_id: Owner of the categories
+            names: Category names (duplicates are collapsed)
+
+        Returns:
+            Mapping of every given name to its category ID
+        """
+        names = list(dict.fromkeys(names))
+        if not names:
+            return {}
+
+        logger.debug(
+            "Upserting category names",
+            extra={
+                "user_id": user_id,
+                "count": len(names),
+                "operation": "upsert"
+            }
+        )
+
+        try:
+            stmt = insert(Category).values(
+                [{"user_id": user_id, "name": name} for name in names]
+            )
+            result = await self.session.execute(
+                stmt.on_conflict_do_update(
+                    constraint="uix_user_category_name",
+                    set_={"name": stmt.excluded.name}
+                ).returning(Category.name, Category.id)
+            )
+            return dict(result.tuples().all())
+
+        except Exception as e:
+            logger.error(
+                "Error upserting category names",
+                extra={
+                    "user_id": user_id,
+                    "count": len(names),
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "upsert"
+                },
+                exc_info=True
+            )
+            raise
+
     async def get_by_user_and_name(self, user_id: int, name: str) -> Category | None:
         """Get category by user ID and name.
 
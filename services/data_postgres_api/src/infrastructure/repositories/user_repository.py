@@ -1,10 +1,13 @@
 """User repository."""
 import logging
 from datetime import datetime
-from typing import List
-from sqlalchemy import select
+from typing import AsyncIterator, List
+from sqlalchemy import literal_column, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
 
+from src.domain.models.category import Category
 from src.domain.models.user import User
 from src.schemas.user import UserCreate, UserUpdate
 from src.infrastructure.repositories.base import BaseRepository
@@ -56,6 +59,65 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
             )
             raise
 
+    async def stream_active_users_with_settings(
+        self,
+        batch_size: int = 1000
+    ) -> AsyncIterator[User]:
+        """Stream active users with their settings eager loaded.
+
+        Single SELECT with settings LEFT JOINed, read through a server-side
+        cursor (AsyncSession.stream) in batches of ``batch_size`` rows, so
+        memory stays flat regardless of the number of users.
+
+        Args:
+            batch_size: Rows fetched from the cursor per round trip
+
+        Yields:
+            Users ordered by ID, ``settings`` populated (or None)
+        """
+        logger.debug(
+            "Streaming active users with settings",
+            extra={
+                "batch_size": batch_size,
+                "operation": "read"
+            }
+        )
+
+        count = 0
+        try:
+            result = await self.session.stream(
+                select(User)
+                .outerjoin(User.settings)
+                .options(contains_eager(User.settings))
+                .where(User.last_poll_time.isnot(None))
+                .order_by(User.id)
+                .execution_options(yield_per=batch_size)
+            )
+            async for user in result.scalars():
+                count += 1
+                yield user
+
+            logger.debug(
+                "Active users streamed",
+                extra={
+                    "count": count,
+                    "operation": "read"
+                }
+            )
+
+        except Exception as e:
+            logger.error(
+                "Error streaming active users",
+                extra={
+                    "streamed_count": count,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "read"
+                },
+                exc_info=True
+            )
+            raise
+
     async def get_by_telegram_id(self, telegram_id: int) -> User | None:
         """Get user by Telegram ID.
 
@@ -112,6 +174,140 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
             )
             raise
 
+    async def upsert_by_telegram_id(self, data: UserCreate) -> tuple[User, bool]:
+        """Insert user or refresh the existing row with the same telegram_id.
+
+        One INSERT ... ON CONFLICT (telegram_id) DO UPDATE ... RETURNING, so
+        redelivered /start updates cannot create duplicates or fail on the
+        unique constraint. Username and first name are refreshed from the
+        latest Telegram profile; timezone is kept.
+
+        Args:
+            data: User creation data
+
+        Returns:
+            Tuple of (user, True if the row was inserted by this call)
+        """
+        logger.debug(
+            "Upserting user by telegram_id",
+            extra={
+                "telegram_id": data.telegram_id,
+                "operation": "upsert"
+            }
+        )
+
+        try:
+            stmt = insert(User).values(**data.model_dump())
+            result = await self.session.execute(
+                stmt
+                .on_conflict_do_update(
+                    index_elements=[User.telegram_id],
+                    set_={
+                        "username": stmt.excluded.username,
+                        "first_name": stmt.excluded.first_name,
+                    }
+                )
+                # xmax is 0 only for tuples inserted (not updated) by this statement
+                .returning(User, literal_column("xmax = 0").label("created"))
+                .execution_options(populate_existing=True)
+            )
+            user, created = result.one()
+
+            logger.info(
+                "User upserted",
+                extra={
+                    "user_id": user.id,
+                    "telegram_id": data.telegram_id,
+                    "user_created": created,
+                    "operation": "upsert"
+                }
+            )
+
+            return user, created
+
+        except Exception as e:
+            logger.error(
+                "Error upserting user",
+                extra={
+                    "telegram_id": data.telegram_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "upsert"
+                },
+                exc_info=True
+            )
+            raise
+
+    async def get_context_by_telegram_id(
+        self,
+        telegram_id: int
+    ) -> tuple[User, datetime | None] | None:
+        """Get user with settings, categories and last activity end time.
+
+        Everything is loaded by one SELECT: settings and categories are
+        outer-joined and eager-populated. The last activity end time is the
+        denormalized users.last_activity_end_time column, so the activities
+        table is not touched.
+
+        Args:
+            telegram_id: Telegram user ID
+
+        Returns:
+            Tuple of (user with settings/categories loaded, last activity
+            end_time or None), or None if user not found
+        """
+        logger.debug(
+            "Retrieving user context by telegram_id",
+            extra={
+                "telegram_id": telegram_id,
+                "operation": "read"
+            }
+        )
+
+        try:
+            result = await self.session.execute(
+                select(User)
+                .outerjoin(User.settings)
+                .outerjoin(User.categories)
+                .options(
+                    contains_eager(User.settings),
+                    contains_eager(User.categories),
+                )
+                .where(User.telegram_id == telegram_id)
+                .order_by(Category.created_at, Category.id)
+                # Refresh users already in the session (e.g. just upserted)
+                .execution_options(populate_existing=True)
+            )
+            # One row per category - collapse back to a single user
+            user = result.unique().scalars().first()
+
+            logger.debug(
+                "User context retrieved",
+                extra={
+                    "telegram_id": telegram_id,
+                    "found": user is not None,
+                    "operation": "read"
+                }
+            )
+
+            if user is None:
+                return None
+
+            return user, user.last_activity_end_time
+
+        except Exception as e:
+            logger.error(
+                "Error retrieving user context",
+                extra={
+                    "telegram_id": telegram_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "read"
+                },
+                exc_info=True
+            )
+            raise
+
     async def update_last_poll_time(
         self,
         user_id: int,
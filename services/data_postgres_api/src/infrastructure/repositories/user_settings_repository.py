@@ -2,6 +2,7 @@
 import logging
 from typing import Optional
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.models.user_settings import UserSettings
@@ -73,10 +74,65 @@ class UserSettingsRepository(BaseRepository[UserSettings, UserSettingsCreate, Us
             )
             raise
 
+    async def create_if_absent(self, data: UserSettingsCreate) -> UserSettings | None:
+        """Create settings unless the user already has them.
+
+        Uses INSERT ... ON CONFLICT (user_id) DO NOTHING RETURNING, so it is
+        safe to call repeatedly (e.g. on every /start).
+
+        Args:
+            data: User settings creation data
+
+        Returns:
+            Created settings, or None if the user already had settings
+        """
+        logger.debug(
+            "Creating user settings if absent",
+            extra={
+                "user_id": data.user_id,
+                "operation": "create"
+            }
+        )
+
+        try:
+            result = await self.session.scalars(
+                insert(UserSettings)
+                .values(**data.model_dump())
+                .on_conflict_do_nothing(index_elements=[UserSettings.user_id])
+                .returning(UserSettings)
+            )
+            settings = result.one_or_none()
+
+            logger.debug(
+                "User settings create if absent completed",
+                extra={
+                    "user_id": data.user_id,
+                    "settings_created": settings is not None,
+                    "operation": "create"
+                }
+            )
+
+            return settings
+
+        except Exception as e:
+            logger.error(
+                "Error creating user settings",
+                extra={
+                    "user_id": data.user_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "operation": "create"
+                },
+                exc_info=True
+            )
+            raise
+
     async def update(self, user_id: int, data: UserSettingsUpdate) -> Optional[UserSettings]:
         """
         Update user settings by user_id (overrides base implementation).
 
+        Uses the same single UPDATE ... RETURNING round trip as the base.
+
         Args:
             user_id: User ID (not settings ID)
             data: Update data (Pydantic schema)
@@ -96,7 +152,14 @@ class UserSettingsRepository(BaseRepository[UserSettings, UserSettingsCreate, Us
         )
 
         try:
-            entity = await self.get_by_user_id(user_id)
+            if not update_data:
+                # Nothing to write - UPDATE with empty SET is invalid SQL
+                entity = await self.get_by_user_id(user_id)
+            else:
+                entity = await self._update_returning(
+                    UserSettings.user_id == user_id, update_data
+                )
+
             if not entity:
                 logger.warning(
                     "Cannot update user settings - not found",
@@ -107,22 +170,12 @@ class UserSettingsRepository(BaseRepository[UserSettings, UserSettingsCreate, Us
                 )
                 return None
 
-            # Track changed fields
-            changed_fields = []
-            for field, value in update_data.items():
-                if hasattr(entity, field) and getattr(entity, field) != value:
-                    changed_fields.append(field)
-                    setattr(entity, field, value)
-
-            await self.session.flush()
-            await self.session.refresh(entity)
-
             logger.info(
                 "User settings updated successfully",
                 extra={
                     "user_id": user_id,
                     "settings_id": entity.id,
-                    "changed_fields": changed_fields,
+                    "changed_fields": list(update_data.keys()),
                     "operation": "update"
                 }
             )
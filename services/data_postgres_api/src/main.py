@@ -2,8 +2,11 @@
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
@@ -12,12 +15,17 @@ from src.api.v1.users import router as users_router
 from src.api.v1.categories import router as categories_router
 from src.api.v1.activities import router as activities_router
 from src.api.v1.user_settings import router as user_settings_router
+from src.api.v1.admin import router as admin_router
 from src.api.middleware.correlation import CorrelationIDMiddleware
 from src.api.middleware.logging import RequestLoggingMiddleware
-from src.infrastructure.database.connection import engine, get_db
+from src.api.middleware.metrics import MetricsMiddleware
+from src.api.middleware.query_stats import QueryStatsHeadersMiddleware
+from src.api.responses import ORJSONResponse
+from src.infrastructure.database.admission import DatabaseOverloadedError, is_statement_timeout
+from src.infrastructure.database.connection import engine, get_db, read_engine, warm_up_pool
 from src.domain.models.base import Base
 # Import all models for SQLAlchemy relationship resolution
-from src.domain.models import User, Category, Activity, UserSettings
+from src.domain.models import User, Category, Activity, ActivityDailyRollup, UserSettings
 
 # Configure structured JSON logging (MANDATORY for Level 1)
 setup_logging(service_name="data_postgres_api", log_level=settings.log_level)
@@ -98,6 +106,21 @@ async def lifespan(app: FastAPI):
             )
             raise
 
+    # Open pool connections before traffic arrives (skipped in PgBouncer mode)
+    if settings.db_pool_warmup and not settings.db_pgbouncer:
+        try:
+            opened = await warm_up_pool(engine, settings.db_pool_size)
+            if read_engine is not engine:
+                opened += await warm_up_pool(read_engine, settings.db_pool_size)
+            logger.info("Database pool warmed up", extra={"connections": opened})
+        except Exception as e:
+            # Not fatal: connections are opened on demand, readiness reports the outage
+            logger.warning(
+                "Database pool warm-up failed",
+                extra={"error": str(e), "error_type": type(e).__name__},
+                exc_info=True
+            )
+
     logger.info("Application startup complete")
 
     yield
@@ -105,6 +128,8 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down data_postgres_api service")
     await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
     logger.info("Database engine disposed")
 
 
@@ -114,6 +139,7 @@ app = FastAPI(
     description="HTTP Data Access Service for PostgreSQL",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Register middleware (order matters - executed in reverse order during request)
@@ -127,17 +153,62 @@ app.add_middleware(
 )
 
 # 2. Request logging - logs with correlation ID
-app.add_middleware(RequestLoggingMiddleware)
+app.add_middleware(
+    RequestLoggingMiddleware,
+    mode=settings.request_log_mode,
+    sample_rate=settings.request_log_sample_rate,
+    slow_threshold_ms=settings.request_log_slow_ms,
+)
 
 # 3. Correlation ID - first (innermost layer, runs first)
 app.add_middleware(CorrelationIDMiddleware)
 
+# 4. SQL debug headers (X-Query-Count / X-DB-Time), off by default
+if settings.query_debug_headers:
+    app.add_middleware(QueryStatsHeadersMiddleware)
+
+# 5. Metrics - wraps everything above, so latency includes logging
+app.add_middleware(MetricsMiddleware)
+
+
+@app.exception_handler(DatabaseOverloadedError)
+async def database_overloaded_handler(request: Request, exc: DatabaseOverloadedError) -> ORJSONResponse:
+    """Answer requests shed by admission control with 503 and Retry-After."""
+    logger.warning(
+        "Request rejected by database admission control",
+        extra={"path": request.url.path, "reason": exc.reason}
+    )
+    return ORJSONResponse(
+        status_code=503,
+        content={"detail": "Service overloaded, retry later"},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@app.exception_handler(DBAPIError)
+async def database_error_handler(request: Request, exc: DBAPIError) -> ORJSONResponse:
+    """Answer statements canceled by statement_timeout with 503 and Retry-After."""
+    if not is_statement_timeout(exc):
+        raise exc
+    logger.warning(
+        "SQL statement exceeded its time budget",
+        extra={"path": request.url.path, "error": str(exc.orig)}
+    )
+    return ORJSONResponse(
+        status_code=503,
+        content={"detail": "Database statement timeout, retry later"},
+        headers={"Retry-After": str(settings.db_admission_retry_after_s)},
+    )
+
 
 # Include routers
 app.include_router(users_router, prefix=settings.api_v1_prefix)
 app.include_router(categories_router, prefix=settings.api_v1_prefix)
 app.include_router(activities_router, prefix=settings.api_v1_prefix)
 app.include_router(user_settings_router, prefix=settings.api_v1_prefix)
+if settings.enable_admin_api:
+    # No authentication: only for trusted networks (load tests, debugging)
+    app.include_router(admin_router, prefix=settings.api_v1_prefix)
 
 
 @app.get("/")
@@ -214,6 +285,21 @@ async def readiness(db: AsyncSession = Depends(get_db)) -> dict[str, str]:
         )
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """
+    Prometheus metrics endpoint.
+
+    Exposes HTTP latency/status metrics, in-flight requests, database pool
+    statistics and slow query counters in Prometheus text format.
+
+    Returns:
+        Metrics in Prometheus exposition format
+    """
+    # Explicit header: media_type would get a second "; charset" appended
+    return Response(generate_latest(), headers={"Content-Type": CONTENT_TYPE_LATEST})
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
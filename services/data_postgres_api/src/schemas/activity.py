@@ -1,8 +1,13 @@
 """Activity schemas."""
-from datetime import datetime
-from typing import Any
+from datetime import date, datetime
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict, model_validator
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+
+
+def normalize_tag(tag: str) -> str:
+    """Canonical tag form: surrounding whitespace and leading '#' removed."""
+    return tag.strip().lstrip("#").strip()
 
 
 class ActivityCreate(BaseModel):
@@ -15,6 +20,16 @@ class ActivityCreate(BaseModel):
     start_time: datetime = Field(..., description="Start time (UTC)")
     end_time: datetime = Field(..., description="End time (UTC)")
 
+    @field_validator("tags")
+    @classmethod
+    def normalize_tags(cls, v: list[str] | None) -> list[str] | None:
+        """Strip whitespace and leading '#', drop empty and repeated tags."""
+        if v is None:
+            return None
+        tags = dict.fromkeys(normalize_tag(tag) for tag in v)
+        tags.pop("", None)
+        return list(tags) or None
+
     @field_validator("end_time")
     @classmethod
     def validate_end_time(cls, v: datetime, info) -> datetime:
@@ -35,42 +50,20 @@ class ActivityResponse(BaseModel):
     user_id: int
     category_id: int | None
     description: str
-    tags: str | None
+    tags: list[str] | None
     start_time: datetime
     end_time: datetime
     duration_minutes: int
     created_at: datetime
+    # Read from Activity properties that never trigger a lazy load
     category_name: str | None = None
     category_emoji: str | None = None
 
-    @model_validator(mode='before')
-    @classmethod
-    def extract_category_data(cls, data: Any) -> Any:
-        """Extract category name and emoji from relationship if present."""
-        # Skip if already a dict (no need to process)
-        if isinstance(data, dict):
-            return data
-
-        # For SQLAlchemy models, check if category relationship is loaded
-        # Use __dict__ to avoid triggering lazy load
-        if hasattr(data, '__dict__') and 'category' in data.__dict__:
-            category = data.__dict__['category']
-            if category is not None:
-                data_dict = {
-                    'id': data.id,
-                    'user_id': data.user_id,
-                    'category_id': data.category_id,
-                    'description': data.description,
-                    'tags': data.tags,
-                    'start_time': data.start_time,
-                    'end_time': data.end_time,
-                    'duration_minutes': data.duration_minutes,
-                    'created_at': data.created_at,
-                    'category_name': category.name,
-                    'category_emoji': category.emoji,
-                }
-                return data_dict
-        return data
+
+class ActivitySearchResult(ActivityResponse):
+    """Schema for one full-text search hit."""
+
+    search_rank: float = Field(..., description="Relevance (ts_rank), higher is better")
 
 
 class ActivityListResponse(BaseModel):
@@ -78,3 +71,105 @@ class ActivityListResponse(BaseModel):
 
     total: int
     items: list[ActivityResponse]
+
+
+# Upper bound for one bulk request: keeps a single INSERT statement and the
+# request body within sane size limits while still amortizing round trips.
+MAX_BULK_ACTIVITIES = 1000
+
+
+class ActivityBulkCreate(BaseModel):
+    """Schema for bulk creating activities.
+
+    Items are validated one by one against ActivityCreate by the service so
+    that a single malformed item is reported instead of rejecting the batch.
+    """
+
+    items: list[dict[str, Any]] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_ACTIVITIES,
+        description="List of activities to create (ActivityCreate payloads)"
+    )
+
+
+class ActivityBulkItemError(BaseModel):
+    """Schema for a single rejected item in a bulk request."""
+
+    index: int = Field(..., description="Position of the item in the request")
+    error: str = Field(..., description="Reason the item was rejected")
+
+
+class ActivityBulkCreateResponse(BaseModel):
+    """Schema for bulk activity creation result."""
+
+    created: list[ActivityResponse]
+    errors: list[ActivityBulkItemError]
+
+
+class ActivityImportResponse(BaseModel):
+    """Schema for bulk activity import result."""
+
+    imported: int = Field(..., description="Number of activities created")
+    failed: int = Field(..., description="Number of rejected records")
+    errors: list[ActivityBulkItemError] = Field(
+        ..., description="First rejected records (index: position in the upload)"
+    )
+
+
+# Time bucket sizes supported by activity statistics
+StatsPeriod = Literal["day", "week", "month"]
+
+
+class ActivityStatsItem(BaseModel):
+    """Schema for one (time bucket, category) aggregate."""
+
+    bucket: date = Field(..., description="First local day of the bucket (user timezone)")
+    category_id: int | None = Field(None, description="Category ID (null for uncategorized)")
+    category_name: str | None = Field(None, description="Category name")
+    total_minutes: int = Field(..., description="Sum of activity durations in minutes")
+    activity_count: int = Field(..., description="Number of activities")
+
+
+class ActivityStatsResponse(BaseModel):
+    """Schema for activity statistics response."""
+
+    user_id: int
+    period: StatsPeriod
+    items: list[ActivityStatsItem]
+
+
+class ActivityGap(BaseModel):
+    """Schema for one interval not covered by any activity."""
+
+    start_time: datetime = Field(..., description="Gap start (end of the previous activity)")
+    end_time: datetime = Field(..., description="Gap end (start of the next activity)")
+    duration_minutes: int = Field(..., description="Gap length in minutes")
+
+
+class ActivityGapsResponse(BaseModel):
+    """Schema for untracked gaps response."""
+
+    user_id: int
+    min_minutes: int
+    total_minutes: int = Field(..., description="Sum of gap lengths in minutes")
+    items: list[ActivityGap]
+
+
+class ActivityDescriptionSuggestion(BaseModel):
+    """Schema for one distinct recently used activity description."""
+
+    description: str
+    use_count: int = Field(..., description="Number of activities with this description")
+    last_used_at: datetime = Field(..., description="Start time of the latest such activity")
+    last_activity_id: int = Field(..., description="ID of the latest such activity")
+    category_id: int | None = Field(None, description="Category of the latest such activity")
+    category_name: str | None = Field(None, description="Name of that category")
+
+
+class ActivityTagStats(BaseModel):
+    """Schema for one tag's aggregate over the user's activities."""
+
+    tag: str
+    total_minutes: int = Field(..., description="Sum of durations of activities with this tag")
+    activity_count: int = Field(..., description="Number of activities with this tag")
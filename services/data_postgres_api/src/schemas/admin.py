@@ -0,0 +1,22 @@
+"""Admin schemas."""
+from pydantic import BaseModel, Field
+
+
+class QueryStatsEntry(BaseModel):
+    """Aggregated executions of one normalized SQL statement."""
+
+    query: str = Field(..., description="Normalized statement (literals replaced by ?)")
+    calls: int
+    total_time_ms: float
+    mean_time_ms: float
+    max_time_ms: float
+    rows: int = Field(..., description="Rows returned or affected, summed over calls")
+
+
+class QueryStatsResponse(BaseModel):
+    """Schema for the statement statistics table."""
+
+    tracked: int = Field(..., description="Distinct statements currently tracked")
+    max_entries: int = Field(..., description="Table capacity")
+    evicted: int = Field(..., description="Entries dropped to stay within capacity since reset")
+    statements: list[QueryStatsEntry]
@@ -1,7 +1,18 @@
 """User schemas."""
 from datetime import datetime
+from functools import cache
+from zoneinfo import available_timezones
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+
+from src.schemas.category import CategoryResponse
+from src.schemas.user_settings import UserSettingsResponse
+
+
+@cache
+def _known_timezones() -> frozenset[str]:
+    """IANA time zone names (read from the tz database once)."""
+    return frozenset(available_timezones())
 
 
 class UserCreate(BaseModel):
@@ -12,6 +23,18 @@ class UserCreate(BaseModel):
     first_name: str | None = Field(None, max_length=255, description="User first name")
     timezone: str = Field(default="Europe/Moscow", max_length=50, description="User timezone")
 
+    @field_validator("timezone")
+    @classmethod
+    def validate_timezone(cls, v: str) -> str:
+        """Validate that timezone is an IANA name, e.g. "Europe/Moscow".
+
+        Activity rollups convert times with ``AT TIME ZONE users.timezone``,
+        which fails for names PostgreSQL does not recognize.
+        """
+        if v not in _known_timezones():
+            raise ValueError(f"Unknown timezone: {v!r} (expected an IANA name, e.g. 'Europe/Moscow')")
+        return v
+
 
 class UserUpdate(BaseModel):
     """Schema for updating a user."""
@@ -31,3 +54,38 @@ class UserResponse(BaseModel):
     timezone: str
     created_at: datetime
     last_poll_time: datetime | None
+    last_activity_end_time: datetime | None = Field(
+        None, description="End time of the latest-ending activity"
+    )
+
+
+class ActiveUserResponse(UserResponse):
+    """Schema for one line of the active users stream (user with settings)."""
+
+    settings: UserSettingsResponse | None
+
+
+class UserContextResponse(BaseModel):
+    """Schema for everything a bot handler needs about a user, in one response."""
+
+    user: UserResponse
+    settings: UserSettingsResponse | None
+    categories: list[CategoryResponse]
+    last_activity_end_time: datetime | None = Field(
+        None, description="End time of the latest-ending activity"
+    )
+
+
+class UserLastActivityResponse(BaseModel):
+    """Schema for the last activity pointer used by poll period calculation."""
+
+    user_id: int
+    last_activity_end_time: datetime | None = Field(
+        None, description="End time of the latest-ending activity (null if none)"
+    )
+
+
+class UserOnboardResponse(UserContextResponse):
+    """Schema for the /start onboarding response."""
+
+    created: bool = Field(..., description="True if the user was created by this request")
@@ -66,7 +66,7 @@ def sample_activity():
         user_id=1,
         category_id=1,
         description="Working on project",
-        tags="python,testing",
+        tags=["python", "testing"],
         start_time=datetime(2025, 11, 7, 10, 0, 0, tzinfo=timezone.utc),
         end_time=datetime(2025, 11, 7, 12, 0, 0, tzinfo=timezone.utc),
         duration_minutes=120,
@@ -310,7 +310,7 @@ class TestCreateActivityEndpoint:
 
         GIVEN: tags as list of strings
         WHEN: POST /api/v1/activities is called
-        THEN: Activity created (service converts to comma-separated)
+        THEN: Activity created with tags stored as an array
         """
         # Arrange
         request_data = {
@@ -325,7 +325,7 @@ class TestCreateActivityEndpoint:
             user_id=1,
             category_id=None,
             description="Task with tags",
-            tags="python,testing,unit",  # Converted
+            tags=["python", "testing", "unit"],
             start_time=datetime(2025, 11, 7, 10, 0, 0, tzinfo=timezone.utc),
             end_time=datetime(2025, 11, 7, 11, 0, 0, tzinfo=timezone.utc),
             duration_minutes=60,
@@ -340,7 +340,7 @@ class TestCreateActivityEndpoint:
         # Assert
         assert response.status_code == 201
         data = response.json()
-        assert data["tags"] == "python,testing,unit"
+        assert data["tags"] == ["python", "testing", "unit"]
 
     @pytest.mark.contract
     def test_create_activity_response_matches_activity_response_schema(
@@ -0,0 +1,240 @@
+"""
+Unit tests for ActivityDailyRollupRepository.
+
+Tests the set-based rollup maintenance statements and the daily totals
+query without a database (statements are inspected, not executed).
+
+Test Coverage:
+    - apply_activities(): Incremental upsert, empty input short-circuit
+    - rebuild(): Locking, per-user and full rebuild
+    - get_daily_totals(): Date bounds, deleted category fallback
+"""
+
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.exc import DataError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.repositories.activity_daily_rollup_repository import (
+    ActivityDailyRollupRepository
+)
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def mock_session():
+    """
+    Fixture: Mock SQLAlchemy AsyncSession.
+
+    Returns:
+        AsyncMock: Mocked session for testing without database
+    """
+    session = AsyncMock(spec=AsyncSession)
+    session.execute = AsyncMock()
+    return session
+
+
+@pytest.fixture
+def rollup_repository(mock_session):
+    """
+    Fixture: ActivityDailyRollupRepository instance for testing.
+
+    Args:
+        mock_session: Mocked AsyncSession from fixture
+
+    Returns:
+        ActivityDailyRollupRepository: Repository with mocked session
+    """
+    return ActivityDailyRollupRepository(mock_session)
+
+
+class _DriverError(Exception):
+    """Driver exception carrying a SQLSTATE, as wrapped by DBAPIError.orig."""
+
+    def __init__(self, sqlstate: str, message: str):
+        super().__init__(message)
+        self.sqlstate = sqlstate
+
+
+def _executed_sql(mock_session: AsyncMock) -> list[str]:
+    """Return SQL text of every statement passed to session.execute()."""
+    return [str(call.args[0]) for call in mock_session.execute.call_args_list]
+
+
+# ============================================================================
+# TEST SUITES
+# ============================================================================
+
+class TestActivityDailyRollupRepositoryApply:
+    """Test suite for incremental rollup maintenance."""
+
+    @pytest.mark.unit
+    async def test_apply_activities_upserts_split_segments(
+        self,
+        rollup_repository: ActivityDailyRollupRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that new activities are added to existing totals.
+
+        GIVEN: IDs of freshly inserted activities
+        WHEN: apply_activities() is called
+        THEN: One INSERT ... ON CONFLICT DO UPDATE is executed that splits
+              activities by local day of users.timezone
+        """
+        # Act
+        await rollup_repository.apply_activities([10, 11])
+
+        # Assert
+        mock_session.execute.assert_called_once()
+        sql = _executed_sql(mock_session)[0]
+        assert "INSERT INTO activity_daily_rollup" in sql
+        assert "AT TIME ZONE u.timezone" in sql
+        assert "generate_series" in sql
+        assert "ON CONFLICT (user_id, local_date, category_id) DO UPDATE" in sql
+        assert mock_session.execute.call_args.args[1] == {"activity_ids": [10, 11]}
+
+    @pytest.mark.unit
+    async def test_apply_activities_with_empty_list_skips_database(
+        self,
+        rollup_repository: ActivityDailyRollupRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that nothing is executed when no activity was created.
+
+        GIVEN: Empty ID list (e.g. every bulk item failed)
+        WHEN: apply_activities() is called
+        THEN: No statement is sent
+        """
+        # Act
+        await rollup_repository.apply_activities([])
+
+        # Assert
+        mock_session.execute.assert_not_called()
+
+
+    @pytest.mark.unit
+    async def test_apply_activities_reports_unknown_user_timezone_as_value_error(
+        self,
+        rollup_repository: ActivityDailyRollupRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that a time zone PostgreSQL rejects becomes a client error.
+
+        GIVEN: A user whose stored timezone AT TIME ZONE does not recognize
+        WHEN: apply_activities() is called
+        THEN: ValueError is raised (400 via handle_service_errors), other
+              database errors propagate unchanged
+        """
+        # Arrange
+        mock_session.execute.side_effect = DataError(
+            "INSERT ...", {}, _DriverError("22023", 'time zone "Mars/Base" not recognized')
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="timezone is not recognized"):
+            await rollup_repository.apply_activities([10])
+
+        mock_session.execute.side_effect = DataError("INSERT ...", {}, _DriverError("22P02", "bad"))
+        with pytest.raises(DataError):
+            await rollup_repository.apply_activities([10])
+
+class TestActivityDailyRollupRepositoryRebuild:
+    """Test suite for rebuilding the rollup from history."""
+
+    @pytest.mark.unit
+    async def test_rebuild_for_user_replaces_only_user_rows(
+        self,
+        rollup_repository: ActivityDailyRollupRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test per-user rebuild.
+
+        GIVEN: user_id=42
+        WHEN: rebuild(42) is called
+        THEN: Table is locked, user's rows deleted and re-inserted
+              AND number of written rows is returned
+        """
+        # Arrange
+        mock_session.execute.return_value = MagicMock(rowcount=7)
+
+        # Act
+        row_count = await rollup_repository.rebuild(user_id=42)
+
+        # Assert
+        lock_sql, delete_sql, insert_sql = _executed_sql(mock_session)
+        assert lock_sql.startswith("LOCK TABLE activity_daily_rollup")
+        assert "WHERE user_id = :user_id" in delete_sql
+        assert "a.user_id = :user_id" in insert_sql
+        assert "ON CONFLICT" not in insert_sql
+        assert row_count == 7
+
+    @pytest.mark.unit
+    async def test_rebuild_all_users(
+        self,
+        rollup_repository: ActivityDailyRollupRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test full rebuild.
+
+        GIVEN: No user_id
+        WHEN: rebuild() is called
+        THEN: Whole table is cleared and rebuilt from all activities
+        """
+        # Arrange
+        mock_session.execute.return_value = MagicMock(rowcount=0)
+
+        # Act
+        await rollup_repository.rebuild()
+
+        # Assert
+        _, delete_sql, insert_sql = _executed_sql(mock_session)
+        assert delete_sql == "DELETE FROM activity_daily_rollup"
+        assert "WHERE TRUE" in insert_sql
+
+
+class TestActivityDailyRollupRepositoryRead:
+    """Test suite for reading daily totals."""
+
+    @pytest.mark.unit
+    async def test_get_daily_totals_filters_dates_and_joins_categories(
+        self,
+        rollup_repository: ActivityDailyRollupRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test daily totals query shape.
+
+        GIVEN: A date range
+        WHEN: get_daily_totals() is called
+        THEN: Rollup rows are filtered by local_date and LEFT JOINed to
+              categories so deleted categories report as uncategorized
+        """
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.mappings.return_value = [
+            {"bucket": date(2025, 11, 7), "category_id": None, "category_name": None,
+             "total_minutes": 45, "activity_count": 1}
+        ]
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        rows = await rollup_repository.get_daily_totals(
+            1, start_date=date(2025, 11, 1), end_date=date(2025, 12, 1)
+        )
+
+        # Assert
+        sql = _executed_sql(mock_session)[0]
+        assert "LEFT OUTER JOIN categories" in sql
+        assert "activity_daily_rollup.local_date >=" in sql
+        assert "activity_daily_rollup.local_date <" in sql
+        assert "GROUP BY activity_daily_rollup.local_date, categories.id" in sql
+        assert rows[0]["total_minutes"] == 45
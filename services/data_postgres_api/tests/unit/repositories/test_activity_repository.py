@@ -5,7 +5,7 @@ Tests custom activity-specific repository methods including duration calculation
 tag handling, and recent activity queries.
 
 Test Coverage:
-    - create(): Duration calculation, tag conversion, custom logic
+    - create(): Duration calculation, tag storage, custom logic
     - get_recent_by_user(): Recent activities, ordering, limit
     - Inherited base methods: Covered in test_base_repository.py
 
@@ -19,6 +19,8 @@ Date: 2025-11-07
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime, timedelta
+from sqlalchemy import insert, inspect as sa_inspect
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.repositories.activity_repository import (
@@ -76,7 +78,7 @@ def sample_activity():
         user_id=1,
         category_id=1,
         description="Coding session",
-        tags="python,testing",
+        tags=["python", "testing"],
         start_time=datetime(2025, 11, 7, 10, 0),
         end_time=datetime(2025, 11, 7, 12, 0),
         duration_minutes=120
@@ -111,7 +113,7 @@ class TestActivityRepositoryCreate:
 
     Tests the overridden create() method which adds custom logic for:
     - Duration calculation from start_time to end_time
-    - Tag list to comma-separated string conversion
+    - Tags stored as a text[] array
     """
 
     @pytest.mark.unit
@@ -148,20 +150,86 @@ class TestActivityRepositoryCreate:
         # Verify session operations
         mock_session.add.assert_called_once()
         mock_session.flush.assert_called_once()
-        mock_session.refresh.assert_called_once()
+        # id/created_at come back via INSERT ... RETURNING on flush
+        mock_session.refresh.assert_not_called()
+
+    @pytest.mark.unit
+    async def test_create_updates_daily_rollup_in_same_session(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock,
+        activity_create_data: ActivityCreate
+    ):
+        """
+        Test that daily rollup is maintained together with the insert.
+
+        GIVEN: Valid activity data
+        WHEN: create() is called
+        THEN: Rollup upsert for the new activity runs on the same session
+              after the INSERT has been flushed
+        """
+        # Arrange
+        activity_repository.rollup.apply_activities = AsyncMock()
+
+        # Act
+        activity = await activity_repository.create(activity_create_data)
+
+        # Assert
+        assert activity_repository.rollup.session is mock_session
+        mock_session.flush.assert_called_once()
+        activity_repository.rollup.apply_activities.assert_called_once_with([activity.id])
 
     @pytest.mark.unit
-    async def test_create_converts_tags_list_to_comma_separated_string(
+    async def test_create_advances_user_last_activity_end(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock,
+        activity_create_data: ActivityCreate
+    ):
+        """
+        Test that the denormalized last activity pointer is maintained.
+
+        GIVEN: Valid activity data
+        WHEN: create() is called
+        THEN: users.last_activity_end_time is moved forward with GREATEST()
+              in an UPDATE ... FROM on the same session
+        """
+        # Act
+        await activity_repository.create(activity_create_data)
+
+        # Assert
+        update_sql = str(mock_session.execute.call_args_list[-1][0][0].compile(
+            dialect=postgresql.dialect()
+        ))
+        assert update_sql.startswith("UPDATE users SET last_activity_end_time=greatest(")
+        assert "max(activities.end_time)" in update_sql
+        assert "GROUP BY activities.user_id" in update_sql
+
+    @pytest.mark.unit
+    async def test_advance_last_activity_end_with_no_ids_skips_database(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that an empty id list (e.g. whole bulk batch failed) runs nothing.
+        """
+        await activity_repository.advance_last_activity_end([])
+
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.unit
+    async def test_create_stores_tags_as_array(
         self,
         activity_repository: ActivityRepository,
         mock_session: AsyncMock
     ):
         """
-        Test tag list conversion to comma-separated string.
+        Test tags are stored as a text[] array.
 
         GIVEN: Activity with tags=["python", "testing", "unit"]
         WHEN: create() is called
-        THEN: Tags are stored as "python,testing,unit" in database
+        THEN: Tags are stored as the same list (no string joining)
         """
         # Arrange: Activity with multiple tags
         activity_data = ActivityCreate(
@@ -176,9 +244,9 @@ class TestActivityRepositoryCreate:
         # Act: Create activity
         result = await activity_repository.create(activity_data)
 
-        # Assert: Tags converted to comma-separated string
-        assert result.tags == "python,testing,unit", \
-            "Tags should be converted to comma-separated string"
+        # Assert: Tags kept as a list
+        assert result.tags == ["python", "testing", "unit"], \
+            "Tags should be stored as an array"
 
     @pytest.mark.unit
     async def test_create_handles_empty_tags_list(
@@ -655,6 +723,750 @@ class TestActivityRepositoryInheritance:
         assert result is True, "Inherited delete() should work"
 
 
+class TestActivityRepositoryBulkCreate:
+    """
+    Test suite for ActivityRepository.bulk_create() method.
+
+    Tests single-statement batch insert and row-by-row fallback when the
+    batch is rejected by the database.
+    """
+
+    @staticmethod
+    def _savepoint() -> MagicMock:
+        """Build async context manager standing in for begin_nested()."""
+        savepoint = MagicMock()
+        savepoint.__aenter__ = AsyncMock(return_value=None)
+        savepoint.__aexit__ = AsyncMock(return_value=False)
+        return savepoint
+
+    @pytest.mark.unit
+    async def test_bulk_create_uses_single_insert_statement(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock,
+        activity_create_data: ActivityCreate,
+        sample_activity: Activity
+    ):
+        """
+        Test that the whole batch is written with one statement.
+
+        GIVEN: Three valid activities
+        WHEN: bulk_create() is called
+        THEN: session.scalars is called once with three parameter sets
+              AND results are keyed by input position
+        """
+        # Arrange
+        mock_session.begin_nested = MagicMock(return_value=self._savepoint())
+        mock_result = MagicMock()
+        mock_result.all.return_value = [sample_activity] * 3
+        mock_session.scalars = AsyncMock(return_value=mock_result)
+
+        # Act
+        created, errors = await activity_repository.bulk_create([activity_create_data] * 3)
+
+        # Assert
+        mock_session.scalars.assert_called_once()
+        rows = mock_session.scalars.call_args[0][1]
+        assert len(rows) == 3
+        assert rows[0]["tags"] == ["python", "testing"]
+        assert rows[0]["duration_minutes"] == 90
+        assert list(created) == [0, 1, 2]
+        assert errors == {}
+
+    @pytest.mark.unit
+    async def test_bulk_create_falls_back_to_rows_on_database_error(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock,
+        activity_create_data: ActivityCreate,
+        sample_activity: Activity
+    ):
+        """
+        Test per-row fallback when batch insert fails.
+
+        GIVEN: Batch where the second row violates a constraint
+        WHEN: bulk_create() is called
+        THEN: First row is created, second row is reported as error
+        """
+        from sqlalchemy.exc import IntegrityError
+
+        # Arrange: batch fails, then row 0 succeeds and row 1 fails
+        db_error = IntegrityError("INSERT", {}, Exception("fk violation"))
+        row_result = MagicMock()
+        row_result.one.return_value = sample_activity
+        mock_session.begin_nested = MagicMock(side_effect=lambda: self._savepoint())
+        mock_session.scalars = AsyncMock(side_effect=[db_error, row_result, db_error])
+
+        # Act
+        created, errors = await activity_repository.bulk_create([activity_create_data] * 2)
+
+        # Assert
+        assert created == {0: sample_activity}
+        assert errors == {1: "fk violation"}
+
+    @pytest.mark.unit
+    async def test_bulk_create_raises_statement_timeout_without_fallback(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock,
+        activity_create_data: ActivityCreate
+    ):
+        """
+        Test that a canceled batch is not retried row by row.
+
+        GIVEN: Batch insert canceled by statement_timeout (SQLSTATE 57014)
+        WHEN: bulk_create() is called
+        THEN: The error propagates (503 + Retry-After) after one statement
+        """
+        from sqlalchemy.exc import OperationalError
+
+        # Arrange
+        driver_error = Exception("canceling statement due to statement timeout")
+        driver_error.sqlstate = "57014"
+        mock_session.begin_nested = MagicMock(side_effect=lambda: self._savepoint())
+        mock_session.scalars = AsyncMock(
+            side_effect=OperationalError("INSERT", {}, driver_error)
+        )
+
+        # Act & Assert
+        with pytest.raises(OperationalError):
+            await activity_repository.bulk_create([activity_create_data] * 2)
+
+        mock_session.scalars.assert_called_once()
+
+    @pytest.mark.unit
+    async def test_bulk_create_falls_back_on_data_exception_sqlstate(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock,
+        activity_create_data: ActivityCreate,
+        sample_activity: Activity
+    ):
+        """
+        Test that data exceptions reported as plain DBAPIError still fall back.
+
+        GIVEN: Batch rejected with SQLSTATE 22001 (asyncpg maps class 22 to
+               a generic DBAPIError, not DataError)
+        WHEN: bulk_create() is called
+        THEN: Rows are retried one by one and the failing row is reported
+        """
+        from sqlalchemy.exc import DBAPIError
+
+        # Arrange
+        driver_error = Exception("value too long")
+        driver_error.sqlstate = "22001"
+        db_error = DBAPIError("INSERT", {}, driver_error)
+        row_result = MagicMock()
+        row_result.one.return_value = sample_activity
+        mock_session.begin_nested = MagicMock(side_effect=lambda: self._savepoint())
+        mock_session.scalars = AsyncMock(side_effect=[db_error, db_error, row_result])
+
+        # Act
+        created, errors = await activity_repository.bulk_create([activity_create_data] * 2)
+
+        # Assert
+        assert created == {1: sample_activity}
+        assert errors == {0: "value too long"}
+
+    @pytest.mark.unit
+    async def test_bulk_create_with_empty_list_skips_database(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that empty input does not hit the database.
+        """
+        mock_session.scalars = AsyncMock()
+
+        created, errors = await activity_repository.bulk_create([])
+
+        assert created == {} and errors == {}
+        mock_session.scalars.assert_not_called()
+
+
+class TestActivityRepositoryCopyCreate:
+    """
+    Test suite for ActivityRepository.copy_create() (COPY based import).
+    """
+
+    @pytest.mark.unit
+    async def test_copy_create_loads_rows_with_preallocated_ids(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock,
+        activity_create_data: ActivityCreate
+    ):
+        """
+        Test that rows are COPYed with IDs drawn from the sequence.
+
+        GIVEN: Two valid activities
+        WHEN: copy_create() is called
+        THEN: Two IDs are taken with nextval() in one query, the rows are
+              loaded with copy_records_to_table() including those IDs, and
+              the rollup and users pointer are updated for them
+        """
+        # Arrange
+        ids_result = MagicMock()
+        ids_result.all.return_value = [101, 102]
+        mock_session.scalars = AsyncMock(return_value=ids_result)
+        driver_connection = MagicMock(copy_records_to_table=AsyncMock())
+        connection = MagicMock(get_raw_connection=AsyncMock(
+            return_value=MagicMock(driver_connection=driver_connection)
+        ))
+        mock_session.connection = AsyncMock(return_value=connection)
+        activity_repository.rollup.apply_activities = AsyncMock()
+        activity_repository.advance_last_activity_end = AsyncMock()
+
+        # Act
+        result = await activity_repository.copy_create([activity_create_data] * 2)
+
+        # Assert
+        assert result == [101, 102]
+        sql = str(mock_session.scalars.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "nextval(pg_get_serial_sequence(" in sql
+        assert "FROM generate_series(" in sql
+        copy = driver_connection.copy_records_to_table.call_args
+        assert copy[0][0] == "activities"
+        assert copy.kwargs["columns"][:2] == ["id", "user_id"]
+        records = copy.kwargs["records"]
+        assert [record[0] for record in records] == [101, 102]
+        assert ["python", "testing"] in records[0]
+        activity_repository.rollup.apply_activities.assert_called_once_with([101, 102])
+        activity_repository.advance_last_activity_end.assert_called_once_with([101, 102])
+
+    @pytest.mark.unit
+    async def test_copy_create_with_no_items_skips_database(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that a batch without valid rows runs nothing.
+        """
+        assert await activity_repository.copy_create([]) == []
+        mock_session.execute.assert_not_called()
+
+
+class TestActivityRepositoryKeysetPagination:
+    """
+    Test suite for keyset pagination in recent activity queries.
+
+    Verifies that the ``before`` cursor position is translated into a
+    row-value comparison and a deterministic (start_time, id) ordering.
+    """
+
+    @pytest.mark.unit
+    async def test_get_recent_by_user_with_before_adds_keyset_condition(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that cursor position filters older rows via row comparison.
+
+        GIVEN: A (start_time, id) position from a previous page
+        WHEN: get_recent_by_user(before=position) is called
+        THEN: Query compares (start_time, id) tuple and orders by both DESC
+        """
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        await activity_repository.get_recent_by_user(
+            user_id=1,
+            limit=10,
+            before=(datetime(2025, 11, 7, 10, 0), 42)
+        )
+
+        # Assert: Keyset predicate and tie-breaker ordering present
+        query = mock_session.execute.call_args[0][0]
+        sql = str(query)
+        assert "(activities.start_time, activities.id) <" in sql
+        assert "ORDER BY activities.start_time DESC, activities.id DESC" in sql
+
+    @pytest.mark.unit
+    async def test_get_recent_by_user_and_category_without_before_has_no_keyset(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that first page query has no keyset predicate.
+
+        GIVEN: No cursor position
+        WHEN: get_recent_by_user_and_category() is called
+        THEN: Query contains no row comparison
+        """
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        await activity_repository.get_recent_by_user_and_category(user_id=1, category_id=2)
+
+        # Assert
+        sql = str(mock_session.execute.call_args[0][0])
+        assert "(activities.start_time, activities.id) <" not in sql
+        assert "activities.category_id =" in sql
+
+
+class TestActivityRepositoryExport:
+    """
+    Test suite for ActivityRepository.stream_for_export().
+
+    Verifies the export reads through a server-side cursor in batches.
+    """
+
+    @pytest.mark.unit
+    async def test_stream_for_export_uses_server_side_cursor(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that activities are streamed in batches, not materialized.
+
+        GIVEN: A user with activities
+        WHEN: stream_for_export() is iterated
+        THEN: session.stream() is used once with yield_per batching, plain
+              columns with the category name LEFT JOINed, oldest first,
+              and the cursor's partitions are passed through
+        """
+        # Arrange
+        batch = [{"id": 1, "description": "Coding session"}]
+
+        async def partitions():
+            yield batch
+
+        mock_result = MagicMock()
+        mock_result.mappings.return_value.partitions.return_value = partitions()
+        mock_session.stream = AsyncMock(return_value=mock_result)
+
+        # Act
+        batches = [
+            rows async for rows in
+            activity_repository.stream_for_export(1, batch_size=500)
+        ]
+
+        # Assert
+        assert batches == [batch]
+        mock_session.stream.assert_called_once()
+        mock_session.execute.assert_not_called()
+        stmt = mock_session.stream.call_args[0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "categories.name AS category_name" in sql
+        assert "LEFT OUTER JOIN categories" in sql
+        assert "ORDER BY activities.start_time, activities.id" in sql
+        assert stmt.get_execution_options()["yield_per"] == 500
+
+
+class TestActivityRepositoryTimeWindow:
+    """
+    Test suite for time-window (overlap) queries.
+
+    Verifies the overlap condition matches the GiST index expression.
+    """
+
+    @pytest.mark.unit
+    async def test_get_overlapping_uses_range_overlap_operator(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that the window is an indexed tstzrange overlap condition.
+
+        GIVEN: A [from, to) window and a category
+        WHEN: get_overlapping() is called
+        THEN: Query tests tstzrange(start_time, end_time) && tstzrange(from, to),
+              filters by category and keeps the most-recent-first ordering
+        """
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        await activity_repository.get_overlapping(
+            user_id=1,
+            start=datetime(2025, 11, 7),
+            end=datetime(2025, 11, 8),
+            category_id=2
+        )
+
+        # Assert
+        sql = str(mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "tstzrange(activities.start_time, activities.end_time) && tstzrange(" in sql
+        assert "activities.category_id =" in sql
+        assert "ORDER BY activities.start_time DESC, activities.id DESC" in sql
+
+    @pytest.mark.unit
+    async def test_get_overlapping_open_bound_is_null(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that a missing bound makes the window unbounded on that side.
+
+        GIVEN: Only a window start
+        WHEN: get_overlapping() is called
+        THEN: The window range has a NULL (infinite) upper bound
+        """
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        await activity_repository.get_overlapping(user_id=1, start=datetime(2025, 11, 7), end=None)
+
+        # Assert
+        sql = str(mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert ", NULL)" in sql
+
+    @pytest.mark.unit
+    async def test_find_overlapping_ids_locks_user_before_checking(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that the overlap check is serialized per user.
+
+        GIVEN: A new activity period
+        WHEN: find_overlapping_ids() is called
+        THEN: A transaction-scoped advisory lock is taken before the overlap query
+        """
+        # Arrange
+        mock_session.scalars = AsyncMock()
+        mock_session.scalars.return_value.all = MagicMock(return_value=[3])
+
+        # Act
+        ids = await activity_repository.find_overlapping_ids(
+            1, datetime(2025, 11, 7, 10, 0), datetime(2025, 11, 7, 11, 0)
+        )
+
+        # Assert
+        lock_sql = str(mock_session.execute.call_args[0][0])
+        check_sql = str(mock_session.scalars.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "pg_advisory_xact_lock" in lock_sql
+        assert "&& tstzrange(" in check_sql
+        assert ids == [3]
+
+    @pytest.mark.unit
+    async def test_get_gaps_uses_lag_over_running_coverage(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that gaps are computed in one window-function query.
+
+        GIVEN: A [from, to) window and a 15 minute minimum
+        WHEN: get_gaps() is called
+        THEN: A single query clips activities to the window, adds edge markers,
+              compares each start with LAG() of the running max(end_time)
+              and filters gaps by length
+        """
+        # Arrange
+        gap = {"gap_start": datetime(2025, 11, 7, 9, 0), "gap_end": datetime(2025, 11, 7, 10, 0)}
+        mock_result = MagicMock()
+        mock_result.mappings.return_value = [gap]
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        gaps = await activity_repository.get_gaps(
+            1, datetime(2025, 11, 7), datetime(2025, 11, 8), min_minutes=15
+        )
+
+        # Assert
+        mock_session.execute.assert_called_once()
+        sql = str(mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "greatest(activities.start_time" in sql
+        assert "UNION ALL" in sql
+        assert "max(spans.span_end) OVER" in sql
+        assert "lag(covered.covered_until) OVER" in sql
+        assert "lagged.span_start - lagged.previous_end >=" in sql
+        assert gaps == [gap]
+
+
+class TestActivityRepositorySearch:
+    """
+    Test suite for ActivityRepository.search() full-text query.
+
+    Verifies the query matches the generated search_vector column and the
+    (user_id, search_vector) GIN index.
+    """
+
+    @pytest.mark.unit
+    async def test_search_matches_both_configurations_and_ranks(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that search is one ranked @@ query over the stored vector.
+
+        GIVEN: A search text and a keyset position
+        WHEN: search() is called
+        THEN: The text is parsed in the 'russian' and 'simple' configurations,
+              matched with @@ against search_vector, ranked with ts_rank and
+              paged by (rank, start_time, id)
+        """
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        await activity_repository.search(
+            1, "утренняя пробежка", limit=20, before=(0.5, datetime(2025, 11, 7), 9)
+        )
+
+        # Assert
+        mock_session.execute.assert_called_once()
+        compiled = mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        assert "activities.search_vector @@ (websearch_to_tsquery(" in sql
+        assert "ts_rank(activities.search_vector" in sql
+        assert "activities.start_time, activities.id) <" in sql
+        assert "DESC, activities.start_time DESC, activities.id DESC" in sql
+        assert {"russian", "simple"} <= set(compiled.params.values())
+
+    @pytest.mark.unit
+    def test_search_vector_is_not_returned_by_inserts(self):
+        """
+        Test that the generated vector stays out of ORM writes.
+
+        GIVEN: The Activity mapping (eager_defaults fetches server-generated
+               columns with RETURNING)
+        WHEN: An activity INSERT ... RETURNING Activity is compiled the way
+              Session.execute() does
+        THEN: Neither the INSERT nor its RETURNING mention search_vector, and
+              flush() only fetches created_at back
+        """
+        # Arrange: "orm" is the strategy Session.execute() picks for this statement
+        stmt = (
+            insert(Activity)
+            .values(user_id=1, description="Бег")
+            .returning(Activity)
+            ._annotate({"dml_strategy": "orm"})
+        )
+
+        # Act
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        # Assert
+        assert "RETURNING activities.id" in sql
+        assert "search_vector" not in sql
+        assert "search_vector" not in sa_inspect(Activity).columns
+        assert sa_inspect(Activity)._server_default_plus_onupdate_propkeys == {"created_at"}
+
+
+class TestActivityRepositoryRecentDescriptions:
+    """
+    Test suite for ActivityRepository.get_recent_descriptions().
+
+    Verifies deduplication and counting happen in SQL.
+    """
+
+    @pytest.mark.unit
+    async def test_get_recent_descriptions_uses_distinct_on_with_counts(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that descriptions are deduplicated by DISTINCT ON in one query.
+
+        GIVEN: A category and a prefix containing LIKE wildcards
+        WHEN: get_recent_descriptions() is called
+        THEN: DISTINCT ON (description) keeps the latest activity, a window
+              count gives use counts, the prefix is escaped for ILIKE and
+              results are ordered by last use
+        """
+        # Arrange
+        row = {"description": "50% done", "use_count": 2,
+               "last_used_at": datetime(2025, 11, 7), "last_activity_id": 5}
+        mock_result = MagicMock()
+        mock_result.mappings.return_value = [row]
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        rows = await activity_repository.get_recent_descriptions(
+            1, category_id=2, prefix="50%_", limit=8
+        )
+
+        # Assert
+        mock_session.execute.assert_called_once()
+        compiled = mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        assert "DISTINCT ON (activities.description)" in sql
+        assert "count(*) OVER (PARTITION BY activities.description)" in sql
+        assert "activities.description ILIKE" in sql
+        assert "LEFT OUTER JOIN categories ON categories.id = latest.category_id" in sql
+        assert "ORDER BY latest.last_used_at DESC" in sql
+        assert "50\\%\\_%" in compiled.params.values()
+        assert rows == [row]
+
+
+class TestActivityRepositoryTags:
+    """
+    Test suite for tag queries over the text[] tags column.
+
+    Verifies filtering uses array containment and aggregation happens in SQL.
+    """
+
+    @pytest.mark.unit
+    async def test_get_by_tag_uses_array_containment(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that tag filtering is GIN-indexable.
+
+        GIVEN: A tag and a keyset position
+        WHEN: get_by_tag() is called
+        THEN: The query filters with tags @> ARRAY[tag] and pages by
+              (start_time, id), newest first
+        """
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        await activity_repository.get_by_tag(
+            1, "python", limit=5, before=(datetime(2025, 11, 7, 10, 0), 42)
+        )
+
+        # Assert
+        compiled = mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        assert "activities.tags @> %(tags_1)s::TEXT[]" in sql
+        assert "(activities.start_time, activities.id) <" in sql
+        assert "ORDER BY activities.start_time DESC, activities.id DESC" in sql
+        assert compiled.params["tags_1"] == ["python"]
+
+    @pytest.mark.unit
+    async def test_get_top_tags_unnests_and_groups_in_sql(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that tag totals are one GROUP BY over unnested tags.
+
+        GIVEN: A user and a start_time window
+        WHEN: get_top_tags() is called
+        THEN: Tags are expanded with unnest(), summed per tag and ordered
+              by total minutes
+        """
+        # Arrange
+        row = {"tag": "python", "total_minutes": 120, "activity_count": 2}
+        mock_result = MagicMock()
+        mock_result.mappings.return_value = [row]
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        rows = await activity_repository.get_top_tags(
+            1, start=datetime(2025, 11, 1), end=datetime(2025, 12, 1), limit=5
+        )
+
+        # Assert
+        mock_session.execute.assert_called_once()
+        sql = str(mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "unnest(activities.tags) AS tag" in sql
+        assert "GROUP BY tag" in sql
+        assert "ORDER BY sum(activities.duration_minutes) DESC" in sql
+        assert "activities.start_time >=" in sql
+        assert "activities.start_time <" in sql
+        assert rows == [row]
+
+
+class TestActivityRepositoryStats:
+    """
+    Test suite for ActivityRepository.get_stats() aggregation query.
+
+    Verifies bucketing happens in SQL in the user's timezone.
+    """
+
+    @pytest.mark.unit
+    async def test_get_stats_groups_by_local_bucket_and_category(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that stats are one GROUP BY query over user-local buckets.
+
+        GIVEN: A user and period="week"
+        WHEN: get_stats() is called
+        THEN: A single query converts start_time AT TIME ZONE users.timezone,
+              truncates it to the week and groups by bucket and category
+        """
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.mappings.return_value = [
+            {"bucket": "2025-11-03", "category_id": 1, "category_name": "Work",
+             "total_minutes": 90, "activity_count": 1}
+        ]
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        rows = await activity_repository.get_stats(user_id=1, period="week")
+
+        # Assert
+        mock_session.execute.assert_called_once()
+        sql = str(mock_session.execute.call_args[0][0].compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True}
+        ))
+        assert "activities.start_time AT TIME ZONE users.timezone" in sql
+        assert "date_trunc('week'" in sql
+        assert "GROUP BY" in sql
+        assert "sum(activities.duration_minutes)" in sql
+        assert rows[0]["total_minutes"] == 90
+
+    @pytest.mark.unit
+    async def test_get_stats_applies_time_range(
+        self,
+        activity_repository: ActivityRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that optional bounds filter on start_time.
+
+        GIVEN: from/to bounds
+        WHEN: get_stats() is called
+        THEN: Query has inclusive lower and exclusive upper start_time bounds
+        """
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.mappings.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        rows = await activity_repository.get_stats(
+            user_id=1,
+            period="day",
+            start=datetime(2025, 1, 1),
+            end=datetime(2026, 1, 1)
+        )
+
+        # Assert
+        sql = str(mock_session.execute.call_args[0][0])
+        assert "activities.start_time >=" in sql
+        assert "activities.start_time <" in sql
+        assert rows == []
+
+
 class TestActivityRepositoryEdgeCases:
     """
     Test suite for edge cases specific to ActivityRepository.
@@ -696,11 +1508,11 @@ class TestActivityRepositoryEdgeCases:
         mock_session: AsyncMock
     ):
         """
-        Test activity with single tag (no comma needed).
+        Test activity with single tag.
 
         GIVEN: Activity with tags=["python"]
         WHEN: create() is called
-        THEN: tags field is "python" (single string, no comma)
+        THEN: tags field is a one-element array
         """
         # Arrange: Single tag
         activity_data = ActivityCreate(
@@ -715,9 +1527,9 @@ class TestActivityRepositoryEdgeCases:
         # Act
         result = await activity_repository.create(activity_data)
 
-        # Assert: Single tag without comma
-        assert result.tags == "python", \
-            "Single tag should not have comma"
+        # Assert: One-element array
+        assert result.tags == ["python"], \
+            "Single tag should be a one-element array"
 
     @pytest.mark.unit
     async def test_get_recent_by_user_with_limit_larger_than_activities(
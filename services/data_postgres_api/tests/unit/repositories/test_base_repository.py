@@ -216,7 +216,7 @@ class TestBaseRepositoryCreate:
     Test suite for BaseRepository.create() method.
 
     Tests entity creation flow: schema validation → model instantiation →
-    session persistence → refresh with generated ID.
+    session persistence → generated ID loaded via INSERT ... RETURNING.
     """
 
     @pytest.mark.unit
@@ -233,7 +233,8 @@ class TestBaseRepositoryCreate:
         THEN: Entity is created and returned with auto-generated ID
               AND session.add() is called to stage the entity
               AND session.flush() is called to persist to database
-              AND session.refresh() is called to load generated fields
+              AND session.refresh() is NOT called (RETURNING loads
+              server-generated fields during flush)
         """
         # Arrange: Prepare creation data
         user_data = UserCreate(telegram_id=123456789, username="newuser")
@@ -256,8 +257,8 @@ class TestBaseRepositoryCreate:
             "session.add() should be called once to stage entity"
         mock_session.flush.assert_called_once(), \
             "session.flush() should be called to persist"
-        mock_session.refresh.assert_called_once(), \
-            "session.refresh() should be called to load generated ID"
+        mock_session.refresh.assert_not_called(), \
+            "generated fields come back with the INSERT, no extra SELECT"
 
     @pytest.mark.unit
     async def test_create_calls_model_constructor_with_schema_data(
@@ -321,10 +322,17 @@ class TestBaseRepositoryUpdate:
     """
     Test suite for BaseRepository.update() method.
 
-    Tests the update flow: fetch existing → validate → apply changes →
-    flush → refresh. Critical for partial updates and field exclusion.
+    Tests the update flow: validate → single UPDATE ... RETURNING → entity.
+    Critical for partial updates and field exclusion.
     """
 
+    @staticmethod
+    def _returning(mock_session: AsyncMock, entity):
+        """Configure session.execute() to return entity from RETURNING."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = entity
+        mock_session.execute.return_value = mock_result
+
     @pytest.mark.unit
     async def test_update_when_entity_exists_returns_updated_entity(
         self,
@@ -334,38 +342,34 @@ class TestBaseRepositoryUpdate:
         """
         Test successful entity update.
 
-        GIVEN: User exists with id=1, last_poll_time=None
+        GIVEN: User exists with id=1
         WHEN: update(1, UserUpdate(last_poll_time=datetime)) is called
-        THEN: last_poll_time is updated to datetime
-              AND updated entity is returned
-              AND session.flush() and session.refresh() are called
+        THEN: Entity returned by UPDATE ... RETURNING is returned
+              AND no separate SELECT/flush/refresh round trips happen
         """
         from datetime import datetime, timezone
 
-        # Arrange: Create existing user and update data
-        existing_user = User(id=1, telegram_id=123, username="testuser")
+        # Arrange: Row as returned by the database after the update
         new_poll_time = datetime(2025, 11, 7, 12, 0, 0, tzinfo=timezone.utc)
+        updated_user = User(
+            id=1, telegram_id=123, username="testuser",
+            last_poll_time=new_poll_time
+        )
+        self._returning(mock_session, updated_user)
         update_data = UserUpdate(last_poll_time=new_poll_time)
 
-        # Mock get_by_id to return existing user
-        with patch.object(
-            user_repository,
-            'get_by_id',
-            new=AsyncMock(return_value=existing_user)
-        ):
-            # Act: Update user
-            result = await user_repository.update(1, update_data)
+        # Act: Update user
+        result = await user_repository.update(1, update_data)
 
-            # Assert: User updated and returned
-            assert result is not None, "Updated user should be returned"
-            assert result == existing_user, "Should return same user instance"
-            assert result.last_poll_time == new_poll_time, "last_poll_time should be updated"
+        # Assert: User updated and returned
+        assert result is updated_user, "Updated user should be returned"
+        assert result.last_poll_time == new_poll_time, "last_poll_time should be updated"
 
-            # Verify session operations
-            mock_session.flush.assert_called_once(), \
-                "flush() should persist changes"
-            mock_session.refresh.assert_called_once_with(existing_user), \
-                "refresh() should reload entity from database"
+        # Verify single statement
+        mock_session.execute.assert_called_once(), \
+            "update() should issue exactly one statement"
+        mock_session.flush.assert_not_called()
+        mock_session.refresh.assert_not_called()
 
     @pytest.mark.unit
     async def test_update_when_entity_not_found_returns_none(
@@ -378,23 +382,20 @@ class TestBaseRepositoryUpdate:
 
         GIVEN: No user with id=999
         WHEN: update(999, update_data) is called
-        THEN: None is returned
-              AND session.flush() is NOT called (no changes to persist)
+        THEN: None is returned (UPDATE matched no rows)
         """
         from datetime import datetime, timezone
 
         # Arrange
+        self._returning(mock_session, None)
         update_data = UserUpdate(last_poll_time=datetime(2025, 11, 7, 12, 0, 0, tzinfo=timezone.utc))
 
-        # Mock get_by_id to return None (user not found)
-        with patch.object(user_repository, 'get_by_id', new=AsyncMock(return_value=None)):
-            # Act
-            result = await user_repository.update(999, update_data)
+        # Act
+        result = await user_repository.update(999, update_data)
 
-            # Assert: No update performed
-            assert result is None, "Should return None when entity not found"
-            mock_session.flush.assert_not_called(), \
-                "flush() should not be called when entity not found"
+        # Assert: No entity returned
+        assert result is None, "Should return None when entity not found"
+        mock_session.flush.assert_not_called()
 
     @pytest.mark.unit
     async def test_update_only_updates_provided_fields(
@@ -405,42 +406,63 @@ class TestBaseRepositoryUpdate:
         """
         Test partial update - only provided fields are changed.
 
-        GIVEN: User with last_poll_time=None and timezone="UTC"
-        WHEN: update() called with UserUpdate(last_poll_time=datetime)
-              (other fields not provided in update schema)
-        THEN: last_poll_time is updated to datetime
-              AND timezone remains "UTC" (unchanged)
+        GIVEN: UserUpdate with only last_poll_time set
+        WHEN: update() is called
+        THEN: SET clause contains last_poll_time only
+              AND timezone/username are not touched
 
         This tests exclude_unset=True behavior in model_dump().
         """
         from datetime import datetime, timezone as tz
 
-        # Arrange: User with multiple fields
-        existing_user = User(
-            id=1,
-            telegram_id=123,
-            username="testuser",
-            timezone="UTC"
-        )
-
-        # Update only last_poll_time, leave other fields unchanged
+        # Arrange
+        self._returning(mock_session, None)
         new_poll_time = datetime(2025, 11, 7, 12, 0, 0, tzinfo=tz.utc)
         update_data = UserUpdate(last_poll_time=new_poll_time)
-        # Note: UserUpdate should have all fields optional for partial updates
 
-        with patch.object(
-            user_repository,
-            'get_by_id',
-            new=AsyncMock(return_value=existing_user)
-        ):
-            # Act: Partial update
-            result = await user_repository.update(1, update_data)
+        # Act: Partial update
+        await user_repository.update(1, update_data)
 
-            # Assert: Only updated field changed
-            assert result.last_poll_time == new_poll_time, \
-                "Provided field should be updated"
-            assert result.timezone == "UTC", \
-                "Non-provided field should remain unchanged"
+        # Assert: Only provided field is part of the statement
+        params = mock_session.execute.call_args[0][0].compile().params
+        assert params["last_poll_time"] == new_poll_time, \
+            "Provided field should be updated"
+        assert "timezone" not in params, \
+            "Non-provided field should remain unchanged"
+        assert "username" not in params
+
+    @pytest.mark.unit
+    async def test_update_emits_update_with_returning(
+        self,
+        user_repository: BaseRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that update() is a single UPDATE ... WHERE id ... RETURNING.
+
+        GIVEN: update() method implementation
+        WHEN: update() is called with non-empty data
+        THEN: Statement targets users by primary key and returns the row
+              AND existing identity-map instances are refreshed from it
+        """
+        from datetime import datetime, timezone
+
+        # Arrange
+        self._returning(mock_session, None)
+        update_data = UserUpdate(
+            last_poll_time=datetime(2025, 11, 7, 12, 0, 0, tzinfo=timezone.utc)
+        )
+
+        # Act
+        await user_repository.update(1, update_data)
+
+        # Assert
+        stmt = mock_session.execute.call_args[0][0]
+        sql = str(stmt)
+        assert sql.startswith("UPDATE users")
+        assert "WHERE users.id" in sql
+        assert "RETURNING" in sql
+        assert stmt.get_execution_options().get("populate_existing") is True
 
     @pytest.mark.unit
     async def test_update_handles_empty_update_data(
@@ -453,8 +475,8 @@ class TestBaseRepositoryUpdate:
 
         GIVEN: User exists
         WHEN: update() called with empty UserUpdate() (no fields set)
-        THEN: Entity is returned unchanged
-              AND flush/refresh still called (to ensure consistency)
+        THEN: No UPDATE is issued; entity is fetched via get_by_id()
+              and returned unchanged
         """
         # Arrange
         existing_user = User(
@@ -470,14 +492,18 @@ class TestBaseRepositoryUpdate:
             user_repository,
             'get_by_id',
             return_value=existing_user
-        ):
+        ) as mock_get_by_id:
             # Act
             result = await user_repository.update(1, update_data)
 
-            # Assert: User returned unchanged
-            assert result is not None
-            assert result.username == "original_name", \
-                "Fields should remain unchanged with empty update"
+        # Assert: User returned unchanged
+        assert result is not None
+        assert result.username == "original_name", \
+            "Fields should remain unchanged with empty update"
+        mock_get_by_id.assert_called_once_with(1)
+        mock_session.execute.assert_not_called()
+
+
 
 
 class TestBaseRepositoryDelete:
@@ -602,34 +628,6 @@ class TestBaseRepositoryIntegration:
         # For unit tests, we verify each method independently
         pass  # Documented for future integration test suite
 
-    @pytest.mark.unit
-    async def test_update_uses_get_by_id_internally(
-        self,
-        user_repository: BaseRepository,
-        mock_session: AsyncMock
-    ):
-        """
-        Test that update() correctly calls get_by_id() internally.
-
-        GIVEN: update() method implementation
-        WHEN: update() is called
-        THEN: get_by_id() is called first to fetch existing entity
-        """
-        # Arrange
-        update_data = UserUpdate(username="new_name")
-
-        # Act: Call update - should internally call get_by_id
-        with patch.object(
-            user_repository,
-            'get_by_id',
-            return_value=None
-        ) as mock_get_by_id:
-            await user_repository.update(1, update_data)
-
-        # Assert: get_by_id was called
-        mock_get_by_id.assert_called_once_with(1), \
-            "update() should call get_by_id() to fetch existing entity"
-
 
 # ============================================================================
 # EDGE CASES & ERROR HANDLING
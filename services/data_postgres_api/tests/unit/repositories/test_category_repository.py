@@ -8,6 +8,8 @@ Test Coverage:
     - get_by_user_and_name(): Lookup by user and name, uniqueness check
     - get_all_by_user(): All categories for user, ordering
     - count_by_user(): Category count calculation
+    - create_if_absent() / bulk_create_if_absent(): ON CONFLICT upserts
+    - upsert_names(): Category name -> ID resolution for imports
     - Inherited base methods: Covered in test_base_repository.py
 
 Coverage Target: 100% of category_repository.py
@@ -20,6 +22,7 @@ Date: 2025-11-07
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.repositories.category_repository import (
@@ -518,6 +521,148 @@ class TestCategoryRepositoryCountByUser:
         assert isinstance(result, int), "Count should be integer"
 
 
+class TestCategoryRepositoryCreateIfAbsent:
+    """
+    Test suite for ON CONFLICT based category creation.
+
+    Verifies duplicates are resolved by the unique constraint in a single
+    statement instead of a SELECT before every INSERT.
+    """
+
+    @pytest.mark.unit
+    async def test_bulk_create_if_absent_is_single_upsert_statement(
+        self,
+        category_repository: CategoryRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that bulk creation issues one INSERT ... ON CONFLICT DO NOTHING.
+
+        GIVEN: Several new category names
+        WHEN: bulk_create_if_absent() is called
+        THEN: One statement is executed, backed by uix_user_category_name,
+              and created rows are returned in input order
+        """
+        # Arrange
+        items = [
+            CategoryCreate(user_id=1, name="Work"),
+            CategoryCreate(user_id=1, name="Sport"),
+            CategoryCreate(user_id=1, name="Rest"),
+        ]
+        returned = [
+            Category(id=12, user_id=1, name="Rest"),
+            Category(id=10, user_id=1, name="Work"),
+        ]
+        mock_result = MagicMock()
+        mock_result.all.return_value = returned
+        mock_session.scalars = AsyncMock(return_value=mock_result)
+
+        # Act
+        result = await category_repository.bulk_create_if_absent(items)
+
+        # Assert
+        assert [category.name for category in result] == ["Work", "Rest"]
+        mock_session.scalars.assert_called_once()
+        mock_session.execute.assert_not_called()
+        sql = str(
+            mock_session.scalars.call_args[0][0].compile(dialect=postgresql.dialect())
+        )
+        assert "ON CONFLICT ON CONSTRAINT uix_user_category_name DO NOTHING" in sql
+        assert "RETURNING" in sql
+        assert "name_m2" in sql, "All rows should be in one multi-row VALUES"
+
+    @pytest.mark.unit
+    async def test_bulk_create_if_absent_with_empty_list_skips_database(
+        self,
+        category_repository: CategoryRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that an empty batch does not hit the database.
+
+        GIVEN: No categories
+        WHEN: bulk_create_if_absent() is called
+        THEN: Empty list is returned without a statement
+        """
+        mock_session.scalars = AsyncMock()
+
+        result = await category_repository.bulk_create_if_absent([])
+
+        assert result == []
+        mock_session.scalars.assert_not_called()
+
+    @pytest.mark.unit
+    async def test_create_if_absent_returns_none_on_conflict(
+        self,
+        category_repository: CategoryRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that a taken name yields None.
+
+        GIVEN: Category name already exists for user
+        WHEN: create_if_absent() is called
+        THEN: None is returned (RETURNING produced no row)
+        """
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_session.scalars = AsyncMock(return_value=mock_result)
+
+        # Act
+        result = await category_repository.create_if_absent(
+            CategoryCreate(user_id=1, name="Work")
+        )
+
+        # Assert
+        assert result is None
+
+
+    @pytest.mark.unit
+    async def test_upsert_names_resolves_existing_and_new_in_one_statement(
+        self,
+        category_repository: CategoryRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that names are resolved to IDs with one INSERT ... DO UPDATE.
+
+        GIVEN: Category names, one repeated
+        WHEN: upsert_names() is called
+        THEN: One statement with deduplicated VALUES returns name -> id for
+              existing and newly created categories alike
+        """
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.tuples.return_value.all.return_value = [("Work", 10), ("Sport", 11)]
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        result = await category_repository.upsert_names(1, ["Work", "Sport", "Work"])
+
+        # Assert
+        assert result == {"Work": 10, "Sport": 11}
+        mock_session.execute.assert_called_once()
+        sql = str(
+            mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+        )
+        assert "ON CONFLICT ON CONSTRAINT uix_user_category_name DO UPDATE SET name = excluded.name" in sql
+        assert "RETURNING categories.name, categories.id" in sql
+        assert "name_m1" in sql and "name_m2" not in sql, "Repeated names should be collapsed"
+
+    @pytest.mark.unit
+    async def test_upsert_names_with_no_names_skips_database(
+        self,
+        category_repository: CategoryRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that an empty name list does not hit the database.
+        """
+        assert await category_repository.upsert_names(1, []) == {}
+        mock_session.execute.assert_not_called()
+
+
 class TestCategoryRepositoryInheritance:
     """
     Test suite verifying CategoryRepository inherits base methods.
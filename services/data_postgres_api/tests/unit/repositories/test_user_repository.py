@@ -16,7 +16,9 @@ Date: 2025-11-07
 """
 
 import pytest
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.repositories.user_repository import UserRepository
@@ -293,6 +295,51 @@ class TestUserRepositoryGetByTelegramId:
             "Should use scalar_one_or_none() for unique telegram_id lookup"
 
 
+class TestUserRepositoryUpsertByTelegramId:
+    """
+    Test suite for upsert_by_telegram_id() method.
+
+    Onboarding must be idempotent under Telegram update redelivery.
+    """
+
+    @pytest.mark.unit
+    async def test_upsert_by_telegram_id_is_single_on_conflict_statement(
+        self,
+        user_repository: UserRepository,
+        mock_session: AsyncMock,
+        sample_user: User
+    ):
+        """
+        Test that upsert is one INSERT ... ON CONFLICT (telegram_id) DO UPDATE.
+
+        GIVEN: Telegram profile data
+        WHEN: upsert_by_telegram_id() is called
+        THEN: One statement refreshes username/first_name on conflict
+              AND returns the user with the inserted flag
+        """
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.one.return_value = (sample_user, True)
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        user, created = await user_repository.upsert_by_telegram_id(
+            UserCreate(telegram_id=123456789, username="testuser", first_name="Test")
+        )
+
+        # Assert
+        assert user == sample_user
+        assert created is True
+        mock_session.execute.assert_called_once()
+        sql = str(
+            mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+        )
+        assert "ON CONFLICT (telegram_id) DO UPDATE" in sql
+        assert "username = excluded.username" in sql
+        assert "timezone = excluded" not in sql, "Timezone must not be overwritten"
+        assert "xmax = 0 AS created" in sql
+
+
 class TestUserRepositoryInheritance:
     """
     Test suite verifying UserRepository inherits base methods correctly.
@@ -376,18 +423,16 @@ class TestUserRepositoryInheritance:
         # Arrange
         update_data = UserUpdate(username="updated_name")
 
-        from unittest.mock import patch
-        with patch.object(
-            user_repository,
-            'get_by_id',
-            return_value=sample_user
-        ):
-            # Act: Call inherited method
-            result = await user_repository.update(1, update_data)
-
-            # Assert: Inherited method works
-            assert result is not None, \
-                "Inherited update() should be functional"
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = sample_user
+        mock_session.execute.return_value = mock_result
+
+        # Act: Call inherited method
+        result = await user_repository.update(1, update_data)
+
+        # Assert: Inherited method works
+        assert result is not None, \
+            "Inherited update() should be functional"
 
     @pytest.mark.unit
     async def test_user_repository_inherits_delete(
@@ -569,3 +614,98 @@ class TestUserRepositoryPerformance:
 
         assert "where" in query_str or "telegram_id =" in query_str, \
             "Query should use WHERE clause for efficient filtering"
+
+    @pytest.mark.unit
+    async def test_get_context_by_telegram_id_executes_single_query(
+        self,
+        user_repository: UserRepository,
+        mock_session: AsyncMock,
+        sample_user: User
+    ):
+        """
+        Test that user context (settings, categories, last activity) is one query.
+
+        GIVEN: telegram_id lookup for bot handler context
+        WHEN: get_context_by_telegram_id() is called
+        THEN: One SELECT joins settings and categories, and the last
+              activity end time comes from the denormalized users column
+              without touching the activities table
+        """
+        # Arrange
+        last_end = datetime(2025, 11, 7, 12, 0, 0)
+        sample_user.last_activity_end_time = last_end
+        mock_result = MagicMock()
+        mock_result.unique.return_value.scalars.return_value.first.return_value = sample_user
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        context = await user_repository.get_context_by_telegram_id(123456789)
+
+        # Assert
+        assert context == (sample_user, last_end)
+        assert mock_session.execute.call_count == 1
+        sql = str(mock_session.execute.call_args[0][0])
+        assert "LEFT OUTER JOIN user_settings" in sql
+        assert "LEFT OUTER JOIN categories" in sql
+        assert "users.last_activity_end_time" in sql
+        assert "activities" not in sql
+
+    @pytest.mark.unit
+    async def test_get_context_by_telegram_id_when_user_not_found_returns_none(
+        self,
+        user_repository: UserRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test context lookup for unknown user.
+
+        GIVEN: No user with telegram_id
+        WHEN: get_context_by_telegram_id() is called
+        THEN: None is returned
+        """
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.unique.return_value.scalars.return_value.first.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        # Act & Assert
+        assert await user_repository.get_context_by_telegram_id(1) is None
+
+    @pytest.mark.unit
+    async def test_stream_active_users_with_settings_uses_server_side_cursor(
+        self,
+        user_repository: UserRepository,
+        mock_session: AsyncMock,
+        sample_user: User
+    ):
+        """
+        Test that active users are streamed with settings from one JOIN.
+
+        GIVEN: Active users in database
+        WHEN: stream_active_users_with_settings() is iterated
+        THEN: session.stream() (server-side cursor) is used once with
+              settings LEFT JOINed and yield_per batching
+        """
+        # Arrange
+        async def scalars():
+            yield sample_user
+
+        mock_result = MagicMock()
+        mock_result.scalars.return_value = scalars()
+        mock_session.stream = AsyncMock(return_value=mock_result)
+
+        # Act
+        users = [
+            user async for user in
+            user_repository.stream_active_users_with_settings(batch_size=500)
+        ]
+
+        # Assert
+        assert users == [sample_user]
+        mock_session.stream.assert_called_once()
+        mock_session.execute.assert_not_called()
+        stmt = mock_session.stream.call_args[0][0]
+        sql = str(stmt)
+        assert "LEFT OUTER JOIN user_settings" in sql
+        assert "users.last_poll_time IS NOT NULL" in sql
+        assert stmt.get_execution_options()["yield_per"] == 500
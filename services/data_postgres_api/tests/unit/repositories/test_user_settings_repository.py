@@ -19,6 +19,7 @@ Date: 2025-11-07
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import time
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.repositories.user_settings_repository import (
@@ -243,9 +244,16 @@ class TestUserSettingsRepositoryUpdate:
     Test suite for UserSettingsRepository.update() method.
 
     Tests the overridden update method that updates by user_id instead of
-    settings table's primary key ID.
+    settings table's primary key ID, using a single UPDATE ... RETURNING.
     """
 
+    @staticmethod
+    def _returning(mock_session: AsyncMock, settings):
+        """Configure session.execute() to return settings from RETURNING."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = settings
+        mock_session.execute.return_value = mock_result
+
     @pytest.mark.unit
     async def test_update_when_settings_exist_returns_updated_settings(
         self,
@@ -257,39 +265,35 @@ class TestUserSettingsRepositoryUpdate:
 
         GIVEN: User settings exist for user_id=1
         WHEN: update(1, UserSettingsUpdate(...)) is called
-        THEN: Settings are updated and returned
+        THEN: Settings returned by UPDATE ... RETURNING are returned
+              without an extra flush/refresh round trip
         """
-        # Arrange: Existing settings
-        existing_settings = UserSettings(
+        # Arrange: Row as returned by the database after the update
+        updated_settings = UserSettings(
             id=1,
             user_id=1,
-            poll_interval_weekday=120,
+            poll_interval_weekday=90,
             poll_interval_weekend=180,
             reminder_enabled=True
         )
+        self._returning(mock_session, updated_settings)
 
         update_data = UserSettingsUpdate(
             poll_interval_weekday=90  # Only update this field
         )
 
-        # Mock get_by_user_id to return existing settings
-        with patch.object(
-            user_settings_repository,
-            'get_by_user_id',
-            return_value=existing_settings
-        ):
-            # Act
-            result = await user_settings_repository.update(1, update_data)
+        # Act
+        result = await user_settings_repository.update(1, update_data)
 
-            # Assert
-            assert result is not None, "Should return updated settings"
-            assert result == existing_settings
-            assert result.poll_interval_weekday == 90, \
-                "Field should be updated"
+        # Assert
+        assert result is updated_settings, "Should return updated settings"
+        assert result.poll_interval_weekday == 90, \
+            "Field should be updated"
 
-            # Verify session operations
-            mock_session.flush.assert_called_once()
-            mock_session.refresh.assert_called_once_with(existing_settings)
+        # Verify single statement, no extra round trips
+        mock_session.execute.assert_called_once()
+        mock_session.flush.assert_not_called()
+        mock_session.refresh.assert_not_called()
 
     @pytest.mark.unit
     async def test_update_when_settings_not_found_returns_none(
@@ -302,101 +306,50 @@ class TestUserSettingsRepositoryUpdate:
 
         GIVEN: No settings exist for user_id=999
         WHEN: update(999, update_data) is called
-        THEN: None is returned without attempting update
+        THEN: None is returned (UPDATE matched no rows)
         """
         # Arrange
+        self._returning(mock_session, None)
         update_data = UserSettingsUpdate(poll_interval_weekday=90)
 
-        # Mock get_by_user_id to return None
-        with patch.object(
-            user_settings_repository,
-            'get_by_user_id',
-            return_value=None
-        ):
-            # Act
-            result = await user_settings_repository.update(999, update_data)
-
-            # Assert
-            assert result is None, \
-                "Should return None when settings not found"
-
-            # Verify no write operations performed
-            mock_session.flush.assert_not_called()
-
-    @pytest.mark.unit
-    async def test_update_only_updates_provided_fields(
-        self,
-        user_settings_repository: UserSettingsRepository,
-        mock_session: AsyncMock
-    ):
-        """
-        Test partial update - only provided fields are changed.
-
-        GIVEN: Settings with multiple fields
-        WHEN: update() called with UserSettingsUpdate(reminder_enabled=False)
-              (only one field provided)
-        THEN: Only reminder_enabled is updated
-              Other fields remain unchanged
-        """
-        # Arrange: Settings with multiple fields
-        existing_settings = UserSettings(
-            id=1,
-            user_id=1,
-            poll_interval_weekday=120,
-            poll_interval_weekend=180,
-            quiet_hours_start=time(22, 0),
-            quiet_hours_end=time(8, 0),
-            reminder_enabled=True
-        )
-
-        # Update only reminder_enabled
-        update_data = UserSettingsUpdate(reminder_enabled=False)
-
-        with patch.object(
-            user_settings_repository,
-            'get_by_user_id',
-            return_value=existing_settings
-        ):
-            # Act
-            result = await user_settings_repository.update(1, update_data)
+        # Act
+        result = await user_settings_repository.update(999, update_data)
 
-            # Assert: Only updated field changed
-            assert result.reminder_enabled is False, \
-                "reminder_enabled should be updated"
-            assert result.poll_interval_weekday == 120, \
-                "poll_interval_weekday should remain unchanged"
-            assert result.poll_interval_weekend == 180, \
-                "poll_interval_weekend should remain unchanged"
-            assert result.quiet_hours_start == time(22, 0), \
-                "quiet_hours_start should remain unchanged"
+        # Assert
+        assert result is None, \
+            "Should return None when settings not found"
+        mock_session.flush.assert_not_called()
 
     @pytest.mark.unit
-    async def test_update_calls_get_by_user_id_internally(
+    async def test_update_emits_update_returning_by_user_id(
         self,
         user_settings_repository: UserSettingsRepository,
         mock_session: AsyncMock
     ):
         """
-        Test that update() calls get_by_user_id() to fetch settings.
+        Test that update() issues UPDATE ... WHERE user_id ... RETURNING.
 
         GIVEN: update() method implementation
         WHEN: update() is called
-        THEN: get_by_user_id() is called first to fetch existing settings
+        THEN: One UPDATE statement filtered by user_settings.user_id with a
+              RETURNING clause is executed, setting only provided fields
         """
         # Arrange
-        update_data = UserSettingsUpdate(poll_interval_weekday=90)
+        self._returning(mock_session, None)
+        update_data = UserSettingsUpdate(reminder_enabled=False)
 
-        # Act: Call update - should internally call get_by_user_id
-        with patch.object(
-            user_settings_repository,
-            'get_by_user_id',
-            return_value=None
-        ) as mock_get_by_user_id:
-            await user_settings_repository.update(1, update_data)
+        # Act
+        await user_settings_repository.update(1, update_data)
 
-        # Assert: get_by_user_id was called
-        mock_get_by_user_id.assert_called_once_with(1), \
-            "update() should call get_by_user_id() with user_id"
+        # Assert
+        stmt = mock_session.execute.call_args[0][0]
+        sql = str(stmt)
+        assert sql.startswith("UPDATE user_settings")
+        assert "user_settings.user_id" in sql
+        assert "RETURNING" in sql
+        assert "reminder_enabled" in sql
+        assert "poll_interval_weekday" not in sql.split("WHERE")[0], \
+            "Unset fields should not be part of SET clause"
 
     @pytest.mark.unit
     async def test_update_handles_empty_update_data(
@@ -409,8 +362,7 @@ class TestUserSettingsRepositoryUpdate:
 
         GIVEN: UserSettingsUpdate() with no fields set
         WHEN: update() is called
-        THEN: Settings are returned unchanged
-              flush/refresh still called for consistency
+        THEN: No UPDATE is issued; current settings are returned unchanged
         """
         # Arrange: Existing settings
         existing_settings = UserSettings(
@@ -427,14 +379,16 @@ class TestUserSettingsRepositoryUpdate:
             user_settings_repository,
             'get_by_user_id',
             return_value=existing_settings
-        ):
+        ) as mock_get_by_user_id:
             # Act
             result = await user_settings_repository.update(1, update_data)
 
-            # Assert: Settings returned unchanged
-            assert result is not None
-            assert result.poll_interval_weekday == 120
-            assert result.poll_interval_weekend == 180
+        # Assert: Settings returned unchanged
+        assert result is existing_settings
+        assert result.poll_interval_weekday == 120
+        assert result.poll_interval_weekend == 180
+        mock_get_by_user_id.assert_called_once_with(1)
+        mock_session.execute.assert_not_called()
 
     @pytest.mark.unit
     async def test_update_updates_multiple_fields_at_once(
@@ -447,36 +401,64 @@ class TestUserSettingsRepositoryUpdate:
 
         GIVEN: Settings with default values
         WHEN: update() called with multiple fields in UserSettingsUpdate
-        THEN: All provided fields are updated
+        THEN: All provided fields are part of the single UPDATE statement
         """
         # Arrange
-        existing_settings = UserSettings(
-            id=1,
-            user_id=1,
-            poll_interval_weekday=120,
-            poll_interval_weekend=180,
-            reminder_enabled=True
-        )
-
-        # Update multiple fields
+        self._returning(mock_session, None)
         update_data = UserSettingsUpdate(
             poll_interval_weekday=90,
             poll_interval_weekend=150,
             reminder_enabled=False
         )
 
-        with patch.object(
-            user_settings_repository,
-            'get_by_user_id',
-            return_value=existing_settings
-        ):
-            # Act
-            result = await user_settings_repository.update(1, update_data)
+        # Act
+        await user_settings_repository.update(1, update_data)
+
+        # Assert: All fields in SET clause of one statement
+        mock_session.execute.assert_called_once()
+        params = mock_session.execute.call_args[0][0].compile().params
+        assert params["poll_interval_weekday"] == 90
+        assert params["poll_interval_weekend"] == 150
+        assert params["reminder_enabled"] is False
+
+
+
+
+class TestUserSettingsRepositoryCreateIfAbsent:
+    """
+    Test suite for create_if_absent() method.
+    """
+
+    @pytest.mark.unit
+    async def test_create_if_absent_uses_on_conflict_do_nothing(
+        self,
+        user_settings_repository: UserSettingsRepository,
+        mock_session: AsyncMock
+    ):
+        """
+        Test that missing settings are inserted with ON CONFLICT DO NOTHING.
+
+        GIVEN: User that may already have settings
+        WHEN: create_if_absent() is called
+        THEN: One INSERT ... ON CONFLICT (user_id) DO NOTHING RETURNING runs
+              AND None is returned when nothing was inserted
+        """
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.one_or_none.return_value = None
+        mock_session.scalars = AsyncMock(return_value=mock_result)
 
-            # Assert: All fields updated
-            assert result.poll_interval_weekday == 90
-            assert result.poll_interval_weekend == 150
-            assert result.reminder_enabled is False
+        # Act
+        result = await user_settings_repository.create_if_absent(UserSettingsCreate(user_id=1))
+
+        # Assert
+        assert result is None
+        mock_session.scalars.assert_called_once()
+        sql = str(
+            mock_session.scalars.call_args[0][0].compile(dialect=postgresql.dialect())
+        )
+        assert "ON CONFLICT (user_id) DO NOTHING" in sql
+        assert "RETURNING" in sql
 
 
 class TestUserSettingsRepositoryInheritance:
@@ -608,34 +590,26 @@ class TestUserSettingsRepositoryEdgeCases:
 
         GIVEN: Settings with quiet_hours_start set
         WHEN: update() with only weekday_interval (not quiet_hours)
-        THEN: quiet_hours_start remains set (not overwritten with None)
+        THEN: quiet_hours_* are not part of the UPDATE statement
 
         This tests exclude_unset=True in model_dump().
         """
-        # Arrange: Settings with optional field set
-        existing_settings = UserSettings(
-            id=1,
-            user_id=1,
-            poll_interval_weekday=120,
-            quiet_hours_start=time(22, 0),  # Optional field set
-            quiet_hours_end=time(8, 0)
-        )
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
 
         # Update only weekday_interval (not quiet_hours)
         update_data = UserSettingsUpdate(poll_interval_weekday=90)
 
-        with patch.object(
-            user_settings_repository,
-            'get_by_user_id',
-            return_value=existing_settings
-        ):
-            # Act
-            result = await user_settings_repository.update(1, update_data)
+        # Act
+        await user_settings_repository.update(1, update_data)
 
-            # Assert: Optional fields preserved
-            assert result.quiet_hours_start == time(22, 0), \
-                "Unset optional fields should not be overwritten"
-            assert result.quiet_hours_end == time(8, 0)
+        # Assert: Optional fields not part of the UPDATE
+        params = mock_session.execute.call_args[0][0].compile().params
+        assert "quiet_hours_start" not in params, \
+            "Unset optional fields should not be overwritten"
+        assert "quiet_hours_end" not in params
 
     @pytest.mark.unit
     async def test_repository_initialization_sets_model_correctly(
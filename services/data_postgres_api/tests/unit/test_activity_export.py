@@ -0,0 +1,92 @@
+"""
+Unit tests for streaming activity export encoders.
+"""
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from src.application.utils.activity_export import (
+    EXPORT_COLUMNS,
+    encode_csv,
+    encode_ndjson,
+    encode_parquet,
+)
+
+
+def _row(activity_id: int, tags=None) -> dict:
+    return {
+        "id": activity_id,
+        "category_id": 2,
+        "category_name": "Работа",
+        "description": 'Code review, "big" PR',
+        "tags": tags,
+        "start_time": datetime(2025, 11, 7, 10, 0, tzinfo=timezone.utc),
+        "end_time": datetime(2025, 11, 7, 11, 30, tzinfo=timezone.utc),
+        "duration_minutes": 90,
+        "created_at": datetime(2025, 11, 7, 11, 31, tzinfo=timezone.utc),
+    }
+
+
+async def _batches(*batches):
+    for rows in batches:
+        yield rows
+
+
+async def _collect(chunks) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_encode_csv_yields_header_then_one_chunk_per_batch():
+    """Test that CSV is emitted incrementally and quotes commas in tags/descriptions."""
+    chunks = await _collect(encode_csv(_batches([_row(1, ["python", "review"])], [_row(2)])))
+
+    assert len(chunks) == 3
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+    assert rows[0] == list(EXPORT_COLUMNS)
+    assert rows[1][3] == 'Code review, "big" PR'
+    assert rows[1][4] == "python,review"
+    assert rows[1][5] == "2025-11-07T10:00:00+00:00"
+    assert rows[2][4] == ""
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_encode_csv_without_activities_yields_header_only():
+    """Test that an empty export is still a valid CSV file."""
+    chunks = await _collect(encode_csv(_batches()))
+
+    assert b"".join(chunks).decode().strip() == ",".join(EXPORT_COLUMNS)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_encode_ndjson_writes_one_object_per_line():
+    """Test that every activity becomes one JSON line with tags as an array."""
+    chunks = await _collect(encode_ndjson(_batches([_row(1, ["python"]), _row(2)])))
+
+    lines = b"".join(chunks).decode().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2]
+    assert json.loads(lines[0])["tags"] == ["python"]
+    assert json.loads(lines[0])["start_time"] == "2025-11-07T10:00:00+00:00"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_encode_parquet_writes_row_groups():
+    """Test that Parquet output is flushed per row group and reads back intact."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    rows = [_row(i, ["python"] if i % 2 else None) for i in range(1, 6)]
+
+    chunks = await _collect(encode_parquet(_batches(rows[:3], rows[3:]), row_group_size=2))
+
+    assert len(chunks) == 3
+    parquet_file = pq.ParquetFile(io.BytesIO(b"".join(chunks)))
+    assert parquet_file.metadata.num_row_groups == 3
+    table = parquet_file.read()
+    assert table.column("id").to_pylist() == [1, 2, 3, 4, 5]
+    assert table.column("tags").to_pylist()[:2] == [["python"], None]
@@ -0,0 +1,105 @@
+"""
+Unit tests for streaming activity import parsers and batch driver.
+"""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.utils import activity_import
+from src.application.utils.activity_import import (
+    import_activities,
+    parse_csv,
+    parse_ndjson,
+)
+from src.schemas.activity import ActivityBulkItemError
+
+
+async def _chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _collect(records) -> list:
+    return [record async for record in records]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_parse_csv_handles_quoted_newlines_across_chunks():
+    """Test that records are rebuilt across chunk boundaries, including quoted line breaks."""
+    data = (
+        "\ufeffdescription,start_time,tags\r\n"
+        '"Line one\r\nline two, with comma",2025-11-07T10:00:00Z,"a,b"\r\n'
+        "\r\n"
+        "Plain,2025-11-07T11:00:00Z,\r\n"
+    ).encode()
+
+    records = await _collect(parse_csv(_chunks(data[:7], data[7:40], data[40:])))
+
+    assert records == [
+        {"description": "Line one\r\nline two, with comma",
+         "start_time": "2025-11-07T10:00:00Z", "tags": "a,b"},
+        {"description": "Plain", "start_time": "2025-11-07T11:00:00Z", "tags": ""},
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_parse_ndjson_yields_none_for_invalid_lines():
+    """Test that a malformed line is reported as a record instead of aborting the import."""
+    data = '{"description": "Бег"}\n{broken\n\n{"description": "Сон"}'.encode()
+
+    records = await _collect(parse_ndjson(_chunks(data[:10], data[10:])))
+
+    assert records == [{"description": "Бег"}, None, {"description": "Сон"}]
+
+
+@pytest.fixture
+def session_factory():
+    """Session factory whose sessions and transactions are async context managers."""
+    session = MagicMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    transaction = MagicMock()
+    transaction.__aenter__ = AsyncMock(return_value=None)
+    transaction.__aexit__ = AsyncMock(return_value=False)
+    session.begin = MagicMock(return_value=transaction)
+    return MagicMock(return_value=session)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_import_activities_commits_batch_by_batch(monkeypatch, session_factory):
+    """Test that every batch gets its own transaction and results are summed."""
+    monkeypatch.setattr(
+        activity_import.UserRepository, "get_by_id", AsyncMock(return_value=MagicMock())
+    )
+    monkeypatch.setattr(activity_import, "set_statement_timeout", AsyncMock())
+    import_batch = AsyncMock(side_effect=[
+        (2, [ActivityBulkItemError(index=1, error="bad")]),
+        (2, []),
+    ])
+    monkeypatch.setattr(activity_import.ActivityService, "import_batch", import_batch)
+    records = _chunks(*[{"description": str(i)} for i in range(5)])
+
+    result = await import_activities(1, records, session_factory=session_factory, batch_size=3)
+
+    assert (result.imported, result.failed) == (4, 1)
+    assert result.errors[0].index == 1
+    assert session_factory.return_value.begin.call_count == 2
+    assert [call.kwargs["first_index"] for call in import_batch.call_args_list] == [0, 3]
+    assert activity_import.set_statement_timeout.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_import_activities_for_unknown_user_raises_lookup_error(monkeypatch, session_factory):
+    """Test that nothing is imported for a missing user."""
+    monkeypatch.setattr(
+        activity_import.UserRepository, "get_by_id", AsyncMock(return_value=None)
+    )
+
+    with pytest.raises(LookupError):
+        await import_activities(404, _chunks({}), session_factory=session_factory)
+
+    session_factory.return_value.begin.assert_not_called()
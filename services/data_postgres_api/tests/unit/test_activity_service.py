@@ -4,11 +4,11 @@ Unit tests for ActivityService.
 Tests business logic without database dependencies using mocked repository.
 """
 import pytest
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import AsyncMock, Mock
 import logging
 
-from src.application.services.activity_service import ActivityService
+from src.application.services.activity_service import ActivityOverlapError, ActivityService
 from src.domain.models.activity import Activity
 from src.schemas.activity import ActivityCreate
 
@@ -69,6 +69,47 @@ async def test_create_activity_success(activity_service, mock_repository, valid_
     mock_repository.create.assert_called_once_with(valid_activity_data)
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_activity_strict_rejects_overlap(activity_service, mock_repository, valid_activity_data):
+    """Test that strict create reports overlapping activity IDs and writes nothing."""
+    mock_repository.find_overlapping_ids = AsyncMock(return_value=[7, 9])
+    mock_repository.create = AsyncMock()
+
+    with pytest.raises(ActivityOverlapError) as exc_info:
+        await activity_service.create_activity(valid_activity_data, strict=True)
+
+    assert exc_info.value.activity_ids == [7, 9]
+    mock_repository.find_overlapping_ids.assert_called_once_with(
+        1, valid_activity_data.start_time, valid_activity_data.end_time
+    )
+    mock_repository.create.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_activity_strict_without_overlap_creates(activity_service, mock_repository, valid_activity_data, mock_activity):
+    """Test that strict create writes the activity when nothing overlaps."""
+    mock_repository.find_overlapping_ids = AsyncMock(return_value=[])
+    mock_repository.create = AsyncMock(return_value=mock_activity)
+
+    result = await activity_service.create_activity(valid_activity_data, strict=True)
+
+    assert result == mock_activity
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_activity_default_skips_overlap_check(activity_service, mock_repository, valid_activity_data, mock_activity):
+    """Test that non-strict create does not query overlaps."""
+    mock_repository.find_overlapping_ids = AsyncMock()
+    mock_repository.create = AsyncMock(return_value=mock_activity)
+
+    await activity_service.create_activity(valid_activity_data)
+
+    mock_repository.find_overlapping_ids.assert_not_called()
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_create_activity_end_time_before_start_time(activity_service, valid_activity_data):
@@ -198,7 +239,7 @@ async def test_get_user_activities_default_pagination(activity_service, mock_rep
     activities = await activity_service.get_user_activities(user_id=1)
 
     assert activities == [mock_activity]
-    mock_repository.get_recent_by_user.assert_called_once_with(1, 10)
+    mock_repository.get_recent_by_user.assert_called_once_with(1, 10, before=None)
 
 
 @pytest.mark.unit
@@ -213,7 +254,7 @@ async def test_get_user_activities_custom_pagination(activity_service, mock_repo
     )
 
     assert activities == [mock_activity]
-    mock_repository.get_recent_by_user.assert_called_once_with(1, 20)
+    mock_repository.get_recent_by_user.assert_called_once_with(1, 20, before=None)
 
 
 @pytest.mark.unit
@@ -251,7 +292,7 @@ async def test_get_user_activities_limit_boundary_min(activity_service, mock_rep
 
     await activity_service.get_user_activities(user_id=1, limit=1)
 
-    mock_repository.get_recent_by_user.assert_called_once_with(1, 1)
+    mock_repository.get_recent_by_user.assert_called_once_with(1, 1, before=None)
 
 
 @pytest.mark.unit
@@ -262,6 +303,494 @@ async def test_get_user_activities_limit_boundary_max(activity_service, mock_rep
 
     await activity_service.get_user_activities(user_id=1, limit=100)
 
-    mock_repository.get_recent_by_user.assert_called_once_with(1, 100)
+    mock_repository.get_recent_by_user.assert_called_once_with(1, 100, before=None)
+
+
+
+
+# ============================================================================
+# Test: bulk_create_activities
+# ============================================================================
+
+def _bulk_item(**overrides):
+    """Build raw bulk item payload with valid defaults."""
+    item = {
+        "user_id": 1,
+        "category_id": 1,
+        "description": "Bulk activity",
+        "start_time": "2025-11-07T10:00:00+00:00",
+        "end_time": "2025-11-07T11:00:00+00:00",
+    }
+    item.update(overrides)
+    return item
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bulk_create_activities_writes_valid_items_in_one_call(activity_service, mock_repository, mock_activity):
+    """Test that all valid items are passed to a single repository call."""
+    mock_repository.bulk_create = AsyncMock(return_value=({0: mock_activity, 1: mock_activity}, {}))
+
+    created, errors = await activity_service.bulk_create_activities([_bulk_item(), _bulk_item()])
+
+    assert created == [mock_activity, mock_activity]
+    assert errors == []
+    mock_repository.bulk_create.assert_called_once()
+    assert len(mock_repository.bulk_create.call_args[0][0]) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bulk_create_activities_reports_invalid_items_without_aborting(activity_service, mock_repository, mock_activity):
+    """Test that schema and business validation errors are reported per item."""
+    mock_repository.bulk_create = AsyncMock(return_value=({0: mock_activity}, {}))
+
+    created, errors = await activity_service.bulk_create_activities([
+        _bulk_item(description="x"),                          # too short
+        _bulk_item(),                                         # valid
+        _bulk_item(end_time="2099-01-01T00:00:00+00:00",
+                   start_time="2098-12-31T23:00:00+00:00"),   # in the future
+    ])
+
+    assert created == [mock_activity]
+    assert [e.index for e in errors] == [0, 2]
+    assert "description" in errors[0].error
+    assert "future" in errors[1].error
+    assert len(mock_repository.bulk_create.call_args[0][0]) == 1
+
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bulk_create_activities_maps_database_errors_to_request_positions(activity_service, mock_repository, mock_activity):
+    """Test that repository errors are reported with original request index."""
+    # Item 0 is invalid, so repository sees items 1 and 2 as positions 0 and 1
+    mock_repository.bulk_create = AsyncMock(
+        return_value=({0: mock_activity}, {1: "foreign key violation"})
+    )
+
+    created, errors = await activity_service.bulk_create_activities([
+        _bulk_item(description="x"),
+        _bulk_item(),
+        _bulk_item(category_id=999),
+    ])
+
+    assert created == [mock_activity]
+    assert [(e.index, e.error) for e in errors][1] == (2, "foreign key violation")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bulk_create_activities_caps_duration_at_24_hours(activity_service, mock_repository):
+    """Test that bulk items get the same 24 hour cap as single creation."""
+    mock_repository.bulk_create = AsyncMock(return_value=({}, {}))
+
+    await activity_service.bulk_create_activities([
+        _bulk_item(start_time="2025-11-05T10:00:00+00:00", end_time="2025-11-07T10:00:00+00:00")
+    ])
+
+    item = mock_repository.bulk_create.call_args[0][0][0]
+    assert item.end_time - item.start_time == timedelta(hours=24)
 
+
+# ============================================================================
+# Test: get_activity_stats
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_activity_stats_converts_rows_to_items(activity_service, mock_repository):
+    """Test that aggregated rows are returned as ActivityStatsItem objects."""
+    mock_repository.get_stats = AsyncMock(return_value=[
+        {"bucket": date(2025, 11, 3), "category_id": 1, "category_name": "Work",
+         "total_minutes": 480, "activity_count": 4},
+        {"bucket": date(2025, 11, 3), "category_id": None, "category_name": None,
+         "total_minutes": 30, "activity_count": 1},
+    ])
+
+    items = await activity_service.get_activity_stats(1, "week")
+
+    assert [(i.category_name, i.total_minutes) for i in items] == [("Work", 480), (None, 30)]
+    mock_repository.get_stats.assert_called_once_with(1, "week", start=None, end=None)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_activity_stats_rejects_unknown_period(activity_service, mock_repository):
+    """Test that period outside day/week/month never reaches SQL."""
+    mock_repository.get_stats = AsyncMock()
+
+    with pytest.raises(ValueError, match="Period"):
+        await activity_service.get_activity_stats(1, "year")
+
+    mock_repository.get_stats.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_activity_stats_rejects_empty_range(activity_service, mock_repository):
+    """Test that from >= to is a validation error."""
+    mock_repository.get_stats = AsyncMock()
+    moment = datetime(2025, 11, 7, 10, 0, 0)
+
+    with pytest.raises(ValueError, match="earlier"):
+        await activity_service.get_activity_stats(1, "day", start=moment, end=moment)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_activity_stats_mixed_naive_and_aware_range(activity_service, mock_repository):
+    """Test that a naive and an aware bound are compared as UTC (400, not TypeError)."""
+    mock_repository.get_stats = AsyncMock(return_value=[])
+    aware = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+    await activity_service.get_activity_stats(1, "day", start=datetime(2024, 1, 1), end=aware)
+
+    assert mock_repository.get_stats.call_args.kwargs["start"] == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with pytest.raises(ValueError, match="earlier"):
+        await activity_service.get_activity_stats(1, "day", start=datetime(2024, 1, 3), end=aware)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_daily_rollup_stats_reads_rollup(activity_service, mock_repository):
+    """Test that daily stats come from the rollup table with date bounds."""
+    mock_repository.rollup.get_daily_totals = AsyncMock(return_value=[
+        {"bucket": date(2025, 11, 7), "category_id": 1, "category_name": "Sleep",
+         "total_minutes": 120, "activity_count": 1},
+        {"bucket": date(2025, 11, 8), "category_id": 1, "category_name": "Sleep",
+         "total_minutes": 360, "activity_count": 0},
+    ])
+
+    items = await activity_service.get_daily_rollup_stats(
+        1, start_date=date(2025, 11, 1), end_date=date(2025, 12, 1)
+    )
+
+    assert [i.total_minutes for i in items] == [120, 360]
+    mock_repository.rollup.get_daily_totals.assert_called_once_with(
+        1, start_date=date(2025, 11, 1), end_date=date(2025, 12, 1)
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_daily_rollup_stats_rejects_empty_range(activity_service):
+    """Test that from >= to is a validation error."""
+    with pytest.raises(ValueError, match="earlier"):
+        await activity_service.get_daily_rollup_stats(
+            1, start_date=date(2025, 11, 2), end_date=date(2025, 11, 1)
+        )
+
+
+
+# ============================================================================
+# Test: get_user_activities_in_range
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_user_activities_in_range_delegates_window(activity_service, mock_repository, mock_activity):
+    """Test that the window, category and keyset position reach the repository."""
+    mock_repository.get_overlapping = AsyncMock(return_value=[mock_activity])
+    start, end = datetime(2025, 11, 7, tzinfo=timezone.utc), datetime(2025, 11, 8, tzinfo=timezone.utc)
+
+    result = await activity_service.get_user_activities_in_range(
+        1, start, end, category_id=2, limit=20
+    )
+
+    assert result == [mock_activity]
+    mock_repository.get_overlapping.assert_called_once_with(
+        1, start, end, category_id=2, limit=20, before=None
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_user_activities_in_range_allows_open_bound(activity_service, mock_repository):
+    """Test that a window with only 'from' is accepted."""
+    mock_repository.get_overlapping = AsyncMock(return_value=[])
+
+    await activity_service.get_user_activities_in_range(1, datetime(2025, 11, 7), None)
+
+    mock_repository.get_overlapping.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_user_activities_in_range_rejects_empty_window(activity_service, mock_repository):
+    """Test that from >= to is a validation error."""
+    mock_repository.get_overlapping = AsyncMock()
+    moment = datetime(2025, 11, 7, 10, 0, 0)
+
+    with pytest.raises(ValueError, match="earlier"):
+        await activity_service.get_user_activities_in_range(1, moment, moment)
+    mock_repository.get_overlapping.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_user_activities_in_range_mixes_naive_and_aware_bounds(activity_service, mock_repository):
+    """Test that a naive bound is taken as UTC instead of failing to compare with an aware one."""
+    mock_repository.get_overlapping = AsyncMock(return_value=[])
+    aware = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+    await activity_service.get_user_activities_in_range(1, datetime(2024, 1, 1), aware)
+
+    args = mock_repository.get_overlapping.call_args.args
+    assert args[1:] == (datetime(2024, 1, 1, tzinfo=timezone.utc), aware)
+    with pytest.raises(ValueError, match="earlier"):
+        await activity_service.get_user_activities_in_range(1, datetime(2024, 1, 3), aware)
+
+
+# ============================================================================
+# Test: get_activity_gaps
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_activity_gaps_converts_rows_to_gaps(activity_service, mock_repository):
+    """Test that gap rows become ActivityGap objects with their length."""
+    start, end = datetime(2025, 11, 7, 8, 0), datetime(2025, 11, 7, 20, 0)
+    mock_repository.get_gaps = AsyncMock(return_value=[
+        {"gap_start": datetime(2025, 11, 7, 8, 0), "gap_end": datetime(2025, 11, 7, 9, 30)},
+        {"gap_start": datetime(2025, 11, 7, 18, 0), "gap_end": datetime(2025, 11, 7, 20, 0)},
+    ])
+
+    gaps = await activity_service.get_activity_gaps(1, start, end, min_minutes=15)
+
+    assert [g.duration_minutes for g in gaps] == [90, 120]
+    assert gaps[0].start_time == datetime(2025, 11, 7, 8, 0)
+    mock_repository.get_gaps.assert_called_once_with(
+        1, start.replace(tzinfo=timezone.utc), end.replace(tzinfo=timezone.utc), min_minutes=15
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_activity_gaps_rejects_invalid_arguments(activity_service, mock_repository):
+    """Test that an empty window or negative minimum never reaches SQL."""
+    mock_repository.get_gaps = AsyncMock()
+    moment = datetime(2025, 11, 7, 10, 0, 0)
+
+    with pytest.raises(ValueError, match="earlier"):
+        await activity_service.get_activity_gaps(1, moment, moment)
+    with pytest.raises(ValueError, match="min_minutes"):
+        await activity_service.get_activity_gaps(
+            1, moment, moment + timedelta(hours=1), min_minutes=-1
+        )
+    mock_repository.get_gaps.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_activity_gaps_mixed_naive_and_aware_window(activity_service, mock_repository):
+    """Test that a naive and an aware bound are compared as UTC (400, not TypeError)."""
+    mock_repository.get_gaps = AsyncMock(return_value=[])
+    aware = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+    await activity_service.get_activity_gaps(1, datetime(2024, 1, 1), aware)
+
+    assert mock_repository.get_gaps.call_args.args[1] == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with pytest.raises(ValueError, match="earlier"):
+        await activity_service.get_activity_gaps(1, datetime(2024, 1, 3), aware)
+
+
+# ============================================================================
+# Test: search_activities
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_activities_delegates_trimmed_query(activity_service, mock_repository, mock_activity):
+    """Test that query, limit and keyset position reach the repository."""
+    mock_repository.search = AsyncMock(return_value=[mock_activity])
+    position = (0.5, datetime(2025, 11, 7, 10, 0), 3)
+
+    result = await activity_service.search_activities(1, "  бег  ", 20, before=position)
+
+    assert result == [mock_activity]
+    mock_repository.search.assert_called_once_with(1, "бег", 20, before=position)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_activities_rejects_blank_query(activity_service, mock_repository):
+    """Test that a whitespace-only query never reaches SQL."""
+    mock_repository.search = AsyncMock()
+
+    with pytest.raises(ValueError, match="blank"):
+        await activity_service.search_activities(1, "   ")
+    mock_repository.search.assert_not_called()
+
+
+# ============================================================================
+# Test: get_recent_descriptions
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_recent_descriptions_delegates_filters(activity_service, mock_repository):
+    """Test that category, trimmed prefix and limit reach the repository."""
+    rows = [{"description": "Бег", "use_count": 12,
+             "last_used_at": datetime(2025, 11, 7, 7, 0), "last_activity_id": 40}]
+    mock_repository.get_recent_descriptions = AsyncMock(return_value=rows)
+
+    result = await activity_service.get_recent_descriptions(1, category_id=2, prefix=" бе ", limit=8)
+
+    assert result == rows
+    mock_repository.get_recent_descriptions.assert_called_once_with(
+        1, category_id=2, prefix="бе", limit=8
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_recent_descriptions_blank_prefix_means_no_filter(activity_service, mock_repository):
+    """Test that a whitespace prefix is dropped instead of matching everything via ILIKE."""
+    mock_repository.get_recent_descriptions = AsyncMock(return_value=[])
+
+    await activity_service.get_recent_descriptions(1, prefix="   ")
+
+    assert mock_repository.get_recent_descriptions.call_args.kwargs["prefix"] is None
+
+
+# ============================================================================
+# Test: tags
+# ============================================================================
+
+@pytest.mark.unit
+def test_activity_create_normalizes_tags():
+    """Test that tags are trimmed, lose a leading '#', and are deduplicated in order."""
+    data = ActivityCreate(
+        user_id=1,
+        start_time=datetime(2025, 11, 7, 10, 0),
+        end_time=datetime(2025, 11, 7, 11, 0),
+        description="Tagged",
+        tags=[" #python", "testing", "python", "  ", "#"]
+    )
+
+    assert data.tags == ["python", "testing"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_activities_by_tag_normalizes_tag(activity_service, mock_repository, mock_activity):
+    """Test that the tag is looked up in the same form it is stored in."""
+    mock_repository.get_by_tag = AsyncMock(return_value=[mock_activity])
+
+    result = await activity_service.get_activities_by_tag(1, " #python ", 5)
+
+    assert result == [mock_activity]
+    mock_repository.get_by_tag.assert_called_once_with(1, "python", 5, before=None)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_activities_by_tag_rejects_blank_tag(activity_service, mock_repository):
+    """Test that a tag that normalizes to nothing never reaches SQL."""
+    mock_repository.get_by_tag = AsyncMock()
+
+    with pytest.raises(ValueError, match="blank"):
+        await activity_service.get_activities_by_tag(1, " # ")
+    mock_repository.get_by_tag.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_top_tags_validates_rows(activity_service, mock_repository):
+    """Test that aggregate rows are returned as ActivityTagStats."""
+    mock_repository.get_top_tags = AsyncMock(return_value=[
+        {"tag": "python", "total_minutes": 150, "activity_count": 3}
+    ])
+
+    result = await activity_service.get_top_tags(1, limit=5)
+
+    assert result[0].tag == "python"
+    assert result[0].total_minutes == 150
+    mock_repository.get_top_tags.assert_called_once_with(1, start=None, end=None, limit=5)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_top_tags_mixed_naive_and_aware_window(activity_service, mock_repository):
+    """Test that a naive and an aware bound are compared as UTC (400, not TypeError)."""
+    mock_repository.get_top_tags = AsyncMock(return_value=[])
+    aware = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+    await activity_service.get_top_tags(1, start=datetime(2024, 1, 1), end=aware)
+
+    assert mock_repository.get_top_tags.call_args.kwargs["start"] == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with pytest.raises(ValueError, match="earlier"):
+        await activity_service.get_top_tags(1, start=datetime(2024, 1, 3), end=aware)
+
+
+# ============================================================================
+# Test: stream_activities_for_export
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_activities_for_export_yields_repository_batches(activity_service, mock_repository):
+    """Test that cursor batches are passed through unchanged."""
+    batch = [{"id": 1}, {"id": 2}]
+
+    async def stream():
+        yield batch
+
+    mock_repository.stream_for_export = Mock(return_value=stream())
+
+    batches = [rows async for rows in activity_service.stream_activities_for_export(1, batch_size=2)]
+
+    assert batches == [batch]
+    mock_repository.stream_for_export.assert_called_once_with(1, batch_size=2)
+
+
+# ============================================================================
+# Test: import_batch
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_import_batch_validates_resolves_categories_and_copies(mock_repository):
+    """Test that valid records are COPYed with category IDs and invalid ones reported."""
+    category_repository = AsyncMock()
+    category_repository.upsert_names = AsyncMock(return_value={"Спорт": 7})
+    mock_repository.copy_create = AsyncMock(return_value=[1, 2])
+    service = ActivityService(mock_repository, category_repository)
+    category_ids = {"Работа": 3}
+    records = [
+        {"description": "Пробежка", "start_time": "2025-11-07T07:00:00+00:00",
+         "end_time": "2025-11-07T08:00:00+00:00", "category_name": "Спорт", "tags": "бег, утро"},
+        {"description": "Ревью", "start_time": "2025-11-07T09:00:00+00:00",
+         "end_time": "2025-11-07T10:00:00+00:00", "category_name": "Работа", "category_id": "99"},
+        {"description": "Назад", "start_time": "2025-11-07T10:00:00+00:00",
+         "end_time": "2025-11-07T09:00:00+00:00"},
+        None,
+    ]
+
+    created, errors = await service.import_batch(1, records, first_index=5000, category_ids=category_ids)
+
+    assert created == 2
+    assert [error.index for error in errors] == [5002, 5003]
+    category_repository.upsert_names.assert_called_once_with(1, ["Спорт"])
+    assert category_ids == {"Работа": 3, "Спорт": 7}
+    copied = mock_repository.copy_create.call_args[0][0]
+    assert [item.category_id for item in copied] == [7, 3]
+    assert copied[0].tags == ["бег", "утро"]
+    assert all(item.user_id == 1 for item in copied)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_import_batch_caps_duration_at_24_hours(mock_repository):
+    """Test that imported records get the same 24h cap as single creates."""
+    mock_repository.copy_create = AsyncMock(return_value=[1])
+    service = ActivityService(mock_repository, AsyncMock())
+
+    await service.import_batch(1, [{
+        "description": "Забыл остановить",
+        "start_time": "2025-11-01T10:00:00+00:00",
+        "end_time": "2025-11-03T10:00:00+00:00",
+    }])
+
+    copied = mock_repository.copy_create.call_args[0][0][0]
+    assert copied.end_time - copied.start_time == timedelta(hours=24)
@@ -0,0 +1,271 @@
+"""
+Unit tests for database admission control and statement budgets.
+"""
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.dependencies import get_read_user_service
+from src.api.v1 import users
+from src.infrastructure.database.admission import (
+    AdmissionController,
+    DatabaseOverloadedError,
+    is_statement_timeout,
+    set_statement_timeout,
+)
+from src.main import database_error_handler, database_overloaded_handler
+
+
+# ============================================================================
+# Test: AdmissionController
+# ============================================================================
+
+@pytest.mark.unit
+async def test_admits_up_to_limit_and_queues_the_rest():
+    """Test that requests beyond the limit wait and get the slot when it frees up."""
+    controller = AdmissionController(limit=1, max_queue=5, max_wait=1.0)
+    await controller.acquire()
+
+    waiter = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    assert controller.waiting == 1
+    assert not waiter.done()
+
+    controller.release()
+    await asyncio.wait_for(waiter, 1.0)
+    assert controller.waiting == 0
+
+
+@pytest.mark.unit
+async def test_rejects_when_queue_is_full():
+    """Test fast rejection once max_queue requests are already waiting."""
+    controller = AdmissionController(limit=1, max_queue=1, max_wait=1.0, retry_after=2)
+    await controller.acquire()
+    waiter = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+
+    with pytest.raises(DatabaseOverloadedError) as exc_info:
+        await controller.acquire()
+
+    assert exc_info.value.reason == "queue_full"
+    assert exc_info.value.retry_after == 2
+    waiter.cancel()
+
+
+@pytest.mark.unit
+async def test_rejects_after_max_wait():
+    """Test that a queued request is rejected when no slot frees up in time."""
+    controller = AdmissionController(limit=1, max_queue=5, max_wait=0.01)
+
+    async with controller.admit():
+        with pytest.raises(DatabaseOverloadedError) as exc_info:
+            await controller.acquire()
+
+    assert exc_info.value.reason == "timeout"
+    assert controller.waiting == 0
+    # Slot released by admit(): next request gets in immediately
+    await asyncio.wait_for(controller.acquire(), 0.1)
+
+
+@pytest.mark.unit
+async def test_zero_limit_disables_admission_control():
+    """Test that limit 0 admits everything."""
+    controller = AdmissionController(limit=0, max_queue=0, max_wait=0)
+
+    for _ in range(100):
+        await controller.acquire()
+
+
+# ============================================================================
+# Test: Statement timeouts
+# ============================================================================
+
+class _DriverError(Exception):
+    def __init__(self, sqlstate):
+        super().__init__("canceling statement due to statement timeout")
+        self.sqlstate = sqlstate
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("error,expected", [
+    (OperationalError("SELECT 1", {}, _DriverError("57014")), True),
+    (OperationalError("SELECT 1", {}, _DriverError("40001")), False),
+    (ValueError("57014"), False),
+])
+def test_is_statement_timeout(error, expected):
+    """Test detection of canceled statements by SQLSTATE."""
+    assert is_statement_timeout(error) is expected
+
+
+@pytest.mark.unit
+async def test_set_statement_timeout_is_transaction_local():
+    """Test that the budget is set with set_config(..., is_local => true)."""
+    session = AsyncMock(spec=AsyncSession)
+
+    await set_statement_timeout(session, 60000)
+
+    statement = session.execute.await_args.args[0]
+    compiled = statement.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    assert "set_config('statement_timeout', '60000', true)" in str(compiled)
+
+
+# ============================================================================
+# Test: HTTP responses
+# ============================================================================
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_exception_handler(DatabaseOverloadedError, database_overloaded_handler)
+    app.add_exception_handler(DBAPIError, database_error_handler)
+
+    @app.get("/overloaded")
+    async def overloaded() -> None:
+        raise DatabaseOverloadedError("queue_full", retry_after=3)
+
+    @app.get("/slow")
+    async def slow() -> None:
+        raise OperationalError("SELECT pg_sleep(10)", {}, _DriverError("57014"))
+
+    @app.get("/broken")
+    async def broken() -> None:
+        raise OperationalError("SELECT 1", {}, _DriverError("08006"))
+
+    app.include_router(users.router)
+    user_service = MagicMock()
+    user_service.get_by_id = AsyncMock(return_value=MagicMock(id=1))
+    app.dependency_overrides[get_read_user_service] = lambda: user_service
+
+    return app
+
+
+@pytest.mark.unit
+def test_overloaded_request_gets_503_with_retry_after():
+    """Test that shed requests are answered with 503 and Retry-After."""
+    response = TestClient(_build_app()).get("/overloaded")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+
+
+@pytest.mark.unit
+def test_statement_timeout_gets_503_other_database_errors_500():
+    """Test that only statement timeouts are mapped to 503."""
+    client = TestClient(_build_app(), raise_server_exceptions=False)
+
+    slow = client.get("/slow")
+    assert slow.status_code == 503
+    assert "Retry-After" in slow.headers
+
+    assert client.get("/broken").status_code == 500
+
+
+# ============================================================================
+# Test: streaming endpoints
+# ============================================================================
+
+def _stream_session_factory() -> MagicMock:
+    """Stand-in for read_stream_session(): a session usable as async context manager."""
+    session = MagicMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=session)
+
+
+@pytest.mark.unit
+async def test_activity_export_holds_read_admission_slot_while_streaming(monkeypatch):
+    """Test that the export's own connection is admitted for the whole stream."""
+    controller = AdmissionController(limit=1, max_queue=0, max_wait=0.01)
+    monkeypatch.setattr(users, "read_admission", controller)
+    monkeypatch.setattr(users, "read_stream_session", _stream_session_factory())
+    monkeypatch.setattr(users, "set_statement_timeout", AsyncMock())
+
+    async def batches(self, user_id):
+        yield [{"id": 1}]
+        yield [{"id": 2}]
+
+    monkeypatch.setattr(users.ActivityService, "stream_activities_for_export", batches)
+
+    stream = users._activities_export(1, "ndjson")
+    await stream.__anext__()
+
+    with pytest.raises(DatabaseOverloadedError):
+        await controller.acquire()
+
+    assert [chunk async for chunk in stream] == [b'{"id":2}\n']
+    await asyncio.wait_for(controller.acquire(), 0.1)
+
+
+@pytest.mark.unit
+async def test_active_users_stream_holds_read_admission_slot_with_bulk_budget(monkeypatch):
+    """Test that the active users stream is admitted and gets the bulk statement budget."""
+    controller = AdmissionController(limit=1, max_queue=0, max_wait=0.01)
+    monkeypatch.setattr(users, "read_admission", controller)
+    monkeypatch.setattr(users, "read_stream_session", _stream_session_factory())
+    set_timeout = AsyncMock()
+    monkeypatch.setattr(users, "set_statement_timeout", set_timeout)
+
+    async def active_users(self):
+        for user_id in (1, 2):
+            yield {
+                "id": user_id, "telegram_id": user_id, "username": None, "first_name": None,
+                "timezone": "UTC", "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+                "last_poll_time": None, "settings": None,
+            }
+
+    monkeypatch.setattr(users.UserService, "stream_active_users_with_settings", active_users)
+
+    stream = users._active_users_ndjson()
+    await stream.__anext__()
+
+    with pytest.raises(DatabaseOverloadedError):
+        await controller.acquire()
+    assert set_timeout.await_args.args[1] == users.settings.db_bulk_statement_timeout_ms
+
+    assert len([line async for line in stream]) == 1
+    await asyncio.wait_for(controller.acquire(), 0.1)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("path", ["/users/active/stream", "/users/1/activities/export"])
+def test_streaming_routes_answer_503_when_not_admitted(monkeypatch, path):
+    """Test that admission is decided before the 200 response of a stream starts."""
+    controller = AdmissionController(limit=1, max_queue=0, max_wait=0.01, retry_after=4)
+    asyncio.run(controller.acquire())
+    monkeypatch.setattr(users, "read_admission", controller)
+    session_factory = _stream_session_factory()
+    monkeypatch.setattr(users, "read_stream_session", session_factory)
+
+    response = TestClient(_build_app()).get(path)
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "4"
+    session_factory.assert_not_called()
+
+
+@pytest.mark.unit
+def test_activity_export_statement_timeout_before_first_chunk_gets_503(monkeypatch):
+    """Test that a canceled statement at the start of an export is a 503, not a cut 200."""
+    controller = AdmissionController(limit=1, max_queue=0, max_wait=0.01)
+    monkeypatch.setattr(users, "read_admission", controller)
+    monkeypatch.setattr(users, "read_stream_session", _stream_session_factory())
+    monkeypatch.setattr(users, "set_statement_timeout", AsyncMock(
+        side_effect=OperationalError("SELECT set_config(...)", {}, _DriverError("57014"))
+    ))
+
+    response = TestClient(_build_app(), raise_server_exceptions=False).get(
+        "/users/1/activities/export?format=ndjson"
+    )
+
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+    # Slot released with the failed stream body
+    asyncio.run(controller.acquire())
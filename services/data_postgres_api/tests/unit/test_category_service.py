@@ -52,40 +52,36 @@ def mock_category():
 @pytest.mark.asyncio
 async def test_create_category_success(category_service, mock_repository, valid_category_data, mock_category):
     """Test successful category creation when name is unique."""
-    mock_repository.get_by_user_and_name = AsyncMock(return_value=None)
-    mock_repository.create = AsyncMock(return_value=mock_category)
+    mock_repository.create_if_absent = AsyncMock(return_value=mock_category)
 
     result = await category_service.create_category(valid_category_data)
 
     assert result == mock_category
-    mock_repository.get_by_user_and_name.assert_called_once_with(1, "Work")
-    mock_repository.create.assert_called_once_with(valid_category_data)
+    mock_repository.create_if_absent.assert_called_once_with(valid_category_data)
+    mock_repository.get_by_user_and_name.assert_not_called()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_create_category_duplicate_name(category_service, mock_repository, valid_category_data, mock_category):
+async def test_create_category_duplicate_name(category_service, mock_repository, valid_category_data):
     """Test that creating category with duplicate name raises ValueError."""
-    mock_repository.get_by_user_and_name = AsyncMock(return_value=mock_category)
+    mock_repository.create_if_absent = AsyncMock(return_value=None)
 
     with pytest.raises(ValueError, match="Category with name 'Work' already exists for user 1"):
         await category_service.create_category(valid_category_data)
 
-    mock_repository.create.assert_not_called()
-
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_create_category_same_name_different_user(category_service, mock_repository, mock_category):
     """Test that same category name can exist for different users."""
     category_data_user2 = CategoryCreate(user_id=2, name="Work", is_default=False)
-    mock_repository.get_by_user_and_name = AsyncMock(return_value=None)
-    mock_repository.create = AsyncMock(return_value=mock_category)
+    mock_repository.create_if_absent = AsyncMock(return_value=mock_category)
 
     result = await category_service.create_category(category_data_user2)
 
     assert result == mock_category
-    mock_repository.get_by_user_and_name.assert_called_once_with(2, "Work")
+    mock_repository.create_if_absent.assert_called_once_with(category_data_user2)
 
 
 # ============================================================================
@@ -107,46 +103,38 @@ async def test_bulk_create_categories_all_new(category_service, mock_repository)
         Category(id=3, user_id=1, name="Exercise", is_default=False),
     ]
 
-    mock_repository.get_by_user_and_name = AsyncMock(return_value=None)
-    mock_repository.create = AsyncMock(side_effect=mock_categories)
+    mock_repository.bulk_create_if_absent = AsyncMock(return_value=mock_categories)
 
     result = await category_service.bulk_create_categories(1, categories_data)
 
-    assert len(result) == 3
     assert result == mock_categories
-    assert mock_repository.create.call_count == 3
+    mock_repository.bulk_create_if_absent.assert_called_once_with(categories_data)
+    mock_repository.get_by_user_and_name.assert_not_called()
+    mock_repository.create.assert_not_called()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_bulk_create_categories_skip_duplicates(category_service, mock_repository):
-    """Test bulk creating categories skips existing duplicates."""
+    """Test bulk creating categories returns only rows not skipped by ON CONFLICT."""
     categories_data = [
         CategoryCreate(user_id=1, name="Work", is_default=False),
         CategoryCreate(user_id=1, name="Study", is_default=False),
     ]
-    existing_category = Category(id=1, user_id=1, name="Work", is_default=False)
     new_category = Category(id=2, user_id=1, name="Study", is_default=False)
-
-    async def mock_get_by_user_and_name(user_id, name):
-        if name == "Work":
-            return existing_category
-        return None
-
-    mock_repository.get_by_user_and_name = AsyncMock(side_effect=mock_get_by_user_and_name)
-    mock_repository.create = AsyncMock(return_value=new_category)
+    mock_repository.bulk_create_if_absent = AsyncMock(return_value=[new_category])
 
     result = await category_service.bulk_create_categories(1, categories_data)
 
-    assert len(result) == 1
-    assert result[0] == new_category
-    assert mock_repository.create.call_count == 1
+    assert result == [new_category]
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_bulk_create_categories_empty_list(category_service, mock_repository):
     """Test bulk creating with empty list returns empty list."""
+    mock_repository.bulk_create_if_absent = AsyncMock(return_value=[])
+
     result = await category_service.bulk_create_categories(1, [])
 
     assert result == []
@@ -155,18 +143,17 @@ async def test_bulk_create_categories_empty_list(category_service, mock_reposito
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_bulk_create_categories_all_duplicates(category_service, mock_repository, mock_category):
+async def test_bulk_create_categories_all_duplicates(category_service, mock_repository):
     """Test bulk creating when all categories already exist."""
     categories_data = [
         CategoryCreate(user_id=1, name="Work", is_default=False),
         CategoryCreate(user_id=1, name="Study", is_default=False),
     ]
-    mock_repository.get_by_user_and_name = AsyncMock(return_value=mock_category)
+    mock_repository.bulk_create_if_absent = AsyncMock(return_value=[])
 
     result = await category_service.bulk_create_categories(1, categories_data)
 
     assert result == []
-    mock_repository.create.assert_not_called()
 
 
 # ============================================================================
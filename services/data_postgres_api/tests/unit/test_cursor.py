@@ -0,0 +1,58 @@
+"""
+Unit tests for activity pagination cursor helpers.
+"""
+import pytest
+from datetime import datetime, timezone
+
+from src.application.utils.cursor import (
+    decode_activity_cursor,
+    decode_search_cursor,
+    encode_activity_cursor,
+    encode_search_cursor,
+)
+
+
+@pytest.mark.unit
+def test_cursor_round_trip_preserves_position():
+    """Test that encode/decode returns the original (start_time, id)."""
+    start = datetime(2025, 11, 7, 10, 30, 15, tzinfo=timezone.utc)
+
+    cursor = encode_activity_cursor(start, 12345)
+
+    assert decode_activity_cursor(cursor) == (start, 12345)
+
+
+@pytest.mark.unit
+def test_cursor_is_url_safe():
+    """Test that cursor can be used in query string without escaping."""
+    cursor = encode_activity_cursor(datetime(2025, 11, 7, 10, 0), 1)
+
+    assert all(c.isalnum() or c in "-_" for c in cursor)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "!!!", "MjAyNQ"])
+def test_decode_invalid_cursor_raises_value_error(cursor):
+    """Test that malformed cursors raise ValueError (mapped to 400 by the API)."""
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_activity_cursor(cursor)
+
+
+@pytest.mark.unit
+def test_search_cursor_round_trip_preserves_rank_exactly():
+    """Test that the float rank survives encoding bit-for-bit."""
+    start = datetime(2025, 11, 7, 10, 30, tzinfo=timezone.utc)
+    rank = 0.0607927106320858
+
+    cursor = encode_search_cursor(rank, start, 42)
+
+    assert decode_search_cursor(cursor) == (rank, start, 42)
+
+
+@pytest.mark.unit
+def test_decode_search_cursor_rejects_activity_cursor():
+    """Test that a listing cursor is not accepted by search."""
+    cursor = encode_activity_cursor(datetime(2025, 11, 7, 10, 0), 1)
+
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_search_cursor(cursor)
@@ -246,3 +246,71 @@ def test_multiple_requests_logged_separately(client, caplog):
 
     # Should have at least 2 different correlation IDs
     assert len(correlation_ids) >= 2
+
+
+# ============================================================================
+# Test: Sampling and slow/failed-only mode
+# ============================================================================
+
+def _client_with(**options):
+    """Create test client whose logging middleware uses given options."""
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware, **options)
+    app.add_middleware(CorrelationIDMiddleware)
+
+    @app.get("/test")
+    async def test_endpoint():
+        return {"message": "success"}
+
+    @app.get("/test-500")
+    async def test_server_error_endpoint():
+        raise HTTPException(status_code=503, detail="Unavailable")
+
+    @app.get("/test-slow")
+    async def test_slow_endpoint():
+        import time
+        time.sleep(0.05)
+        return {"message": "slow response"}
+
+    return TestClient(app)
+
+
+@pytest.mark.unit
+def test_slow_or_failed_mode_skips_fast_successful_requests(caplog):
+    """Test that fast 2xx requests produce no records in slow_or_failed mode."""
+    client = _client_with(mode="slow_or_failed", slow_threshold_ms=1000)
+
+    with caplog.at_level(logging.INFO):
+        response = client.get("/test")
+
+    assert response.status_code == 200
+    assert not [r for r in caplog.records if "HTTP request" in r.message]
+
+
+@pytest.mark.unit
+def test_slow_or_failed_mode_logs_slow_and_failed_requests(caplog):
+    """Test that slow and 5xx requests are logged once as warnings."""
+    client = _client_with(mode="slow_or_failed", slow_threshold_ms=20)
+
+    with caplog.at_level(logging.INFO):
+        client.get("/test-slow")
+        client.get("/test-500")
+
+    records = [r for r in caplog.records if "HTTP request" in r.message]
+    assert [r.message for r in records] == ["HTTP request completed"] * 2
+    assert [r.path for r in records] == ["/test-slow", "/test-500"]
+    assert all(r.levelno == logging.WARNING for r in records)
+    assert records[1].status_code == 503
+
+
+@pytest.mark.unit
+def test_sample_rate_zero_logs_only_failed_requests(caplog):
+    """Test that unsampled requests are still logged when they fail."""
+    client = _client_with(sample_rate=0.0)
+
+    with caplog.at_level(logging.INFO):
+        client.get("/test")
+        client.get("/test-500")
+
+    records = [r for r in caplog.records if "HTTP request" in r.message]
+    assert [(r.message, r.path) for r in records] == [("HTTP request completed", "/test-500")]
@@ -0,0 +1,83 @@
+"""
+Unit tests for the /metrics endpoint and HTTP metrics middleware.
+"""
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY
+
+from src.api.middleware.metrics import MetricsMiddleware
+from src.infrastructure.database.connection import _statement_operation
+
+
+# ============================================================================
+# Test: Exposition
+# ============================================================================
+
+@pytest.mark.unit
+def test_metrics_endpoint_exposes_service_metrics():
+    """Test that /metrics serves the registered HTTP and database metrics."""
+    from src.main import app
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == CONTENT_TYPE_LATEST
+    for family in (
+        "http_request_duration_seconds",
+        "http_responses_total",
+        "db_pool_wait_seconds",
+        "db_admission_rejections_total",
+    ):
+        assert f"# TYPE {family} " in response.text
+
+
+# ============================================================================
+# Test: HTTP metrics middleware
+# ============================================================================
+
+@pytest.mark.unit
+def test_middleware_labels_by_route_template_and_status():
+    """Test that requests are recorded per route template and status code."""
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics-test/items/{item_id}")
+    async def get_item(item_id: int):
+        if item_id == 0:
+            raise HTTPException(status_code=404, detail="Not found")
+        return {"id": item_id}
+
+    client = TestClient(app)
+    client.get("/metrics-test/items/1")
+    client.get("/metrics-test/items/2")
+    client.get("/metrics-test/items/0")
+
+    route = "/metrics-test/items/{item_id}"
+    assert REGISTRY.get_sample_value(
+        "http_responses_total", {"method": "GET", "route": route, "status": "200"}
+    ) == 2
+    assert REGISTRY.get_sample_value(
+        "http_responses_total", {"method": "GET", "route": route, "status": "404"}
+    ) == 1
+    assert REGISTRY.get_sample_value(
+        "http_request_duration_seconds_count", {"method": "GET", "route": route}
+    ) == 3
+    assert REGISTRY.get_sample_value("http_requests_in_flight") == 0
+
+
+# ============================================================================
+# Test: Slow query labels
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.parametrize("statement, operation", [
+    ("SELECT 1", "select"),
+    ("\n  insert into users VALUES (1)", "insert"),
+    ("WITH x AS (SELECT 1) SELECT * FROM x", "with"),
+    ("LOCK TABLE activity_daily_rollup", "other"),
+    ("", "other"),
+])
+def test_statement_operation_label(statement, operation):
+    """Test that slow query counter labels use the leading SQL keyword."""
+    assert _statement_operation(statement) == operation
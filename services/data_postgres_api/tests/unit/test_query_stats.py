@@ -0,0 +1,194 @@
+"""
+Unit tests for SQL statement statistics, debug headers and admin endpoints.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.middleware.query_stats import (
+    DB_TIME_HEADER,
+    QUERY_COUNT_HEADER,
+    QueryStatsHeadersMiddleware,
+)
+from src.api.v1.admin import router as admin_router
+from src.infrastructure.database.query_stats import (
+    QUERY_STATS,
+    QueryStatsAggregator,
+    normalize_statement,
+    record_query,
+)
+
+
+# ============================================================================
+# Test: Normalization
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.parametrize("statement,normalized", [
+    (
+        "SELECT users.id FROM users\n  WHERE users.telegram_id = $1::BIGINT",
+        "SELECT users.id FROM users WHERE users.telegram_id = ?::BIGINT",
+    ),
+    (
+        "SELECT * FROM activities WHERE user_id = 42 AND description = 'it''s'",
+        "SELECT * FROM activities WHERE user_id = ? AND description = ?",
+    ),
+    (
+        "SELECT * FROM categories WHERE id IN ($1, $2, $3)",
+        "SELECT * FROM categories WHERE id IN (?, ...)",
+    ),
+    (
+        "INSERT INTO categories (user_id, name) VALUES ($1, $2), ($3, $4), ($5, $6)",
+        "INSERT INTO categories (user_id, name) VALUES (?, ...), ..."
+    ),
+    (
+        "SELECT ix_1.id FROM t1 AS ix_1 LIMIT $1",
+        "SELECT ix_1.id FROM t1 AS ix_1 LIMIT ?",
+    ),
+])
+def test_normalize_statement(statement, normalized):
+    """Test that values, IN lists and multi-row VALUES collapse to the statement shape."""
+    assert normalize_statement(statement) == normalized
+
+
+@pytest.mark.unit
+def test_in_lists_of_any_length_share_one_entry():
+    """Test that expanded IN lists of different lengths are aggregated together."""
+    stats = QueryStatsAggregator()
+
+    stats.record("SELECT * FROM t WHERE id IN ($1, $2)", 0.001, 2)
+    stats.record("SELECT * FROM t WHERE id IN ($1, $2, $3, $4)", 0.001, 4)
+
+    assert len(stats) == 1
+
+
+# ============================================================================
+# Test: Aggregation
+# ============================================================================
+
+@pytest.mark.unit
+def test_record_aggregates_calls_time_and_rows():
+    """Test calls, total/mean/max time and rows (unknown rowcount ignored)."""
+    stats = QueryStatsAggregator()
+
+    stats.record("SELECT * FROM users WHERE id = $1", 0.002, 1)
+    stats.record("SELECT * FROM users WHERE id = $1", 0.006, 1)
+    stats.record("SELECT * FROM users WHERE id = $1", 0.004, -1)
+
+    [entry] = stats.snapshot()
+    assert entry.calls == 3
+    assert entry.total_time == pytest.approx(0.012)
+    assert entry.mean_time == pytest.approx(0.004)
+    assert entry.max_time == pytest.approx(0.006)
+    assert entry.rows == 2
+
+
+@pytest.mark.unit
+def test_snapshot_orders_descending_and_limits():
+    """Test snapshot sort key and limit."""
+    stats = QueryStatsAggregator()
+    stats.record("SELECT 1 FROM a", 0.010, 1)
+    for _ in range(5):
+        stats.record("SELECT 1 FROM b", 0.001, 1)
+
+    assert [e.query for e in stats.snapshot("total_time")] == ["SELECT ? FROM a", "SELECT ? FROM b"]
+    assert [e.query for e in stats.snapshot("calls", limit=1)] == ["SELECT ? FROM b"]
+
+
+@pytest.mark.unit
+def test_full_table_evicts_least_called():
+    """Test that the table stays bounded and keeps frequently called statements."""
+    stats = QueryStatsAggregator(max_entries=3)
+    for _ in range(3):
+        stats.record("SELECT 1 FROM hot", 0.001, 1)
+    stats.record("SELECT 1 FROM cold_a", 0.001, 1)
+    stats.record("SELECT 1 FROM cold_b", 0.001, 1)
+
+    stats.record("SELECT 1 FROM new", 0.001, 1)
+
+    queries = {e.query for e in stats.snapshot()}
+    assert len(stats) == 3
+    assert stats.evicted == 1
+    assert "SELECT ? FROM hot" in queries
+    assert "SELECT ? FROM new" in queries
+
+
+@pytest.mark.unit
+def test_reset_clears_statistics():
+    """Test that reset discards entries and eviction count."""
+    stats = QueryStatsAggregator(max_entries=1)
+    stats.record("SELECT 1 FROM a", 0.001, 1)
+    stats.record("SELECT 1 FROM b", 0.001, 1)
+
+    stats.reset()
+
+    assert len(stats) == 0
+    assert stats.evicted == 0
+
+
+# ============================================================================
+# Test: Debug headers and admin endpoints
+# ============================================================================
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(admin_router)
+
+    @app.get("/n-plus-one")
+    async def n_plus_one() -> dict:
+        for _ in range(3):
+            record_query("SELECT * FROM categories WHERE id = $1", 0.002, 1)
+        return {"status": "ok"}
+
+    app.add_middleware(QueryStatsHeadersMiddleware)
+    return app
+
+
+@pytest.mark.unit
+def test_middleware_adds_query_count_and_db_time_headers():
+    """Test per-request statement count and DB time headers."""
+    client = TestClient(_build_app())
+
+    response = client.get("/n-plus-one")
+
+    assert response.headers[QUERY_COUNT_HEADER] == "3"
+    assert response.headers[DB_TIME_HEADER] == "6.00"
+
+    # Counters are per request, not cumulative
+    response = client.get("/admin/query-stats")
+    assert response.headers[QUERY_COUNT_HEADER] == "0"
+
+
+@pytest.mark.unit
+def test_admin_query_stats_and_reset():
+    """Test that the admin endpoint lists aggregated statements and reset empties it."""
+    QUERY_STATS.reset()
+    client = TestClient(_build_app())
+    client.get("/n-plus-one")
+
+    response = client.get("/admin/query-stats", params={"order_by": "calls"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["tracked"] == 1
+    assert body["statements"][0] == {
+        "query": "SELECT * FROM categories WHERE id = ?",
+        "calls": 3,
+        "total_time_ms": 6.0,
+        "mean_time_ms": 2.0,
+        "max_time_ms": 2.0,
+        "rows": 3,
+    }
+
+    assert client.delete("/admin/query-stats").status_code == 204
+    assert client.get("/admin/query-stats").json()["statements"] == []
+
+
+@pytest.mark.unit
+def test_admin_api_is_not_mounted_by_default():
+    """Test that the unauthenticated admin API is opt-in (ENABLE_ADMIN_API)."""
+    from src.main import app
+
+    response = TestClient(app).get("/api/v1/admin/query-stats")
+
+    assert response.status_code == 404
@@ -0,0 +1,45 @@
+"""
+Unit tests for read-only session routing of GET endpoints.
+"""
+import pytest
+from fastapi.routing import APIRoute
+
+from src.infrastructure.database.connection import get_db, get_read_db, read_session
+from src.main import app
+
+
+def _dependency_calls(dependant) -> set:
+    calls = {dependant.call}
+    for sub in dependant.dependencies:
+        calls |= _dependency_calls(sub)
+    return calls
+
+
+def _api_routes(method: str) -> list[APIRoute]:
+    return [
+        route for route in app.routes
+        if isinstance(route, APIRoute)
+        and route.path.startswith("/api/v1")
+        and method in route.methods
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("route", _api_routes("GET"), ids=lambda r: r.path)
+def test_get_routes_do_not_use_read_write_session(route):
+    """Test that GET routes never check out a read-write (committing) session."""
+    assert get_db not in _dependency_calls(route.dependant)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("route", _api_routes("POST") + _api_routes("PATCH"), ids=lambda r: r.path)
+def test_write_routes_do_not_use_read_only_session(route):
+    """Test that writes are never routed to the read-only session (replica)."""
+    assert get_read_db not in _dependency_calls(route.dependant)
+
+
+@pytest.mark.unit
+def test_read_session_runs_in_autocommit():
+    """Test that read-only sessions skip BEGIN/COMMIT via autocommit."""
+    bind = read_session.kw["bind"]
+    assert bind.get_execution_options()["isolation_level"] == "AUTOCOMMIT"
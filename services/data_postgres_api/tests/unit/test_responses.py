@@ -0,0 +1,66 @@
+"""
+Unit tests for fast JSON response classes.
+"""
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from src.api.responses import ModelListResponse
+from src.domain.models.activity import Activity
+from src.domain.models.category import Category
+from src.schemas.activity import ActivityResponse
+
+
+def _activity(activity_id: int, category: Category | None = None) -> Activity:
+    start = datetime(2025, 11, 7, 10, 0, tzinfo=timezone.utc)
+    activity = Activity(
+        id=activity_id,
+        user_id=1,
+        category_id=category.id if category else None,
+        description="Deep work",
+        tags=None,
+        start_time=start,
+        end_time=start.replace(hour=11),
+        duration_minutes=60,
+        created_at=start,
+    )
+    if category is not None:
+        activity.category = category
+    return activity
+
+
+@pytest.mark.unit
+def test_model_list_response_serializes_orm_rows_with_category():
+    """Test that ORM rows are rendered with category fields from the loaded relationship."""
+    rows = [_activity(1, Category(id=5, user_id=1, name="Work", emoji="💼")), _activity(2)]
+
+    response = ModelListResponse(ActivityResponse, rows, headers={"X-Next-Cursor": "abc"})
+
+    body = json.loads(response.body)
+    assert response.media_type == "application/json"
+    assert response.headers["X-Next-Cursor"] == "abc"
+    assert [item["id"] for item in body] == [1, 2]
+    assert (body[0]["category_name"], body[0]["category_emoji"]) == ("Work", "💼")
+    assert (body[1]["category_name"], body[1]["category_emoji"]) == (None, None)
+    assert body[0]["start_time"] == "2025-11-07T10:00:00Z"
+
+
+@pytest.mark.unit
+def test_model_list_response_accepts_row_mappings():
+    """Test that Core row mappings (dicts) validate without ORM objects."""
+    row = ActivityResponse.model_validate(_activity(1)).model_dump()
+    row["category_name"] = "Sport"
+
+    body = json.loads(ModelListResponse(ActivityResponse, [row]).body)
+
+    assert body[0]["category_name"] == "Sport"
+
+
+@pytest.mark.unit
+def test_activity_category_properties_do_not_lazy_load():
+    """Test that category_name/emoji are None when the relationship is not loaded."""
+    activity = _activity(1)
+
+    assert activity.category_name is None
+    assert "category" not in activity.__dict__
@@ -0,0 +1,93 @@
+"""
+Unit tests for SQL instrumentation modes (cursor execute hooks).
+"""
+import logging
+
+import pytest
+from sqlalchemy import create_engine, event, text
+
+from src.infrastructure.database import connection
+from src.infrastructure.database.connection import install_sql_instrumentation
+from src.infrastructure.database.query_stats import QUERY_STATS
+
+LOGGER_NAME = "src.infrastructure.database.connection"
+
+
+@pytest.fixture
+def sqlite_engine():
+    """Fresh sync SQLite engine without hooks; statistics reset."""
+    QUERY_STATS.reset()
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+    QUERY_STATS.reset()
+
+
+def _execute(engine, count: int) -> None:
+    with engine.connect() as conn:
+        for _ in range(count):
+            conn.execute(text("SELECT :token"), {"token": "secret"})
+
+
+@pytest.mark.unit
+def test_off_installs_no_hooks(sqlite_engine):
+    """Test that mode "off" leaves the engine without cursor hooks."""
+    install_sql_instrumentation(sqlite_engine, "off")
+
+    assert not event.contains(sqlite_engine, "before_cursor_execute", connection.before_cursor_execute)
+    _execute(sqlite_engine, 3)
+    assert len(QUERY_STATS) == 0
+
+
+@pytest.mark.unit
+def test_timing_records_statistics_without_debug_records(sqlite_engine, caplog):
+    """Test that "timing" records statistics but emits no per-statement logs."""
+    install_sql_instrumentation(sqlite_engine, "timing")
+
+    with caplog.at_level(logging.DEBUG, logger=LOGGER_NAME):
+        _execute(sqlite_engine, 3)
+
+    [entry] = QUERY_STATS.snapshot()
+    assert entry.calls == 3
+    assert caplog.records == []
+
+
+@pytest.mark.unit
+def test_timing_warns_about_slow_queries(sqlite_engine, caplog, monkeypatch):
+    """Test that slow statements are counted and logged with redacted parameters."""
+    monkeypatch.setattr(connection, "SLOW_QUERY_THRESHOLD", -1.0)
+    install_sql_instrumentation(sqlite_engine, "timing")
+
+    with caplog.at_level(logging.WARNING, logger=LOGGER_NAME):
+        _execute(sqlite_engine, 1)
+
+    [record] = caplog.records
+    assert record.getMessage() == "Slow SQL query detected"
+    assert "secret" not in record.params
+
+
+@pytest.mark.unit
+def test_sampled_logs_every_nth_statement(sqlite_engine, caplog):
+    """Test that "sampled" emits one debug record per sample_every statements."""
+    install_sql_instrumentation(sqlite_engine, "sampled", sample_every=4)
+
+    with caplog.at_level(logging.DEBUG, logger=LOGGER_NAME):
+        _execute(sqlite_engine, 8)
+
+    assert [r.getMessage() for r in caplog.records] == ["SQL query completed (sampled)"] * 2
+    assert QUERY_STATS.snapshot()[0].calls == 8
+
+
+@pytest.mark.unit
+def test_debug_logs_start_and_completion(sqlite_engine, caplog):
+    """Test that "debug" logs every statement with sanitized parameters."""
+    install_sql_instrumentation(sqlite_engine, "debug")
+
+    with caplog.at_level(logging.DEBUG, logger=LOGGER_NAME):
+        _execute(sqlite_engine, 1)
+
+    assert [r.getMessage() for r in caplog.records] == [
+        "Executing SQL query",
+        "SQL query completed",
+    ]
+    assert "secret" not in caplog.records[0].params_preview
@@ -7,7 +7,9 @@ import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock
 
-from src.application.services.user_service import UserService
+from pydantic import ValidationError
+
+from src.application.services.user_service import DEFAULT_CATEGORIES, UserService
 from src.domain.models.user import User
 from src.schemas.user import UserCreate
 
@@ -108,6 +110,15 @@ async def test_create_user_without_optional_fields(user_service, mock_repository
     assert result.username is None
 
 
+@pytest.mark.unit
+def test_user_create_rejects_unknown_timezone():
+    """Test that only IANA time zone names are accepted (rollups convert with AT TIME ZONE)."""
+    with pytest.raises(ValidationError, match="Unknown timezone"):
+        UserCreate(telegram_id=1, timezone="Mars/Olympus_Mons")
+
+    assert UserCreate(telegram_id=1, timezone="Asia/Tokyo").timezone == "Asia/Tokyo"
+
+
 # ============================================================================
 # Test: get_by_telegram_id
 # ============================================================================
@@ -239,3 +250,98 @@ async def test_update_last_poll_time_multiple_updates(user_service, mock_reposit
     assert result1.last_poll_time == poll_time1
     assert result2.last_poll_time == poll_time2
     assert mock_repository.update_last_poll_time.call_count == 2
+
+
+# ============================================================================
+# Test: get_context_by_telegram_id
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_context_by_telegram_id_returns_repository_context(user_service, mock_repository, mock_user):
+    """Test that context lookup is a single repository call."""
+    last_end = datetime(2025, 11, 7, 12, 0, 0)
+    mock_repository.get_context_by_telegram_id = AsyncMock(return_value=(mock_user, last_end))
+
+    result = await user_service.get_context_by_telegram_id(123456789)
+
+    assert result == (mock_user, last_end)
+    mock_repository.get_context_by_telegram_id.assert_called_once_with(123456789)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_context_by_telegram_id_not_found(user_service, mock_repository):
+    """Test that unknown user yields None."""
+    mock_repository.get_context_by_telegram_id = AsyncMock(return_value=None)
+
+    assert await user_service.get_context_by_telegram_id(999) is None
+
+
+# ============================================================================
+# Test: stream_active_users_with_settings
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_active_users_with_settings_yields_repository_rows(user_service, mock_repository, mock_user):
+    """Test that active users are passed through from the repository stream."""
+    async def stream():
+        yield mock_user
+
+    mock_repository.stream_active_users_with_settings = Mock(return_value=stream())
+
+    users = [user async for user in user_service.stream_active_users_with_settings()]
+
+    assert users == [mock_user]
+    mock_repository.stream_active_users_with_settings.assert_called_once_with()
+
+
+# ============================================================================
+# Test: onboard_user
+# ============================================================================
+
+@pytest.fixture
+def onboarding_service(mock_repository):
+    """Create UserService with all onboarding repositories mocked."""
+    settings_repository = Mock()
+    settings_repository.create_if_absent = AsyncMock(return_value=None)
+    category_repository = Mock()
+    category_repository.bulk_create_if_absent = AsyncMock(return_value=[])
+    return UserService(mock_repository, settings_repository, category_repository)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_onboard_user_new_user_gets_settings_and_default_categories(
+    onboarding_service, mock_repository, valid_user_data, mock_user
+):
+    """Test that a new user gets settings and the default category set in one batch."""
+    mock_repository.upsert_by_telegram_id = AsyncMock(return_value=(mock_user, True))
+    mock_repository.get_context_by_telegram_id = AsyncMock(return_value=(mock_user, None))
+
+    user, last_end, created = await onboarding_service.onboard_user(valid_user_data)
+
+    assert (user, last_end, created) == (mock_user, None, True)
+    onboarding_service.settings_repository.create_if_absent.assert_called_once()
+    assert onboarding_service.settings_repository.create_if_absent.call_args[0][0].user_id == mock_user.id
+    categories = onboarding_service.category_repository.bulk_create_if_absent.call_args[0][0]
+    assert [c.name for c in categories] == [c["name"] for c in DEFAULT_CATEGORIES]
+    assert all(c.is_default and c.user_id == mock_user.id for c in categories)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_onboard_user_existing_user_does_not_recreate_categories(
+    onboarding_service, mock_repository, valid_user_data, mock_user
+):
+    """Test that returning users keep their categories (deleted defaults stay deleted)."""
+    last_end = datetime(2025, 11, 7, 12, 0, 0)
+    mock_repository.upsert_by_telegram_id = AsyncMock(return_value=(mock_user, False))
+    mock_repository.get_context_by_telegram_id = AsyncMock(return_value=(mock_user, last_end))
+
+    result = await onboarding_service.onboard_user(valid_user_data)
+
+    assert result == (mock_user, last_end, False)
+    onboarding_service.settings_repository.create_if_absent.assert_called_once()
+    onboarding_service.category_repository.bulk_create_if_absent.assert_not_called()
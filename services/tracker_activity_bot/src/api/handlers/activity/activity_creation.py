@@ -19,6 +19,7 @@ from aiogram import Router, F, types, Bot
 from aiogram.fsm.context import FSMContext
 
 from src.api.dependencies import ServiceContainer
+from src.api.keyboards.activity import MAX_RECENT_SUGGESTIONS
 from src.api.keyboards.main_menu import get_main_menu_keyboard
 from src.api.keyboards.time_select import (
     get_period_keyboard,
@@ -693,8 +694,7 @@ async def process_category_callback(
             user_id=user_id,
             category_id=category_id,
             start_time=start_time,
-            end_time=end_time,
-            limit=20
+            end_time=end_time
         )
 
         logger.info(
@@ -762,37 +762,23 @@ async def select_recent_activity(
         category_id = data.get("category_id")
         trigger_source = data.get("trigger_source", "manual")
 
-        # Fetch the selected activity to get its description
-        if category_id:
-            response = await services.activity.get_user_activities_by_category(
-                user_id=user_id,
-                category_id=category_id,
-                limit=20
-            )
-        else:
-            response = await services.activity.get_user_activities(
-                user_id=user_id,
-                limit=20
-            )
-
-        recent_activities = (
-            response.get("activities", [])
-            if isinstance(response, dict)
-            else response
+        # Buttons carry the latest activity ID of each suggested description
+        suggestions = await services.activity.get_recent_descriptions(
+            user_id=user_id,
+            category_id=category_id,
+            limit=MAX_RECENT_SUGGESTIONS
         )
-
-        # Find the activity with matching ID
-        selected_activity = next(
-            (act for act in recent_activities if act.get("id") == activity_id),
+        selected = next(
+            (item for item in suggestions if item.get("last_activity_id") == activity_id),
             None
         )
 
-        if not selected_activity:
+        if not selected:
             await callback.message.answer("⚠️ Активность не найдена.")
             await callback.answer()
             return
 
-        description = selected_activity.get("description", "")
+        description = selected.get("description", "")
         tags = extract_tags(description)
 
         logger.info(
@@ -25,7 +25,7 @@ from aiogram.types import InlineKeyboardMarkup
 from aiogram.fsm.context import FSMContext
 
 from src.api.dependencies import ServiceContainer
-from src.api.keyboards.activity import get_recent_activities_keyboard
+from src.api.keyboards.activity import MAX_RECENT_SUGGESTIONS, get_recent_activities_keyboard
 from src.api.keyboards.main_menu import get_main_menu_keyboard
 from src.application.utils.formatters import (
     format_time,
@@ -84,12 +84,13 @@ async def fetch_and_build_description_prompt(
     category_id: int,
     start_time: datetime,
     end_time: datetime,
-    limit: int = 20
+    limit: int = MAX_RECENT_SUGGESTIONS
 ) -> tuple[str, InlineKeyboardMarkup | None]:
-    """Fetch recent activities and build description prompt with keyboard.
+    """Fetch recent descriptions and build description prompt with keyboard.
 
-    Fetches recent activities for the given category and builds a prompt
-    message with inline keyboard showing recent activity suggestions.
+    Fetches the category's distinct recent descriptions (deduplicated by the
+    API) and builds a prompt message with inline keyboard showing them as
+    suggestions.
 
     Args:
         services: Service container with data access
@@ -97,13 +98,13 @@ async def fetch_and_build_description_prompt(
         category_id: Category ID to filter activities
         start_time: Activity start time (for display)
         end_time: Activity end time (for display)
-        limit: Maximum number of recent activities to fetch (default: 20)
+        limit: Maximum number of suggestions to fetch (default: 8)
 
     Returns:
         Tuple of (prompt_text, keyboard)
         - prompt_text: Formatted message with time range and instructions
-        - keyboard: InlineKeyboardMarkup with recent activity buttons,
-                   or None if no recent activities found
+        - keyboard: InlineKeyboardMarkup with recent description buttons,
+                   or None if the category has no activities yet
 
     Examples:
         >>> text, keyboard = await fetch_and_build_description_prompt(
@@ -111,33 +112,28 @@ async def fetch_and_build_description_prompt(
         ... )
         >>> await message.answer(text, reply_markup=keyboard)
 
-        # With recent activities:
+        # With recent descriptions:
         # text: "✏️ Опиши активность\\n\\n⏰ 10:00 — 12:00 (2ч)\\n\\nВыбери из последних..."
         # keyboard: InlineKeyboardMarkup with suggestion buttons
 
-        # Without recent activities:
+        # Without recent descriptions:
         # text: "✏️ Опиши активность\\n\\n⏰ 10:00 — 12:00 (2ч)\\n\\nНапиши, чем ты занимался..."
         # keyboard: None
 
     Note:
         All text is in Russian (user-facing).
-        Errors are logged but gracefully handled (returns empty activities list).
+        Errors are logged but gracefully handled (returns empty suggestions list).
     """
-    # Fetch recent activities
+    # Fetch recent distinct descriptions
     try:
-        response = await services.activity.get_user_activities_by_category(
+        suggestions = await services.activity.get_recent_descriptions(
             user_id=user_id,
             category_id=category_id,
             limit=limit
         )
-        recent_activities = (
-            response.get("activities", [])
-            if isinstance(response, dict)
-            else response
-        )
     except Exception as e:
         logger.error(
-            "Error fetching recent activities for description prompt",
+            "Error fetching recent descriptions for description prompt",
             extra={
                 "user_id": user_id,
                 "category_id": category_id,
@@ -145,7 +141,7 @@ async def fetch_and_build_description_prompt(
             },
             exc_info=True
         )
-        recent_activities = []
+        suggestions = []
 
     # Format time and duration
     start_time_str = format_time(start_time)
@@ -160,12 +156,12 @@ async def fetch_and_build_description_prompt(
     )
 
     # Add suggestions or plain prompt
-    if recent_activities:
+    if suggestions:
         text += (
             "Выбери из последних или напиши своё (минимум 3 символа).\n"
             "Можешь добавить теги через #хештег"
         )
-        keyboard = get_recent_activities_keyboard(recent_activities)
+        keyboard = get_recent_activities_keyboard(suggestions)
     else:
         text += (
             "Напиши, чем ты занимался (минимум 3 символа).\n"
@@ -178,7 +174,7 @@ async def fetch_and_build_description_prompt(
         extra={
             "user_id": user_id,
             "category_id": category_id,
-            "recent_activities_count": len(recent_activities),
+            "suggestions_count": len(suggestions),
             "has_keyboard": keyboard is not None
         }
     )
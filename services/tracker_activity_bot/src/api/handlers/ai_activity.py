@@ -42,6 +42,9 @@ logger = logging.getLogger(__name__)
 
 router = Router()
 
+# Recent distinct descriptions given to the AI as context
+AI_CONTEXT_DESCRIPTIONS = 5
+
 # Initialize AI service (shared instance)
 ai_service = AIService()
 
@@ -137,15 +140,10 @@ async def handle_ai_activity_input(
             )
             return
 
-        # Get recent activities for context
-        recent_activities_response = await services.activity.get_user_activities(
+        # Get recent distinct descriptions for context
+        recent_activities = await services.activity.get_recent_descriptions(
             user_id=user["id"],
-            limit=20
-        )
-        recent_activities = (
-            recent_activities_response.get("activities", [])
-            if isinstance(recent_activities_response, dict)
-            else recent_activities_response
+            limit=AI_CONTEXT_DESCRIPTIONS
         )
 
         # Parse with AI
@@ -153,7 +151,8 @@ async def handle_ai_activity_input(
             user_input=user_input,
             categories=categories,
             recent_activities=recent_activities,
-            user_timezone=user.get("timezone", "UTC")
+            user_timezone=user.get("timezone", "UTC"),
+            last_activity_end=user.get("last_activity_end_time")
         )
 
         if not result:
@@ -634,15 +633,10 @@ async def handle_ai_clarification_input(
         # Get categories
         categories = await services.category.get_user_categories(user_id)
 
-        # Get recent activities
-        recent_activities_response = await services.activity.get_user_activities(
+        # Get recent distinct descriptions
+        recent_activities = await services.activity.get_recent_descriptions(
             user_id=user_id,
-            limit=20
-        )
-        recent_activities = (
-            recent_activities_response.get("activities", [])
-            if isinstance(recent_activities_response, dict)
-            else recent_activities_response
+            limit=AI_CONTEXT_DESCRIPTIONS
         )
 
         # Parse with AI again
@@ -650,7 +644,8 @@ async def handle_ai_clarification_input(
             user_input=user_input,
             categories=categories,
             recent_activities=recent_activities,
-            user_timezone=user.get("timezone", "UTC")
+            user_timezone=user.get("timezone", "UTC"),
+            last_activity_end=user.get("last_activity_end_time")
         )
 
         if not result:
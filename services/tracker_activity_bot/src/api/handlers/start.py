@@ -18,33 +18,13 @@ async def cmd_start(message: types.Message, services: ServiceContainer):
     username = message.from_user.username
     first_name = message.from_user.first_name
 
-    # Check if user exists
-    user = await services.user.get_by_telegram_id(telegram_id)
+    # Get or create user, settings and default categories in one request
+    context = await services.user.onboard(telegram_id, username, first_name)
+    user = context["user"]
+    settings = context["settings"]
 
-    if not user:
-        # Create new user
-        logger.info(f"Creating new user: telegram_id={telegram_id}")
-        user = await services.user.create_user(telegram_id, username, first_name)
-
-        # Create default categories
-        default_categories = [
-            {"name": "Работа", "emoji": "💼", "is_default": True},
-            {"name": "Спорт", "emoji": "🏃", "is_default": True},
-            {"name": "Отдых", "emoji": "🎮", "is_default": True},
-            {"name": "Обучение", "emoji": "📚", "is_default": True},
-            {"name": "Сон", "emoji": "😴", "is_default": True},
-            {"name": "Еда", "emoji": "🍽️", "is_default": True},
-        ]
-        await services.category.bulk_create_categories(user["id"], default_categories)
-
-        # Create user settings with defaults (or fetch if already exist)
-        try:
-            settings = await services.settings.create_settings(user["id"])
-            logger.info(f"Created settings for user {user['id']}: {settings}")
-        except Exception as e:
-            # Settings already exist (e.g., user was previously created)
-            logger.info(f"Settings already exist for user {user['id']}, fetching existing settings")
-            settings = await services.settings.get_settings(user["id"])
+    if context["created"]:
+        logger.info(f"Created new user: telegram_id={telegram_id}, user_id={user['id']}")
 
         # Schedule first automatic poll
         user_timezone = user.get("timezone", "Europe/Moscow")
@@ -76,13 +56,7 @@ async def cmd_start(message: types.Message, services: ServiceContainer):
             "💡 Кнопка \"📝 Записать активность\" всегда доступна внизу экрана!"
         )
     else:
-        # Check if user has settings (for backward compatibility with existing users)
-        settings = await services.settings.get_settings(user["id"])
-        if not settings:
-            logger.info(f"Creating missing settings for existing user {user['id']}")
-            settings = await services.settings.create_settings(user["id"])
-
-        # Schedule poll for ALL returning users (with or without settings)
+        # Schedule poll for ALL returning users (onboarding creates missing settings)
         user_timezone = user.get("timezone", "Europe/Moscow")
         await services.scheduler.schedule_poll(
             user_id=telegram_id,
@@ -93,7 +67,6 @@ async def cmd_start(message: types.Message, services: ServiceContainer):
         )
         logger.info(
             f"Scheduled poll for RETURNING user {telegram_id} "
-            f"(settings existed: {settings is not None}) "
             f"with intervals: weekday={settings.get('poll_interval_weekday') if settings else 'N/A'}min, "
             f"weekend={settings.get('poll_interval_weekend') if settings else 'N/A'}min"
         )
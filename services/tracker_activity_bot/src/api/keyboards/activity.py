@@ -3,52 +3,41 @@ from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from typing import List
 
 
-def get_recent_activities_keyboard(activities: List[dict]) -> InlineKeyboardMarkup:
-    """Get keyboard with recent activities as inline buttons.
+# Suggestion buttons shown under the description prompt (2 columns, 4 rows)
+MAX_RECENT_SUGGESTIONS = 8
 
-    Creates a keyboard with up to 8 unique recent activity descriptions
-    displayed in 2 columns. Each button displays activity description
-    split into 2 lines for better readability.
+
+def get_recent_activities_keyboard(suggestions: List[dict]) -> InlineKeyboardMarkup:
+    """Get keyboard with recent activity descriptions as inline buttons.
+
+    Creates a keyboard with up to 8 recent descriptions displayed in 2
+    columns. Each button displays the description split into 2 lines for
+    better readability.
 
     Args:
-        activities: List of activity dicts with 'id' and 'description' fields.
-                   Expected from API response with ActivityResponse schema.
-                   Activities are assumed to be ordered from newest to oldest.
+        suggestions: Description suggestions with 'description' and
+                    'last_activity_id' fields, as returned by
+                    GET /activities/recent-descriptions (already distinct,
+                    most recently used first).
 
     Returns:
-        Keyboard with unique recent activity buttons in 2 columns (4 rows max).
+        Keyboard with recent description buttons in 2 columns (4 rows max).
         User can also enter custom description as text message (not a button).
     """
     buttons = []
-
-    # Remove duplicates by description, keeping first occurrence (most recent)
-    seen_descriptions = set()
-    unique_activities = []
-
-    for activity in activities:
-        description = activity.get("description", "")
-        if description and description not in seen_descriptions:
-            seen_descriptions.add(description)
-            unique_activities.append(activity)
-
-            # Stop after collecting 8 unique activities
-            if len(unique_activities) >= 8:
-                break
+    suggestions = suggestions[:MAX_RECENT_SUGGESTIONS]
 
     # Create rows with 2 buttons each (2 columns layout)
-    for i in range(0, len(unique_activities), 2):
+    for i in range(0, len(suggestions), 2):
         row = []
-        for j in range(i, min(i + 2, len(unique_activities))):
-            activity = unique_activities[j]
-            description = activity.get("description", "")
-
+        for suggestion in suggestions[i:i + 2]:
             # Split description into 2 lines for better readability
             # Line 1: first ~20 chars, Line 2: next ~20 chars
-            display_text = _format_two_line_button(description)
+            display_text = _format_two_line_button(suggestion["description"])
 
             row.append(InlineKeyboardButton(
                 text=display_text,
-                callback_data=f"activity_desc_{activity['id']}"
+                callback_data=f"activity_desc_{suggestion['last_activity_id']}"
             ))
         buttons.append(row)
 
@@ -320,7 +320,8 @@ class AIService:
         categories: List[Dict[str, Any]],
         recent_activities: List[Dict[str, Any]] | None = None,
         user_timezone: str = "UTC",
-        max_retries: int = 3
+        max_retries: int = 3,
+        last_activity_end: datetime | str | None = None
     ) -> AIParsingResult | None:
         """Parse user text input into structured activity data.
 
@@ -331,9 +332,11 @@ class AIService:
         Args:
             user_input: Raw text from user (e.g., "читал книгу 2 часа")
             categories: List of user's available categories
-            recent_activities: User's recent activities for context
+            recent_activities: User's recent distinct descriptions with
+                category_name (GET /activities/recent-descriptions)
             user_timezone: User's timezone (e.g., "Europe/Moscow")
             max_retries: Maximum number of model attempts
+            last_activity_end: End time of the user's latest activity
 
         Returns:
             AIParsingResult with parsed data, or None if all models fail
@@ -376,7 +379,9 @@ class AIService:
                 self.consecutive_failures = 0
 
         # Build prompt with context
-        prompt = self._build_prompt(user_input, categories, recent_activities, user_timezone)
+        prompt = self._build_prompt(
+            user_input, categories, recent_activities, user_timezone, last_activity_end
+        )
 
         # Try models with automatic failover
         current_model = self.model_selector.get_best_model()
@@ -652,7 +657,8 @@ class AIService:
         user_input: str,
         categories: List[Dict[str, Any]],
         recent_activities: List[Dict[str, Any]] | None,
-        user_timezone: str
+        user_timezone: str,
+        last_activity_end: datetime | str | None = None
     ) -> str:
         """Build AI prompt with user context.
 
@@ -665,8 +671,10 @@ class AIService:
         Args:
             user_input: User's text input
             categories: Available categories
-            recent_activities: Recent activities for context
+            recent_activities: Recent distinct descriptions with category_name,
+                most recently used first (deduplicated by the API)
             user_timezone: User's timezone for accurate time parsing
+            last_activity_end: End time of the user's latest activity
 
         Returns:
             Complete prompt string
@@ -694,56 +702,32 @@ class AIService:
             for cat in categories
         ])
 
-        # Format recent activities (last 5 unique for context)
-        # Deduplicate to avoid confusing weak AI models with repeated patterns
+        # Format recent activities (last 5 descriptions for context; already
+        # distinct, so weak AI models are not confused by repeated patterns)
         activities_text = "Нет данных"
-        last_activity_info = "Нет данных"
         if recent_activities:
-            activities_list = []
-            seen_activities = set()  # Track (category, description) pairs
-
-            for act in recent_activities:
-                cat_name = act.get('category_name', 'Без категории')
-                desc = act.get('description', '')
-                activity_key = (cat_name, desc)
-
-                # Skip duplicates
-                if activity_key in seen_activities:
-                    continue
-
-                seen_activities.add(activity_key)
-                activities_list.append(f"- {cat_name}: {desc}")
-
-                # Limit to 5 unique activities to reduce context noise
-                if len(activities_list) >= 5:
-                    break
-
-            activities_text = "\n".join(activities_list)
+            activities_text = "\n".join(
+                f"- {act.get('category_name') or 'Без категории'}: {act.get('description', '')}"
+                for act in recent_activities[:5]
+            )
 
-            # Extract last activity timing info for context
-            last_activity = recent_activities[0]
+        # Last activity timing info for context
+        last_activity_info = "Нет данных"
+        if last_activity_end:
             try:
-                end_time_str = last_activity.get('end_time')
-                duration_minutes = last_activity.get('duration_minutes')
-
-                if end_time_str:
-                    # Parse end_time (could be string or datetime)
-                    if isinstance(end_time_str, str):
-                        last_end_utc = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
-                    else:
-                        # Already datetime object
-                        last_end_utc = end_time_str
-
-                    # Convert to user's local timezone
-                    last_end_local = last_end_utc.astimezone(user_tz)
-                    last_activity_info = (
-                        f"Закончилась в: {last_end_local.strftime('%H:%M')} "
-                        f"(продолжительность: {duration_minutes} мин)"
-                    )
+                # Parse end time (could be string or datetime)
+                if isinstance(last_activity_end, str):
+                    last_end_utc = datetime.fromisoformat(last_activity_end.replace('Z', '+00:00'))
+                else:
+                    last_end_utc = last_activity_end
+
+                # Convert to user's local timezone
+                last_end_local = last_end_utc.astimezone(user_tz)
+                last_activity_info = f"Закончилась в: {last_end_local.strftime('%H:%M')}"
             except Exception as e:
                 logger.warning(
                     f"Failed to parse last activity timing: {e}",
-                    extra={"last_activity": last_activity}
+                    extra={"last_activity_end": str(last_activity_end)}
                 )
 
         # Build comprehensive prompt
@@ -177,15 +177,18 @@ class SchedulerService:
         keeps jobs in memory only).
 
         Args:
-            get_active_users: Async function to get all active users from API
-            get_user_settings: Async function to get user settings by user_id
+            get_active_users: Function returning an async iterator over all
+                active users from API (users may carry their settings under
+                the "settings" key); each poll is scheduled as its user arrives
+            get_user_settings: Async function to get user settings by user_id,
+                used only for users without embedded settings
             send_poll_callback: Async function to send poll
             bot: Bot instance to pass to callback
 
         Algorithm:
-            1. Get all active users (users with last_poll_time set)
-            2. For each user:
-               - Get user settings (intervals, quiet hours, timezone)
+            1. Stream all active users (users with last_poll_time set)
+            2. For each user, as it arrives:
+               - Get user settings (embedded or fetched by user_id)
                - Calculate next poll time based on:
                  * last_poll_time (when user was last polled)
                  * current time
@@ -196,25 +199,18 @@ class SchedulerService:
         logger.info("Starting poll schedule restoration")
 
         try:
-            # Get all active users
-            users = await get_active_users()
-
-            if not users:
-                logger.info("No active users found, nothing to restore")
-                return
-
-            logger.info(
-                "Found active users to restore polls",
-                extra={"count": len(users)}
-            )
-
             restored_count = 0
             skipped_count = 0
 
-            for user in users:
+            # Schedule each user as soon as the API yields it
+            async for user in get_active_users():
                 try:
-                    # Get user settings
-                    settings = await get_user_settings(user["id"])
+                    # Settings embedded by the active users stream avoid one
+                    # request per user; fall back to fetching them otherwise
+                    if "settings" in user:
+                        settings = user["settings"]
+                    else:
+                        settings = await get_user_settings(user["id"])
                     if not settings:
                         logger.warning(
                             "No settings found for user, skipping",
@@ -260,12 +256,17 @@ class SchedulerService:
                     )
                     skipped_count += 1
 
+            total = restored_count + skipped_count
+            if not total:
+                logger.info("No active users found, nothing to restore")
+                return
+
             logger.info(
                 "Poll schedule restoration complete",
                 extra={
                     "restored": restored_count,
                     "skipped": skipped_count,
-                    "total": len(users)
+                    "total": total
                 }
             )
 
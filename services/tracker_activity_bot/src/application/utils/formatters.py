@@ -201,8 +201,7 @@ def format_activity_list(
             # Tags
             tags_text = ""
             if activity.get("tags"):
-                tags = activity["tags"].split(",")
-                tags_text = "\n🏷 " + " ".join(f"#{tag}" for tag in tags)
+                tags_text = "\n🏷 " + " ".join(f"#{tag}" for tag in activity["tags"])
 
             lines.append(
                 f"{category_text}{start_str} — {end_str} ({duration_str})\n"
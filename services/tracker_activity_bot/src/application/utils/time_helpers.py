@@ -75,8 +75,9 @@ async def get_last_activity_end_time(
     """
     Get end_time of the last recorded activity for a user.
 
-    Retrieves the most recent activity for the specified user and returns
-    its end_time. This is used to calculate accurate activity periods.
+    Reads the user's denormalized last activity pointer (one primary key
+    lookup on the API side, no activity query). This is used to calculate
+    accurate activity periods.
 
     Args:
         activity_service: Activity service HTTP client instance
@@ -93,16 +94,11 @@ async def get_last_activity_end_time(
         ...     print(f"Last activity ended at: {end_time}")
     """
     try:
-        # Get the most recent activity (limit=1)
-        activities = await activity_service.get_user_activities(
-            user_id=user_id,
-            limit=1
-        )
+        response = await activity_service.get_last_activity(user_id)
 
-        if activities and len(activities) > 0:
-            last_activity = activities[0]
+        end_time_str = response.get("last_activity_end_time")
+        if end_time_str:
             # Parse ISO format datetime string
-            end_time_str = last_activity["end_time"]
             return datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
 
         return None
@@ -48,3 +48,22 @@ class ActivityService:
         return await self.client.get(
             f"/api/v1/activities?user_id={user_id}&category_id={category_id}&limit={limit}"
         )
+
+    async def get_recent_descriptions(
+        self,
+        user_id: int,
+        category_id: int | None = None,
+        prefix: str | None = None,
+        limit: int = 8
+    ) -> list[dict]:
+        """Get distinct recent descriptions with use counts, newest first."""
+        params = {"user_id": user_id, "limit": limit}
+        if category_id is not None:
+            params["category_id"] = category_id
+        if prefix:
+            params["prefix"] = prefix
+        return await self.client.get("/api/v1/activities/recent-descriptions", params=params)
+
+    async def get_last_activity(self, user_id: int) -> dict:
+        """Get end time of the user's latest activity ("last_activity_end_time")."""
+        return await self.client.get(f"/api/v1/users/{user_id}/last-activity")
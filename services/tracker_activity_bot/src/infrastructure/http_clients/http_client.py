@@ -1,7 +1,8 @@
 """Base HTTP client with middleware support (OCP-compliant)."""
 
+import json
 import logging
-from typing import Any, List
+from typing import Any, AsyncIterator, List
 import httpx
 
 from src.core.config import settings
@@ -271,6 +272,40 @@ class DataAPIClient:
         """
         return await self._execute_request("DELETE", path, **kwargs)
 
+    async def iter_ndjson(self, path: str, **kwargs) -> AsyncIterator[Any]:
+        """
+        Make streaming GET request and yield NDJSON lines as parsed objects.
+
+        Request middleware (correlation ID, etc.) is applied; the body is
+        consumed line by line instead of being loaded at once.
+
+        Args:
+            path: Request path
+            **kwargs: Query parameters, headers, etc.
+
+        Yields:
+            One decoded JSON value per non-empty line
+
+        Raises:
+            httpx.HTTPStatusError: For 4xx/5xx responses
+            httpx.RequestError: For network/timeout errors
+
+        Example:
+            >>> async for user in client.iter_ndjson("/api/v1/users/active/stream"):
+            >>>     print(user["id"])
+        """
+        request = self.client.build_request("GET", path, **kwargs)
+        request = await self._process_request(request)
+
+        response = await self.client.send(request, stream=True)
+        try:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line:
+                    yield json.loads(line)
+        finally:
+            await response.aclose()
+
     async def close(self) -> None:
         """
         Close HTTP client and cleanup resources.
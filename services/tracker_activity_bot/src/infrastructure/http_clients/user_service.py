@@ -1,6 +1,6 @@
 """User service for interacting with users API."""
 from datetime import datetime
-from typing import List
+from typing import AsyncIterator, List
 
 import httpx
 from src.infrastructure.http_clients.http_client import DataAPIClient
@@ -20,6 +20,19 @@ class UserService:
         """
         return await self.client.get("/api/v1/users/active")
 
+    def get_all_active_users_with_settings(self) -> AsyncIterator[dict]:
+        """Iterate over all active users with their settings embedded.
+
+        Reads the NDJSON stream of the API (one JOIN, server-side cursor)
+        instead of fetching settings per user. Users are yielded as their
+        lines arrive, so callers can act on each one without holding the
+        whole list in memory.
+
+        Returns:
+            Async iterator of active users, each with a "settings" dict (or None)
+        """
+        return self.client.iter_ndjson("/api/v1/users/active/stream")
+
     async def get_by_telegram_id(self, telegram_id: int) -> dict | None:
         """Get user by Telegram ID."""
         try:
@@ -43,6 +56,25 @@ class UserService:
             "timezone": "Europe/Moscow"
         })
 
+    async def onboard(
+        self,
+        telegram_id: int,
+        username: str | None,
+        first_name: str | None
+    ) -> dict:
+        """Get or create user with default settings and categories.
+
+        Returns:
+            User context ("user", "settings", "categories",
+            "last_activity_end_time") plus "created" flag
+        """
+        return await self.client.post("/api/v1/users/onboard", json={
+            "telegram_id": telegram_id,
+            "username": username,
+            "first_name": first_name,
+            "timezone": "Europe/Moscow"
+        })
+
     async def update_last_poll_time(self, user_id: int, poll_time: datetime) -> dict:
         """Update last poll time for a user.
 
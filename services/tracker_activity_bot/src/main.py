@@ -130,9 +130,9 @@ async def main():
     try:
         from src.api.handlers.poll.poll_sender import send_automatic_poll
 
-        async def get_active_users_wrapper():
-            """Wrapper to get active users from API."""
-            return await services.user.get_all_active_users()
+        def get_active_users_wrapper():
+            """Wrapper to stream active users (with settings embedded) from API."""
+            return services.user.get_all_active_users_with_settings()
 
         async def get_user_settings_wrapper(user_id: int):
             """Wrapper to get user settings from API."""
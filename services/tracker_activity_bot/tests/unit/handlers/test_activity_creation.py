@@ -744,6 +744,47 @@ class TestSelectRecentActivity:
         assert "Ошибка" in message_text
 
 
+    @pytest.mark.unit
+    async def test_select_recent_activity_resolves_description_from_suggestions(
+        self,
+        mock_callback,
+        mock_state,
+        mock_services
+    ):
+        """
+        Test that the button's activity ID is resolved via recent descriptions.
+
+        GIVEN: Suggestions of the category, one with last_activity_id 42
+        WHEN: select_recent_activity is called for "activity_desc_42"
+        THEN: Only the recent-descriptions endpoint is queried
+              AND the activity is saved with that description and its tags
+        """
+        # Arrange
+        mock_callback.data = "activity_desc_42"
+        mock_state.get_data.return_value = {
+            "trigger_source": "manual",
+            "user_id": 1,
+            "category_id": 5
+        }
+        mock_services.activity.get_recent_descriptions.return_value = [
+            {"description": "Чтение #книги", "use_count": 3, "last_activity_id": 42},
+            {"description": "Бег", "use_count": 1, "last_activity_id": 40}
+        ]
+
+        with patch(
+            'src.api.handlers.activity.shared.create_and_save_activity', new_callable=AsyncMock
+        ) as mock_create:
+            # Act
+            await select_recent_activity(mock_callback, mock_state, mock_services)
+
+        # Assert
+        mock_services.activity.get_recent_descriptions.assert_called_once_with(
+            user_id=1, category_id=5, limit=8
+        )
+        mock_services.activity.get_user_activities_by_category.assert_not_called()
+        assert mock_create.call_args.kwargs["description"] == "Чтение #книги"
+        assert mock_create.call_args.kwargs["tags"] == ["книги"]
+
 class TestProcessDescription:
     """Test suite for process_description handler."""
 
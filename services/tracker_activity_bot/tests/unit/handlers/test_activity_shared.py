@@ -7,7 +7,7 @@ error handling.
 
 Test Coverage:
     - validate_description: Input validation with various edge cases
-    - fetch_and_build_description_prompt: Prompt building with/without recent activities
+    - fetch_and_build_description_prompt: Prompt building with/without recent descriptions
     - create_and_save_activity: Activity saving with optional post-save callbacks
 
 Coverage Target: 100% of shared.py
@@ -68,22 +68,20 @@ def mock_services():
 
 
 @pytest.fixture
-def sample_activities():
-    """Fixture: Sample recent activities."""
+def sample_suggestions():
+    """Fixture: Recent description suggestions (GET /activities/recent-descriptions)."""
     return [
         {
-            "id": 1,
             "description": "Работа над проектом #работа",
-            "start_time": "2025-11-11T10:00:00+00:00",
-            "end_time": "2025-11-11T12:00:00+00:00",
-            "duration_minutes": 120
+            "use_count": 4,
+            "last_used_at": "2025-11-11T10:00:00+00:00",
+            "last_activity_id": 1
         },
         {
-            "id": 2,
             "description": "Встреча с командой",
-            "start_time": "2025-11-11T14:00:00+00:00",
-            "end_time": "2025-11-11T15:00:00+00:00",
-            "duration_minutes": 60
+            "use_count": 1,
+            "last_used_at": "2025-11-11T14:00:00+00:00",
+            "last_activity_id": 2
         }
     ]
 
@@ -239,21 +237,19 @@ class TestFetchAndBuildDescriptionPrompt:
     async def test_fetch_with_recent_activities_returns_text_and_keyboard(
         self,
         mock_services,
-        sample_activities
+        sample_suggestions
     ):
         """
-        Test that recent activities result in keyboard with suggestions.
+        Test that recent descriptions result in keyboard with suggestions.
 
-        GIVEN: Recent activities exist for category
+        GIVEN: Recent descriptions exist for category
         WHEN: fetch_and_build_description_prompt is called
         THEN: Returns (text, keyboard)
               AND keyboard is not None
               AND text mentions "Выбери из последних"
         """
         # Arrange
-        mock_services.activity.get_user_activities_by_category.return_value = {
-            "activities": sample_activities
-        }
+        mock_services.activity.get_recent_descriptions.return_value = sample_suggestions
         start_time = datetime(2025, 11, 11, 10, 0, tzinfo=timezone.utc)
         end_time = datetime(2025, 11, 11, 12, 0, tzinfo=timezone.utc)
 
@@ -274,7 +270,7 @@ class TestFetchAndBuildDescriptionPrompt:
         # Times converted from UTC to Moscow (UTC+3): 10:00 → 13:00, 12:00 → 15:00
         assert "13:00 — 15:00" in text
         assert "2ч" in text
-        mock_services.activity.get_user_activities_by_category.assert_called_once_with(
+        mock_services.activity.get_recent_descriptions.assert_called_once_with(
             user_id=1,
             category_id=5,
             limit=20
@@ -286,17 +282,15 @@ class TestFetchAndBuildDescriptionPrompt:
         mock_services
     ):
         """
-        Test that no recent activities results in None keyboard.
+        Test that no recent descriptions results in None keyboard.
 
-        GIVEN: No recent activities for category
+        GIVEN: No recent descriptions for category
         WHEN: fetch_and_build_description_prompt is called
         THEN: Returns (text, None)
               AND text mentions "Напиши, чем ты занимался"
         """
         # Arrange
-        mock_services.activity.get_user_activities_by_category.return_value = {
-            "activities": []
-        }
+        mock_services.activity.get_recent_descriptions.return_value = []
         start_time = datetime(2025, 11, 11, 10, 0, tzinfo=timezone.utc)
         end_time = datetime(2025, 11, 11, 12, 0, tzinfo=timezone.utc)
 
@@ -318,7 +312,7 @@ class TestFetchAndBuildDescriptionPrompt:
     async def test_fetch_formats_time_correctly(
         self,
         mock_services,
-        sample_activities
+        sample_suggestions
     ):
         """
         Test that time is formatted correctly in prompt.
@@ -328,9 +322,7 @@ class TestFetchAndBuildDescriptionPrompt:
         THEN: Text contains formatted time range
         """
         # Arrange
-        mock_services.activity.get_user_activities_by_category.return_value = {
-            "activities": sample_activities
-        }
+        mock_services.activity.get_recent_descriptions.return_value = sample_suggestions
         start_time = datetime(2025, 11, 11, 14, 30, tzinfo=timezone.utc)
         end_time = datetime(2025, 11, 11, 16, 45, tzinfo=timezone.utc)
 
@@ -352,7 +344,7 @@ class TestFetchAndBuildDescriptionPrompt:
     async def test_fetch_calculates_duration_correctly(
         self,
         mock_services,
-        sample_activities
+        sample_suggestions
     ):
         """
         Test that duration is calculated and formatted correctly.
@@ -362,9 +354,7 @@ class TestFetchAndBuildDescriptionPrompt:
         THEN: Text contains "2ч 15м"
         """
         # Arrange
-        mock_services.activity.get_user_activities_by_category.return_value = {
-            "activities": sample_activities
-        }
+        mock_services.activity.get_recent_descriptions.return_value = sample_suggestions
         start_time = datetime(2025, 11, 11, 10, 0, tzinfo=timezone.utc)
         end_time = datetime(2025, 11, 11, 12, 15, tzinfo=timezone.utc)
 
@@ -394,7 +384,7 @@ class TestFetchAndBuildDescriptionPrompt:
               AND no exception is raised
         """
         # Arrange
-        mock_services.activity.get_user_activities_by_category.side_effect = Exception("DB error")
+        mock_services.activity.get_recent_descriptions.side_effect = Exception("DB error")
         start_time = datetime(2025, 11, 11, 10, 0, tzinfo=timezone.utc)
         end_time = datetime(2025, 11, 11, 12, 0, tzinfo=timezone.utc)
 
@@ -415,7 +405,7 @@ class TestFetchAndBuildDescriptionPrompt:
     async def test_fetch_limit_parameter_controls_activities_count(
         self,
         mock_services,
-        sample_activities
+        sample_suggestions
     ):
         """
         Test that limit parameter is passed to service correctly.
@@ -425,9 +415,7 @@ class TestFetchAndBuildDescriptionPrompt:
         THEN: Service is called with limit=5
         """
         # Arrange
-        mock_services.activity.get_user_activities_by_category.return_value = {
-            "activities": sample_activities
-        }
+        mock_services.activity.get_recent_descriptions.return_value = sample_suggestions
         start_time = datetime(2025, 11, 11, 10, 0, tzinfo=timezone.utc)
         end_time = datetime(2025, 11, 11, 12, 0, tzinfo=timezone.utc)
 
@@ -442,7 +430,7 @@ class TestFetchAndBuildDescriptionPrompt:
         )
 
         # Assert
-        mock_services.activity.get_user_activities_by_category.assert_called_once_with(
+        mock_services.activity.get_recent_descriptions.assert_called_once_with(
             user_id=1,
             category_id=5,
             limit=5
@@ -694,6 +694,52 @@ class TestDataAPIClientRequestExecution:
         error_middleware.handle_error.assert_called_once()
 
 
+class TestDataAPIClientStreaming:
+    """
+    Test suite for NDJSON streaming requests.
+    """
+
+    @pytest.mark.unit
+    @patch('src.infrastructure.http_clients.http_client.httpx.AsyncClient')
+    async def test_iter_ndjson_yields_parsed_lines_and_closes_response(
+        self,
+        mock_async_client,
+        mock_httpx_client,
+        mock_request
+    ):
+        """
+        Test iter_ndjson() line decoding.
+
+        GIVEN: Streaming response with two NDJSON lines and a trailing blank
+        WHEN: iter_ndjson() is iterated
+        THEN: Each non-empty line is yielded as parsed JSON
+              AND request was sent with stream=True
+              AND response is closed afterwards
+        """
+        # Arrange
+        async def lines():
+            for line in ['{"id": 1}', '{"id": 2}', '']:
+                yield line
+
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.aiter_lines = lines
+        response.aclose = AsyncMock()
+
+        mock_async_client.return_value = mock_httpx_client
+        mock_httpx_client.build_request.return_value = mock_request
+        mock_httpx_client.send.return_value = response
+        client = DataAPIClient(middlewares=[])
+
+        # Act
+        items = [item async for item in client.iter_ndjson("/api/v1/users/active/stream")]
+
+        # Assert
+        assert items == [{"id": 1}, {"id": 2}]
+        mock_httpx_client.send.assert_called_once_with(mock_request, stream=True)
+        response.aclose.assert_called_once()
+
+
 class TestDataAPIClientResourceManagement:
     """
     Test suite for resource cleanup.
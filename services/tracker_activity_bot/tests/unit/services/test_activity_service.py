@@ -7,6 +7,8 @@ Verifies API client integration, datetime serialization, and data formatting.
 Test Coverage:
     - create_activity(): Activity creation with tags, time ranges
     - get_user_activities(): Activity retrieval with pagination
+    - get_last_activity(): Denormalized last activity pointer
+    - get_recent_descriptions(): Server-side deduplicated suggestions
     - Datetime handling: ISO format serialization
     - Edge cases: None category, empty tags, various time ranges
 
@@ -615,6 +617,75 @@ class TestActivityServiceGetUserActivities:
         assert result["total"] == 0
 
 
+class TestActivityServiceGetLastActivity:
+    """
+    Test suite for get_last_activity() method.
+
+    Poll period calculation reads the last activity end time without
+    listing activities.
+    """
+
+    @pytest.mark.unit
+    async def test_get_last_activity_requests_user_pointer(
+        self,
+        activity_service: ActivityService,
+        mock_client
+    ):
+        """
+        Test last activity lookup.
+
+        GIVEN: A user ID
+        WHEN: get_last_activity() is called
+        THEN: GET /api/v1/users/{id}/last-activity is made
+              AND the response is returned unchanged
+        """
+        # Arrange
+        response = {"user_id": 1, "last_activity_end_time": "2025-11-07T12:00:00+00:00"}
+        mock_client.get.return_value = response
+
+        # Act
+        result = await activity_service.get_last_activity(1)
+
+        # Assert
+        mock_client.get.assert_called_once_with("/api/v1/users/1/last-activity")
+        assert result == response
+
+
+class TestActivityServiceGetRecentDescriptions:
+    """
+    Test suite for get_recent_descriptions() method.
+
+    Suggestions are deduplicated by the API instead of in the bot.
+    """
+
+    @pytest.mark.unit
+    async def test_get_recent_descriptions_sends_only_given_filters(
+        self,
+        activity_service: ActivityService,
+        mock_client
+    ):
+        """
+        Test suggestion lookup parameters.
+
+        GIVEN: A category but no prefix
+        WHEN: get_recent_descriptions() is called
+        THEN: GET /api/v1/activities/recent-descriptions is made with
+              user_id, category_id and the default limit of 8 (one keyboard)
+        """
+        # Arrange
+        mock_client.get.return_value = [{"description": "Бег", "use_count": 3}]
+
+        # Act
+        result = await activity_service.get_recent_descriptions(1, category_id=2)
+
+        # Assert
+        mock_client.get.assert_called_once_with(
+            "/api/v1/activities/recent-descriptions",
+            params={"user_id": 1, "limit": 8, "category_id": 2}
+        )
+        assert result == [{"description": "Бег", "use_count": 3}]
+
+
 class TestActivityServiceInitialization:
     """
     Test suite for ActivityService initialization.
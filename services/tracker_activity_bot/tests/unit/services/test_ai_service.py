@@ -604,7 +604,9 @@ class TestAIServiceParseActivityText:
             mock_build.assert_called_once_with(
                 "test",
                 sample_categories,
-                sample_recent_activities
+                sample_recent_activities,
+                "UTC",
+                None
             )
 
 
@@ -851,6 +853,47 @@ class TestAIServiceBuildPrompt:
         assert "Работа: Coding task" in prompt
         assert "Спорт: Running" in prompt
 
+    @pytest.mark.unit
+    @patch('src.application.services.ai_service.settings')
+    @patch('src.application.services.ai_service.AsyncOpenAI')
+    def test_build_prompt_uses_recent_descriptions_and_last_activity_end(
+        self,
+        mock_async_openai,
+        mock_settings,
+        sample_categories
+    ):
+        """
+        Test prompt context built from recent-descriptions items.
+
+        GIVEN: Six distinct suggestions (one without category) and the
+               user's last activity end time
+        WHEN: _build_prompt() is called
+        THEN: The first five are listed as "category: description"
+              AND the last activity end is shown in the user's timezone
+        """
+        # Arrange
+        mock_settings.openrouter_api_key = "test_key"
+        service = AIService()
+        suggestions = [{"category_name": None, "description": "Сон", "use_count": 9}] + [
+            {"category_name": "Работа", "description": f"Задача {i}", "use_count": 1}
+            for i in range(5)
+        ]
+
+        # Act
+        prompt = service._build_prompt(
+            user_input="test",
+            categories=sample_categories,
+            recent_activities=suggestions,
+            user_timezone="Europe/Moscow",
+            last_activity_end="2025-11-14T07:30:00+00:00"
+        )
+
+        # Assert
+        assert "- Без категории: Сон" in prompt
+        assert "- Работа: Задача 3" in prompt
+        assert "Задача 4" not in prompt
+        assert "Закончилась в: 10:30" in prompt
+
     @pytest.mark.unit
     @patch('src.application.services.ai_service.settings')
     @patch('src.application.services.ai_service.AsyncOpenAI')
@@ -31,6 +31,15 @@ from src.application.services.scheduler_service import SchedulerService
 # TEST FIXTURES
 # ============================================================================
 
+def _stream(users):
+    """Build a get_active_users callable yielding users like the NDJSON client."""
+    async def iterate():
+        for user in users:
+            yield user
+
+    return MagicMock(side_effect=iterate)
+
+
 @pytest.fixture
 def mock_scheduler():
     """
@@ -652,7 +661,7 @@ class TestSchedulerServiceRestoreScheduledPolls:
             {**sample_user, "id": 2, "telegram_id": 987654321}
         ]
 
-        mock_get_active_users = AsyncMock(return_value=users)
+        mock_get_active_users = _stream(users)
         mock_get_user_settings = AsyncMock(return_value=sample_settings)
 
         mock_job = MagicMock()
@@ -701,7 +710,7 @@ class TestSchedulerServiceRestoreScheduledPolls:
                 return {"poll_interval_weekday": 60, "poll_interval_weekend": 120}
             return None
 
-        mock_get_active_users = AsyncMock(return_value=users)
+        mock_get_active_users = _stream(users)
         mock_get_user_settings = AsyncMock(side_effect=mock_get_settings)
 
         mock_job = MagicMock()
@@ -720,6 +729,49 @@ class TestSchedulerServiceRestoreScheduledPolls:
             # Assert: Only 1 user scheduled
             assert mock_schedule.call_count == 1
 
+    @pytest.mark.unit
+    async def test_restore_scheduled_polls_uses_embedded_settings(
+        self,
+        scheduler_service,
+        mock_scheduler,
+        sample_user,
+        sample_settings,
+        mock_send_poll_callback,
+        mock_bot
+    ):
+        """
+        Test restoration uses settings embedded in active users feed.
+
+        GIVEN: 2 active users with "settings" embedded (one of them None)
+        WHEN: restore_scheduled_polls() is called
+        THEN: No per-user settings request is made
+              AND only the user with settings gets poll scheduled
+        """
+        # Arrange
+        scheduler_service.scheduler = mock_scheduler
+
+        users = [
+            {**sample_user, "settings": sample_settings},
+            {**sample_user, "id": 2, "telegram_id": 987654321, "settings": None}
+        ]
+
+        mock_get_active_users = _stream(users)
+        mock_get_user_settings = AsyncMock()
+
+        # Act
+        with patch.object(scheduler_service, 'schedule_poll', new=AsyncMock()) as mock_schedule:
+            await scheduler_service.restore_scheduled_polls(
+                get_active_users=mock_get_active_users,
+                get_user_settings=mock_get_user_settings,
+                send_poll_callback=mock_send_poll_callback,
+                bot=mock_bot
+            )
+
+            # Assert: N+1 avoided, user without settings skipped
+            mock_get_user_settings.assert_not_called()
+            assert mock_schedule.call_count == 1
+            assert mock_schedule.call_args.kwargs["settings"] == sample_settings
+
     @pytest.mark.unit
     async def test_restore_scheduled_polls_when_no_active_users_does_nothing(
         self,
@@ -735,7 +787,7 @@ class TestSchedulerServiceRestoreScheduledPolls:
         THEN: No polls are scheduled
         """
         # Arrange
-        mock_get_active_users = AsyncMock(return_value=[])
+        mock_get_active_users = _stream([])
         mock_get_user_settings = AsyncMock()
 
         # Act
@@ -784,7 +836,7 @@ class TestSchedulerServiceRestoreScheduledPolls:
                 raise Exception("Settings fetch failed")
             return sample_settings
 
-        mock_get_active_users = AsyncMock(return_value=users)
+        mock_get_active_users = _stream(users)
         mock_get_user_settings = AsyncMock(side_effect=mock_get_settings)
 
         mock_job = MagicMock()
@@ -804,6 +856,50 @@ class TestSchedulerServiceRestoreScheduledPolls:
             assert mock_schedule.call_count == 2
 
 
+    @pytest.mark.unit
+    async def test_restore_scheduled_polls_schedules_each_user_as_it_arrives(
+        self,
+        scheduler_service,
+        sample_user,
+        sample_settings,
+        mock_send_poll_callback,
+        mock_bot
+    ):
+        """
+        Test restoration does not wait for the whole active users stream.
+
+        GIVEN: A stream of 2 users with embedded settings
+        WHEN: restore_scheduled_polls() is called
+        THEN: The first user's poll is scheduled before the second user
+              is read from the stream
+        """
+        # Arrange
+        events = []
+
+        async def iterate():
+            for telegram_id in (111, 222):
+                events.append(("read", telegram_id))
+                yield {**sample_user, "telegram_id": telegram_id, "settings": sample_settings}
+
+        async def record_schedule(**kwargs):
+            events.append(("scheduled", kwargs["user_id"]))
+
+        # Act
+        with patch.object(scheduler_service, 'schedule_poll', new=AsyncMock(side_effect=record_schedule)):
+            await scheduler_service.restore_scheduled_polls(
+                get_active_users=iterate,
+                get_user_settings=AsyncMock(),
+                send_poll_callback=mock_send_poll_callback,
+                bot=mock_bot
+            )
+
+        # Assert
+        assert events == [
+            ("read", 111), ("scheduled", 111),
+            ("read", 222), ("scheduled", 222)
+        ]
+
+
 class TestSchedulerServiceCalculateNextPollTime:
     """
     Test suite for _calculate_next_poll_time() method.
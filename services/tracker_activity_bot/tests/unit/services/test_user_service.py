@@ -7,6 +7,8 @@ Verifies API client integration, error handling, and data transformation.
 Test Coverage:
     - get_by_telegram_id(): User retrieval, 404 handling
     - create_user(): User creation with default timezone
+    - onboard(): Single-call /start onboarding
+    - get_all_active_users_with_settings(): NDJSON stream passthrough
     - update_last_poll_time(): Poll time updates with ISO format
     - Error handling: HTTP errors, network failures
 
@@ -239,6 +241,94 @@ class TestUserServiceGetByTelegramId:
         assert result["telegram_id"] == telegram_id
 
 
+class TestUserServiceActiveUsersStream:
+    """
+    Test suite for get_all_active_users_with_settings() method.
+    """
+
+    @pytest.mark.unit
+    async def test_get_all_active_users_with_settings_returns_stream_iterator(
+        self,
+        user_service: UserService,
+        mock_client,
+        sample_user_data
+    ):
+        """
+        Test active users are streamed, not collected.
+
+        GIVEN: The API streams active users as NDJSON
+        WHEN: get_all_active_users_with_settings() is called
+        THEN: The client's NDJSON iterator is returned as is
+              AND users are yielded one by one
+        """
+        # Arrange
+        async def iterate():
+            yield {**sample_user_data, "settings": None}
+
+        stream = iterate()
+        mock_client.iter_ndjson = MagicMock(return_value=stream)
+
+        # Act
+        result = user_service.get_all_active_users_with_settings()
+
+        # Assert
+        assert result is stream
+        mock_client.iter_ndjson.assert_called_once_with("/api/v1/users/active/stream")
+        assert [user async for user in result] == [{**sample_user_data, "settings": None}]
+
+
+class TestUserServiceOnboard:
+    """
+    Test suite for onboard() method.
+
+    /start onboarding in a single API call.
+    """
+
+    @pytest.mark.unit
+    async def test_onboard_posts_profile_once_and_returns_context(
+        self,
+        user_service: UserService,
+        mock_client,
+        sample_user_data
+    ):
+        """
+        Test onboarding is one request.
+
+        GIVEN: Telegram user data
+        WHEN: onboard() is called
+        THEN: One POST is made to /api/v1/users/onboard
+              AND the returned context is passed through
+        """
+        # Arrange
+        context = {
+            "user": sample_user_data,
+            "settings": {"id": 1, "user_id": 1},
+            "categories": [],
+            "last_activity_end_time": None,
+            "created": True
+        }
+        mock_client.post.return_value = context
+
+        # Act
+        result = await user_service.onboard(
+            telegram_id=123456789,
+            username="testuser",
+            first_name="Test"
+        )
+
+        # Assert
+        mock_client.post.assert_called_once_with(
+            "/api/v1/users/onboard",
+            json={
+                "telegram_id": 123456789,
+                "username": "testuser",
+                "first_name": "Test",
+                "timezone": "Europe/Moscow"
+            }
+        )
+        assert result == context
+
+
 class TestUserServiceCreateUser:
     """
     Test suite for create_user() method.
@@ -242,7 +242,7 @@ class TestFormatActivityList:
                 "end_time": "2025-11-05T12:00:00Z",
                 "duration_minutes": 60,
                 "description": "Встреча",
-                "tags": "важное,срочно"
+                "tags": ["важное", "срочно"]
             }
         ]
 
@@ -62,7 +62,7 @@ def sample_activities():
             "start_time": "2025-11-07T10:00:00+00:00",
             "end_time": "2025-11-07T12:00:00+00:00",
             "duration_minutes": 120,
-            "tags": "python,testing",
+            "tags": ["python", "testing"],
             "category_name": "work",
             "category_emoji": "💼"
         },
@@ -455,7 +455,7 @@ class TestFormatActivityList:
         """
         Test tags formatting.
 
-        GIVEN: Activity with tags "python,testing"
+        GIVEN: Activity with tags ["python", "testing"]
         WHEN: format_activity_list() is called
         THEN: Tags are formatted as "🏷 #python #testing"
         """